@@ -0,0 +1 @@
+"""Performance benchmarks for Route API Discovery (not part of the unit test suite)."""
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""End-to-end scan throughput against local fixture servers.
+
+Starts one FixtureServer per target, runs discover_many() over all of them
+for every max_workers x request_delay combination and reports targets/s,
+probes/s and HTTP requests/s. Nothing leaves the machine.
+
+    python benchmarks/end_to_end.py --targets 4 --workers 1,4,8 --delays 0,0.01 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.fixture_server import FixtureServer, SiteSpec, start_fixture_servers  # noqa: E402
+from route_api_discovery import Config, discover_many  # noqa: E402
+
+DEFAULT_WORKERS = (1, 4, 8)
+DEFAULT_DELAYS = (0.0,)
+
+
+def build_target_specs(
+    targets: int,
+    pages: int,
+    js_chunks: int,
+    latency_ms: float,
+    head_not_allowed_targets: int = 0,
+    rate_limit_every: int = 0,
+) -> List[SiteSpec]:
+    # 앞쪽 대상부터 HEAD 405 호스트로 만들어 GET 재시도 비용이 결과에 섞이도록 한다.
+    return [
+        SiteSpec(
+            pages=pages,
+            js_chunks=js_chunks,
+            latency_ms=latency_ms,
+            head_not_allowed=index < head_not_allowed_targets,
+            rate_limit_every=rate_limit_every,
+        )
+        for index in range(targets)
+    ]
+
+
+def _count_probes(batch: dict) -> int:
+    count = 0
+    for record in batch.get("results", []):
+        for row in [*record.get("all_pages", []), *record.get("all_apis", [])]:
+            if row.get("probe_method") or row.get("status_code") is not None:
+                count += 1
+    return count
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 3) if seconds > 0 else 0.0
+
+
+def run_scenario(servers: Sequence[FixtureServer], max_workers: int, request_delay: float, timeout: float = 10.0) -> dict:
+    for server in servers:
+        server.reset_stats()
+    config = Config(
+        url=servers[0].url,
+        max_js_files=200,
+        max_depth=2,
+        timeout=timeout,
+        output=Path("end-to-end-benchmark.json"),
+        skip_probe=False,
+        max_workers=max_workers,
+        request_delay=request_delay,
+    )
+    urls = [server.url for server in servers]
+    started = time.perf_counter()
+    batch = discover_many(config, urls)
+    seconds = time.perf_counter() - started
+
+    statuses: dict = {}
+    http_requests = 0
+    for server in servers:
+        stats = server.stats()
+        http_requests += stats["requests"]
+        for status, count in stats["statuses"].items():
+            statuses[status] = statuses.get(status, 0) + count
+    probes = _count_probes(batch)
+    return {
+        "max_workers": max_workers,
+        "request_delay": request_delay,
+        "targets": len(urls),
+        "failed_targets": int(batch.get("failed_count", 0) or 0),
+        "seconds": round(seconds, 6),
+        "targets_per_s": _rate(len(urls), seconds),
+        "probes": probes,
+        "probes_per_s": _rate(probes, seconds),
+        "http_requests": http_requests,
+        "http_requests_per_s": _rate(http_requests, seconds),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def run_benchmark(
+    specs: Sequence[SiteSpec],
+    workers: Sequence[int] = DEFAULT_WORKERS,
+    delays: Sequence[float] = DEFAULT_DELAYS,
+    timeout: float = 10.0,
+) -> dict:
+    servers = start_fixture_servers(tuple(specs))
+    try:
+        scenarios = [
+            run_scenario(servers, max_workers, request_delay, timeout=timeout)
+            for request_delay in delays
+            for max_workers in workers
+        ]
+    finally:
+        for server in servers:
+            server.close()
+    first = specs[0] if specs else SiteSpec()
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "site": {
+            "targets": len(specs),
+            "pages": first.pages,
+            "js_chunks": first.js_chunks,
+            "latency_ms": first.latency_ms,
+            "head_not_allowed_targets": sum(1 for spec in specs if spec.head_not_allowed),
+            "rate_limit_every": first.rate_limit_every,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def _parse_list(raw: str, cast) -> List:
+    return [cast(value) for value in raw.split(",") if value.strip()]
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="로컬 픽스처 서버 대상 종단 간 스캔 처리량 벤치마크")
+    parser.add_argument("--targets", type=int, default=4, help="띄울 픽스처 서버(대상) 수. 기본값: 4")
+    parser.add_argument("--pages", type=int, default=20, help="대상마다 생성할 페이지 수. 기본값: 20")
+    parser.add_argument("--js-chunks", type=int, default=5, help="대상마다 생성할 JS 청크 수. 기본값: 5")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="응답마다 추가할 지연(ms). 기본값: 10")
+    parser.add_argument("--head-405-targets", type=int, default=1, help="HEAD에 405를 돌려줄 대상 수. 기본값: 1")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429를 돌려줍니다. 0이면 끕니다.")
+    parser.add_argument("--workers", default=",".join(str(value) for value in DEFAULT_WORKERS), help="쉼표로 구분한 max_workers 목록. 기본값: 1,4,8")
+    parser.add_argument("--delays", default=",".join(str(value) for value in DEFAULT_DELAYS), help="쉼표로 구분한 request_delay(초) 목록. 기본값: 0")
+    parser.add_argument("--timeout", type=float, default=10.0, help="HTTP 타임아웃(초). 기본값: 10")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 파일 경로. 생략하면 표준 출력에 씁니다.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        workers = _parse_list(args.workers, int)
+        delays = _parse_list(args.delays, float)
+    except ValueError:
+        print(f"잘못된 목록입니다: --workers {args.workers} / --delays {args.delays}", file=sys.stderr)
+        return 2
+    if args.targets < 1 or not workers or not delays:
+        print("대상 수, max_workers, request_delay 목록은 비어 있을 수 없습니다.", file=sys.stderr)
+        return 2
+
+    specs = build_target_specs(
+        args.targets,
+        args.pages,
+        args.js_chunks,
+        args.latency_ms,
+        head_not_allowed_targets=args.head_405_targets,
+        rate_limit_every=args.rate_limit_every,
+    )
+    report = run_benchmark(specs, workers, delays, timeout=args.timeout)
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    for scenario in report["scenarios"]:
+        print(
+            f"workers={scenario['max_workers']} delay={scenario['request_delay']}s: "
+            f"{scenario['targets_per_s']} targets/s, {scenario['probes_per_s']} probes/s",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
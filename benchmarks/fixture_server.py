@@ -0,0 +1,204 @@
+"""Local synthetic site for offline end-to-end scan benchmarks.
+
+FixtureServer runs a stdlib ThreadingHTTPServer in a background thread and
+serves a generated site: an index page linking N pages, a main bundle that
+lazy-loads M JS chunks, robots.txt and sitemap.xml. Latency, 405 on HEAD and
+periodic 429 responses are tunable so probe behaviour can be reproduced.
+
+    with FixtureServer(SiteSpec(pages=20, js_chunks=5, latency_ms=10)) as server:
+        print(server.url)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SiteSpec:
+    pages: int = 10
+    js_chunks: int = 4
+    apis_per_page: int = 2
+    latency_ms: float = 0.0
+    head_not_allowed: bool = False
+    # 0이면 끈다. N이면 N번째 요청마다 429를 돌려준다.
+    rate_limit_every: int = 0
+    chunk_padding_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class Response:
+    status: int
+    content_type: str
+    body: bytes
+
+
+def page_path(index: int) -> str:
+    return f"/pages/p{index}"
+
+
+def chunk_path(index: int) -> str:
+    return f"/static/js/chunk-{index}.js"
+
+
+def api_path(page_index: int, api_index: int) -> str:
+    return f"/api/p{page_index}/items{api_index}"
+
+
+def _html(body: str) -> bytes:
+    return f"<!doctype html><html><head><title>fixture</title></head><body>{body}</body></html>".encode("utf-8")
+
+
+def build_site(spec: SiteSpec) -> Dict[str, Response]:
+    routes: Dict[str, Response] = {}
+    links = "".join(f'<a href="{page_path(index)}">page {index}</a>' for index in range(spec.pages))
+    routes["/"] = Response(200, "text/html; charset=utf-8", _html(f'{links}<script src="/static/js/main.js"></script>'))
+
+    imports = ";".join(f'const c{index}=()=>import("{chunk_path(index)}")' for index in range(spec.js_chunks))
+    routes["/static/js/main.js"] = Response(
+        200,
+        "application/javascript",
+        f'{imports};fetch("/api/session");const home="{page_path(0)}";'.encode("utf-8"),
+    )
+    padding = "/*" + "x" * max(0, spec.chunk_padding_bytes - 4) + "*/" if spec.chunk_padding_bytes > 0 else ""
+    for chunk_index in range(spec.js_chunks):
+        calls = ";".join(
+            f'fetch("{api_path(page_index, api_index)}")'
+            for page_index in range(chunk_index, spec.pages, max(1, spec.js_chunks))
+            for api_index in range(spec.apis_per_page)
+        )
+        routes[chunk_path(chunk_index)] = Response(200, "application/javascript", f"{calls};{padding}".encode("utf-8"))
+
+    for page_index in range(spec.pages):
+        routes[page_path(page_index)] = Response(200, "text/html; charset=utf-8", _html(f"<h1>page {page_index}</h1>"))
+        for api_index in range(spec.apis_per_page):
+            payload = json.dumps({"page": page_index, "item": api_index}).encode("utf-8")
+            routes[api_path(page_index, api_index)] = Response(200, "application/json", payload)
+    routes["/api/session"] = Response(401, "application/json", b'{"error":"unauthorized"}')
+
+    routes["/robots.txt"] = Response(
+        200,
+        "text/plain; charset=utf-8",
+        b"User-agent: *\nDisallow: /admin/\nSitemap: /sitemap.xml\n",
+    )
+    locs = "".join(f"<url><loc>{page_path(index)}</loc></url>" for index in range(spec.pages))
+    routes["/sitemap.xml"] = Response(
+        200,
+        "application/xml",
+        f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locs}</urlset>'.encode("utf-8"),
+    )
+    return routes
+
+
+class FixtureServer:
+    def __init__(self, spec: Optional[SiteSpec] = None, host: str = "127.0.0.1") -> None:
+        self.spec = spec or SiteSpec()
+        self.routes = build_site(self.spec)
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._methods: Counter = Counter()
+        self._statuses: Counter = Counter()
+        self._server = ThreadingHTTPServer((host, 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FixtureServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._request_count = 0
+            self._methods.clear()
+            self._statuses.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self._request_count,
+                "methods": dict(self._methods),
+                "statuses": {str(status): count for status, count in sorted(self._statuses.items())},
+            }
+
+    def respond(self, method: str, path: str) -> Response:
+        with self._lock:
+            self._request_count += 1
+            sequence = self._request_count
+        if self.spec.latency_ms > 0:
+            time.sleep(self.spec.latency_ms / 1000)
+        if self.spec.rate_limit_every > 0 and sequence % self.spec.rate_limit_every == 0:
+            response = Response(429, "text/plain; charset=utf-8", b"rate limited")
+        elif method == "HEAD" and self.spec.head_not_allowed:
+            response = Response(405, "text/plain; charset=utf-8", b"method not allowed")
+        else:
+            response = self.routes.get(path.split("?", 1)[0]) or Response(404, "text/plain; charset=utf-8", b"not found")
+        with self._lock:
+            self._methods[method] += 1
+            self._statuses[response.status] += 1
+        return response
+
+    def _handler_class(self) -> type:
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, include_body: bool) -> None:
+                response = fixture.respond(self.command, self.path)
+                self.send_response(response.status)
+                self.send_header("Content-Type", response.content_type)
+                self.send_header("Content-Length", str(len(response.body)))
+                if response.status == 429:
+                    self.send_header("Retry-After", "1")
+                self.end_headers()
+                if include_body:
+                    self.wfile.write(response.body)
+
+            def do_GET(self) -> None:
+                self._send(include_body=True)
+
+            def do_HEAD(self) -> None:
+                self._send(include_body=False)
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        return Handler
+
+
+def start_fixture_servers(specs: Tuple[SiteSpec, ...]) -> Tuple[FixtureServer, ...]:
+    servers = []
+    try:
+        for spec in specs:
+            servers.append(FixtureServer(spec).start())
+    except Exception:
+        for server in servers:
+            server.close()
+        raise
+    return tuple(servers)
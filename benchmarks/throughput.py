@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Detector throughput benchmark on synthetic minified bundles.
+
+Scales the tests/fixtures/benchmark_site patterns into 1/10/50 MB single-line
+bundles, measures MB/s for the static analysis entry points and optionally
+compares the numbers against a stored baseline JSON.
+
+    python benchmarks/throughput.py --output throughput.json --baseline benchmarks/throughput_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from route_api_discovery import (  # noqa: E402
+    build_url_scope,
+    collect_hardcoded_findings,
+    collect_path_candidates,
+    extract_additional_js_urls,
+    extract_html_assets,
+)
+
+FIXTURE_DIR = ROOT / "tests" / "fixtures" / "benchmark_site"
+BASE_URL = "https://bench.local/"
+BUNDLE_URL = "https://bench.local/static/bundle.min.js"
+DEFAULT_SIZES_MB = (1, 10, 50)
+DEFAULT_TOLERANCE = 0.25
+BYTES_PER_MB = 1_000_000
+
+_COMMENT_LINE_RE = re.compile(r"(?m)^\s*//.*$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _fixture_source() -> str:
+    app_js = (FIXTURE_DIR / "app.js").read_text(encoding="utf-8")
+    html = (FIXTURE_DIR / "index.html").read_text(encoding="utf-8")
+    scope = build_url_scope(BASE_URL, include_subdomains=True, excluded_hostnames=())
+    _, inline_scripts = extract_html_assets(html, BASE_URL, scope)
+    return "\n".join([app_js, *inline_scripts])
+
+
+def _minify(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", _COMMENT_LINE_RE.sub("", text)).strip()
+
+
+def build_synthetic_bundle(size_bytes: int, source: Optional[str] = None) -> str:
+    # 복사본마다 경로를 바꿔서 후보 중복 제거로 작업이 줄어드는 일을 막는다.
+    template = _minify(source if source is not None else _fixture_source())
+    parts: List[str] = []
+    total = 0
+    copy_index = 0
+    while total < size_bytes:
+        chunk = template.replace("/api/", f"/api/b{copy_index}/") + ";"
+        parts.append(chunk)
+        total += len(chunk.encode("utf-8"))
+        copy_index += 1
+    return "".join(parts)
+
+
+def _benchmark_targets(bundle: str) -> Dict[str, Callable[[], object]]:
+    scope = build_url_scope(BASE_URL, include_subdomains=True, excluded_hostnames=())
+    return {
+        "collect_path_candidates": lambda: collect_path_candidates(
+            text=bundle,
+            base_url=BUNDLE_URL,
+            source_label=f"js:{BUNDLE_URL}",
+            scope=scope,
+            page_bucket={},
+            api_bucket={},
+        ),
+        "collect_hardcoded_findings": lambda: collect_hardcoded_findings(
+            text=bundle,
+            source_url=BUNDLE_URL,
+            source_label=f"js:{BUNDLE_URL}",
+            source_type="js",
+            findings=[],
+            dedupe_keys=set(),
+        ),
+        "extract_additional_js_urls": lambda: extract_additional_js_urls(bundle, BUNDLE_URL, scope),
+    }
+
+
+def run_benchmark(sizes_mb: Sequence[float] = DEFAULT_SIZES_MB, repeat: int = 1) -> dict:
+    source = _fixture_source()
+    results: Dict[str, Dict[str, dict]] = {}
+    for size_mb in sizes_mb:
+        bundle = build_synthetic_bundle(int(size_mb * BYTES_PER_MB), source)
+        bundle_bytes = len(bundle.encode("utf-8"))
+        size_results: Dict[str, dict] = {}
+        for name, target in _benchmark_targets(bundle).items():
+            best = float("inf")
+            for _ in range(max(1, repeat)):
+                started = time.perf_counter()
+                target()
+                best = min(best, time.perf_counter() - started)
+            size_results[name] = {
+                "bytes": bundle_bytes,
+                "seconds": round(best, 6),
+                "mb_per_s": round(bundle_bytes / BYTES_PER_MB / best, 3) if best > 0 else 0.0,
+            }
+        results[_size_key(size_mb)] = size_results
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": max(1, repeat),
+        "results": results,
+    }
+
+
+def _size_key(size_mb: float) -> str:
+    return f"{size_mb:g}MB"
+
+
+def compare_with_baseline(report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[dict]:
+    regressions: List[dict] = []
+    baseline_results = baseline.get("results") or {}
+    for size_key, size_results in (report.get("results") or {}).items():
+        for name, entry in size_results.items():
+            reference = (baseline_results.get(size_key) or {}).get(name)
+            if not reference:
+                continue
+            expected = float(reference.get("mb_per_s", 0) or 0)
+            actual = float(entry.get("mb_per_s", 0) or 0)
+            if expected > 0 and actual < expected * (1 - tolerance):
+                regressions.append(
+                    {
+                        "size": size_key,
+                        "target": name,
+                        "baseline_mb_per_s": expected,
+                        "mb_per_s": actual,
+                        "ratio": round(actual / expected, 3),
+                    }
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="탐지기 처리량(MB/s) 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES_MB),
+        help="쉼표로 구분한 합성 번들 크기(MB). 기본값: 1,10,50",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="크기별 반복 횟수. 가장 빠른 결과를 기록합니다.")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 파일 경로. 생략하면 표준 출력에 씁니다.")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 기준 JSON 파일 경로")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="기준 대비 허용 감소 비율. 기본값 0.25는 25%%보다 느려지면 실패로 봅니다.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        sizes = [float(value) for value in args.sizes.split(",") if value.strip()]
+    except ValueError:
+        print(f"잘못된 크기 목록입니다: {args.sizes}", file=sys.stderr)
+        return 2
+    report = run_benchmark(sizes, repeat=args.repeat)
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        report["baseline"] = str(args.baseline)
+        report["regressions"] = compare_with_baseline(report, baseline, args.tolerance)
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+    for item in report.get("regressions", []):
+        print(
+            f"처리량 저하: {item['target']} @ {item['size']} "
+            f"{item['mb_per_s']} MB/s (기준 {item['baseline_mb_per_s']} MB/s)",
+            file=sys.stderr,
+        )
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,9 +4,12 @@
 from __future__ import annotations
 
 import argparse
+from bisect import bisect_left
 import concurrent.futures
 import hashlib
 from html import escape as html_escape
+import http.client
+import io
 import ipaddress
 import json
 import math
@@ -16,16 +19,18 @@ import sys
 import threading
 import time
 import traceback
-import zipfile
 from collections import deque
+from collections.abc import MutableSet
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import AbstractSet, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 import ssl
 from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlparse
-from urllib.request import HTTPRedirectHandler, HTTPSHandler, ProxyHandler, Request, build_opener
+from urllib.request import HTTPHandler, HTTPRedirectHandler, HTTPSHandler, ProxyHandler, Request, build_opener
 from xml.sax.saxutils import escape as xml_escape
 
 
@@ -34,8 +39,18 @@ DEFAULT_REQUEST_HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept": "*/*",
 }
-SUPPORTED_OUTPUT_SUFFIXES = {"", ".json", ".xlsx", ".html"}
+SUPPORTED_OUTPUT_SUFFIXES = {"", ".json", ".xlsx", ".html", ".ndjson"}
+# v2 결과는 민감정보 목록을 hardcoded_findings 한 곳에만 저장한다.
+RESULT_SCHEMA_VERSION = 2
+LEGACY_RESULT_ALIASES = (("sensitive_findings", "hardcoded_findings"), ("sensitive_summary", "hardcoded_summary"))
 MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+DEFAULT_PROBE_CACHE_TTL = 300.0
+PROBE_CACHE_MAX_ENTRIES = 50_000
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_HOST_FAILURE_THRESHOLD = 3
+HOST_BREAKER_COOLDOWN_SECONDS = 60.0
+DEFAULT_DNS_CACHE_TTL = 300.0
+DNS_NEGATIVE_CACHE_TTL = 30.0
 HEADER_NAME_RE = re.compile(r"^[!#$%&'*+.^_`|~0-9A-Za-z-]+$")
 HOSTNAME_LABEL_RE = re.compile(r"^[A-Za-z0-9-]+$")
 ASSET_EXTENSIONS = {
@@ -417,8 +432,12 @@ HARD_CODED_PHONE_FIELD_SUFFIXES = (
 )
 HARD_CODED_PHONE_CONTEXT_HINTS = ("휴대폰", "핸드폰", "휴대전화", "전화번호", "전화", "연락처", "연락", "문자")
 
-ProgressCallback = Optional[Callable[[str], None]]
+# 기존 콜백은 메시지 문자열을, accepts_progress_events를 둔 콜백은 ProgressEvent를 받는다.
+ProgressCallback = Optional[Callable[[Union["ProgressEvent", str]], None]]
 CANCEL_MESSAGE = "사용자 요청으로 스캔을 중지했습니다."
+PROGRESS_FLUSH_INTERVAL_MS = 100
+# GUI 로그 위젯이 한 번 갱신할 때 그리는 최대 메시지 수. 저장용 로그에는 모두 남긴다.
+PROGRESS_MAX_RENDERED_MESSAGES = 2000
 
 
 class ScanCancelled(RuntimeError):
@@ -438,6 +457,7 @@ class Config:
     include_subdomains: bool = True
     excluded_subdomains: Tuple[str, ...] = ()
     max_workers: int = 1
+    max_host_workers: int = 0
     request_delay: float = 0.0
     headers: Dict[str, str] = field(default_factory=dict)
     verify_ssl: bool = True
@@ -452,8 +472,18 @@ class Config:
     dynamic_action_limit: int = 12
     dynamic_scroll_steps: int = 3
     dynamic_recursive_limit: int = 50
+    dynamic_profile_dir: Optional[Path] = None
+    dynamic_storage_state: Optional[Path] = None
+    dynamic_events_file: Optional[Path] = None
     scan_well_known: bool = True
     min_confidence: str = "low"
+    profile: bool = False
+    detector_stats: bool = False
+    legacy_result_schema: bool = False
+    probe_cache_ttl: float = DEFAULT_PROBE_CACHE_TTL
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    host_failure_threshold: int = DEFAULT_HOST_FAILURE_THRESHOLD
+    dns_cache_ttl: float = DEFAULT_DNS_CACHE_TTL
 
 
 @dataclass
@@ -483,11 +513,581 @@ class RequestThrottle:
                 raise ScanCancelled(CANCEL_MESSAGE)
 
 
+PROFILE_LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _latency_bucket_labels() -> List[str]:
+    return [f"<={bucket}ms" for bucket in PROFILE_LATENCY_BUCKETS_MS] + [f">{PROFILE_LATENCY_BUCKETS_MS[-1]}ms"]
+
+
+def profile_clock() -> Tuple[float, float]:
+    return time.perf_counter(), time.process_time()
+
+
+@dataclass(slots=True)
+class DetectorStats:
+    calls: int = 0
+    bytes_scanned: int = 0
+    matches: int = 0
+    accepted: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "bytes_scanned": self.bytes_scanned,
+            "matches": self.matches,
+            "accepted": self.accepted,
+            "time_ms": round(self.seconds * 1000, 3),
+        }
+
+
+class DetectorStatsRegistry:
+    """Thread-safe per-detector counters keyed by detector name."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, DetectorStats] = {}
+
+    def record(self, name: str, seconds: float, bytes_scanned: int, matches: int, accepted: int) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = DetectorStats()
+            stats.calls += 1
+            stats.bytes_scanned += bytes_scanned
+            stats.matches += matches
+            stats.accepted += accepted
+            stats.seconds += seconds
+
+    def merge(self, snapshot: Dict[str, dict]) -> None:
+        with self._lock:
+            for name, entry in snapshot.items():
+                stats = self._stats.get(name)
+                if stats is None:
+                    stats = self._stats[name] = DetectorStats()
+                stats.calls += int(entry.get("calls", 0) or 0)
+                stats.bytes_scanned += int(entry.get("bytes_scanned", 0) or 0)
+                stats.matches += int(entry.get("matches", 0) or 0)
+                stats.accepted += int(entry.get("accepted", 0) or 0)
+                stats.seconds += float(entry.get("time_ms", 0.0) or 0.0) / 1000
+
+    def snapshot(self) -> Dict[str, dict]:
+        # 오래 걸린 탐지기부터 보여 준다.
+        with self._lock:
+            ordered = sorted(self._stats.items(), key=lambda item: (-item[1].seconds, item[0]))
+            return {name: stats.to_dict() for name, stats in ordered}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def merge_detector_stats(snapshots: Iterable[Dict[str, dict]]) -> Dict[str, dict]:
+    registry = DetectorStatsRegistry()
+    for snapshot in snapshots:
+        registry.merge(snapshot)
+    return registry.snapshot()
+
+
+class ScanProfiler:
+    """Per-target timing collected only when `--profile` is enabled."""
+
+    def __init__(self, detector_stats: Optional[DetectorStatsRegistry] = None) -> None:
+        self._lock = threading.Lock()
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.detector_stats = detector_stats if detector_stats is not None else DetectorStatsRegistry()
+        self.hosts: Dict[str, dict] = {}
+        self.request_count = 0
+        self.bytes_downloaded = 0
+        self.throttle_wait_seconds = 0.0
+
+    def record_phase(self, name: str, started: Tuple[float, float]) -> None:
+        wall_started, cpu_started = started
+        wall_ms = (time.perf_counter() - wall_started) * 1000
+        # CPU 시간은 프로세스 전체 기준이라 프로브 작업 스레드의 시간도 포함된다.
+        cpu_ms = (time.process_time() - cpu_started) * 1000
+        with self._lock:
+            entry = self.phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0, "calls": 0})
+            entry["wall_ms"] += wall_ms
+            entry["cpu_ms"] += cpu_ms
+            entry["calls"] += 1
+
+    def record_throttle_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.throttle_wait_seconds += max(0.0, seconds)
+
+    def record_request(self, url: str, seconds: float, length: int) -> None:
+        latency_ms = seconds * 1000
+        label = _latency_bucket_labels()[-1]
+        for bucket in PROFILE_LATENCY_BUCKETS_MS:
+            if latency_ms <= bucket:
+                label = f"<={bucket}ms"
+                break
+        host = urlparse(url).hostname or ""
+        with self._lock:
+            self.request_count += 1
+            self.bytes_downloaded += max(0, int(length or 0))
+            entry = self.hosts.get(host)
+            if entry is None:
+                entry = self.hosts[host] = {
+                    "requests": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "histogram": {bucket_label: 0 for bucket_label in _latency_bucket_labels()},
+                }
+            entry["requests"] += 1
+            entry["total_ms"] += latency_ms
+            entry["max_ms"] = max(entry["max_ms"], latency_ms)
+            entry["histogram"][label] += 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "phases": {name: _round_profile_values(entry) for name, entry in self.phases.items()},
+                # 탐지기 표는 결과의 detector_stats에 한 번만 싣고 여기서는 위치만 가리킨다.
+                "detectors_ref": PERFORMANCE_DETECTORS_REF,
+                "request_count": self.request_count,
+                "bytes_downloaded": self.bytes_downloaded,
+                "throttle_wait_ms": round(self.throttle_wait_seconds * 1000, 3),
+                "hosts": {
+                    host: {**_round_profile_values(entry), "histogram": dict(entry["histogram"])}
+                    for host, entry in self.hosts.items()
+                },
+            }
+
+
+def _round_profile_values(entry: dict) -> dict:
+    return {
+        key: round(value, 3) if isinstance(value, float) else value
+        for key, value in entry.items()
+        if not isinstance(value, dict)
+    }
+
+
+def _record_profile_phase(profiler: Optional[ScanProfiler], name: str, started: Tuple[float, float]) -> None:
+    if profiler is not None:
+        profiler.record_phase(name, started)
+
+
+PERFORMANCE_DETECTORS_REF = "#/detector_stats"
+
+
+def merge_performance_blocks(blocks: Iterable[dict]) -> dict:
+    merged: dict = {
+        "phases": {},
+        "detectors_ref": PERFORMANCE_DETECTORS_REF,
+        "request_count": 0,
+        "bytes_downloaded": 0,
+        "throttle_wait_ms": 0.0,
+        "hosts": {},
+    }
+    for block in blocks:
+        for name, entry in (block.get("phases") or {}).items():
+            target = merged["phases"].setdefault(name, {})
+            for key, value in entry.items():
+                target[key] = target.get(key, 0) + value
+        merged["request_count"] += int(block.get("request_count", 0) or 0)
+        merged["bytes_downloaded"] += int(block.get("bytes_downloaded", 0) or 0)
+        merged["throttle_wait_ms"] += float(block.get("throttle_wait_ms", 0.0) or 0.0)
+        for host, entry in (block.get("hosts") or {}).items():
+            target = merged["hosts"].setdefault(
+                host,
+                {"requests": 0, "total_ms": 0.0, "max_ms": 0.0, "histogram": {label: 0 for label in _latency_bucket_labels()}},
+            )
+            target["requests"] += int(entry.get("requests", 0) or 0)
+            target["total_ms"] += float(entry.get("total_ms", 0.0) or 0.0)
+            target["max_ms"] = max(target["max_ms"], float(entry.get("max_ms", 0.0) or 0.0))
+            for label, count in (entry.get("histogram") or {}).items():
+                target["histogram"][label] = target["histogram"].get(label, 0) + int(count or 0)
+    merged["phases"] = {name: _round_profile_values(entry) for name, entry in merged["phases"].items()}
+    merged["throttle_wait_ms"] = round(merged["throttle_wait_ms"], 3)
+    merged["hosts"] = {
+        host: {**_round_profile_values(entry), "histogram": entry["histogram"]}
+        for host, entry in merged["hosts"].items()
+    }
+    return merged
+
+
+@dataclass
+class _ProbeCacheEntry:
+    future: concurrent.futures.Future
+    expires_at: Optional[float] = None
+
+
+class ProbeCache:
+    """Scan-wide probe results keyed by candidate identity and request profile.
+
+    Concurrent lookups for the same key wait on the first probe instead of
+    sending their own request. Entries expire ttl_seconds after the probe ends.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_PROBE_CACHE_TTL, max_entries: int = PROBE_CACHE_MAX_ENTRIES) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._entries: Dict[Tuple[str, ...], _ProbeCacheEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(url: str, headers: Optional[Dict[str, str]], verify_ssl: bool, proxy_url: str) -> Tuple[str, ...]:
+        # 같은 URL이라도 전달되는 헤더(인증 등), SSL 검증, 프록시가 다르면 응답이 달라질 수 있어 따로 보관한다.
+        header_profile = "\n".join(sorted(f"{key.lower()}:{value}" for key, value in (headers or {}).items()))
+        return (candidate_identity(url), header_profile, "1" if verify_ssl else "0", proxy_url)
+
+    def get_or_probe(self, key: Tuple[str, ...], probe: Callable[[], "ProbeResult"]) -> "ProbeResult":
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.expires_at is None or entry.expires_at > now):
+                self.hits += 1
+                owner = False
+            else:
+                entry = _ProbeCacheEntry(concurrent.futures.Future())
+                self._entries.pop(key, None)
+                self._entries[key] = entry
+                self.misses += 1
+                owner = True
+                if len(self._entries) > self.max_entries:
+                    self._evict(now)
+        if not owner:
+            return entry.future.result()
+        try:
+            result = probe()
+        except BaseException as exc:
+            # 취소나 예외는 캐시하지 않고, 기다리던 다른 작업에도 같은 예외를 전달한다.
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            entry.future.set_exception(exc)
+            raise
+        if not result.cacheable:
+            # 이미 기다리던 작업에는 결과를 넘기되, 다음 조회는 다시 프로브한다.
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        entry.future.set_result(result)
+        return result
+
+    def _evict(self, now: float) -> None:
+        expired = [key for key, entry in self._entries.items() if entry.expires_at is not None and entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        overflow = len(self._entries) - self.max_entries
+        for key in list(self._entries)[:max(0, overflow)]:
+            if self._entries[key].expires_at is not None:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class HostCircuitBreaker:
+    """Stops probing an origin after repeated connection failures.
+
+    After threshold consecutive connect failures the origin is marked down and
+    its remaining probes are skipped. Once cooldown_seconds pass a single probe
+    is let through again; a success closes the breaker.
+    """
+
+    def __init__(self, threshold: int, cooldown_seconds: float = HOST_BREAKER_COOLDOWN_SECONDS) -> None:
+        self.threshold = max(1, threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self.short_circuited = 0
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - opened_at >= self.cooldown_seconds:
+                self._opened_at[key] = now
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self.threshold:
+                self._opened_at[key] = time.monotonic()
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+
+    def down_hosts(self) -> List[str]:
+        with self._lock:
+            return sorted(self._opened_at)
+
+
+@dataclass
+class _DnsCacheEntry:
+    infos: Optional[List[tuple]]
+    error: Optional[OSError]
+    expires_at: float
+
+
+class DnsCache:
+    """Scan-scoped getaddrinfo cache with a TTL and per-host resolution stats.
+
+    Failed lookups are kept for a shorter negative TTL so a dead subdomain is
+    resolved once rather than once per candidate. Concurrent lookups of the
+    same host share one getaddrinfo call.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_DNS_CACHE_TTL, negative_ttl_seconds: float = DNS_NEGATIVE_CACHE_TTL) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = min(negative_ttl_seconds, ttl_seconds)
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, int], _DnsCacheEntry] = {}
+        self._in_flight: Dict[Tuple[str, int], concurrent.futures.Future] = {}
+        self._host_stats: Dict[str, Dict[str, object]] = {}
+        self.prefetched = 0
+
+    def _stats_for(self, host: str) -> Dict[str, object]:
+        stats = self._host_stats.get(host)
+        if stats is None:
+            stats = self._host_stats[host] = {"lookups": 0, "cache_hits": 0, "failures": 0, "resolve_ms": 0.0, "addresses": []}
+        return stats
+
+    def resolve(self, host: str, port: int) -> List[tuple]:
+        key = (normalize_hostname(host), port)
+        with self._lock:
+            stats = self._stats_for(key[0])
+            stats["lookups"] += 1
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                stats["cache_hits"] += 1
+                if entry.error is not None:
+                    raise type(entry.error)(*entry.error.args)
+                return entry.infos or []
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = concurrent.futures.Future()
+            else:
+                stats["cache_hits"] += 1
+        if not owner:
+            return future.result()
+
+        started = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except (OSError, ValueError) as exc:
+            # foo..example.com처럼 잘못된 레이블은 UnicodeError로 올라오므로 연결 실패로 바꿔 같은 방식으로 캐시한다.
+            error = exc if isinstance(exc, OSError) else HostConnectError(str(exc) or exc.__class__.__name__)
+            self._store(key, None, error, started)
+            future.set_exception(error)
+            if error is exc:
+                raise
+            raise error from exc
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            self._store(key, infos, None, started)
+            future.set_result(infos)
+            return infos
+        finally:
+            # 어떤 경우에도 대기 중인 스레드가 영원히 막히지 않도록 진행 중 표시를 지운다.
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _store(self, key: Tuple[str, int], infos: Optional[List[tuple]], error: Optional[OSError], started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        ttl = self.ttl_seconds if error is None else self.negative_ttl_seconds
+        with self._lock:
+            self._entries[key] = _DnsCacheEntry(infos, error, time.monotonic() + ttl)
+            self._in_flight.pop(key, None)
+            stats = self._stats_for(key[0])
+            stats["resolve_ms"] += elapsed_ms
+            if error is not None:
+                stats["failures"] += 1
+            else:
+                stats["addresses"] = sorted({str(info[4][0]) for info in infos or []})
+
+    def record_prefetch(self, host_count: int) -> None:
+        with self._lock:
+            self.prefetched += host_count
+
+    def stats(self) -> dict:
+        with self._lock:
+            hosts = {
+                host: {**values, "resolve_ms": round(float(values["resolve_ms"]), 3), "addresses": list(values["addresses"])}
+                for host, values in sorted(self._host_stats.items())
+            }
+            return {
+                "ttl_seconds": self.ttl_seconds,
+                "prefetched_hosts": self.prefetched,
+                "lookups": sum(int(item["lookups"]) for item in hosts.values()),
+                "cache_hits": sum(int(item["cache_hits"]) for item in hosts.values()),
+                "failures": sum(int(item["failures"]) for item in hosts.values()),
+                "hosts": hosts,
+            }
+
+
+class ProbePool:
+    """Probe executor started on first use and shared by every target of one scan."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def executor(self, max_workers: int) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(1, max_workers),
+                    thread_name_prefix="route-probe",
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
 @dataclass
 class ExecutionContext:
     max_workers: int
     request_throttle: RequestThrottle
+    max_host_workers: int = 0
+    # 0이면 요청 타임아웃을 연결 단계에도 그대로 쓴다.
+    connect_timeout: float = 0.0
     cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    record_sink: Optional[Callable[[dict], None]] = field(default=None, repr=False)
+    profiler: Optional[ScanProfiler] = field(default=None, repr=False)
+    probe_cache: Optional[ProbeCache] = field(default=None, repr=False)
+    host_breaker: Optional[HostCircuitBreaker] = field(default=None, repr=False)
+    dns_cache: Optional[DnsCache] = field(default=None, repr=False)
+    # replace()로 만든 대상별 사본도 같은 풀을 쓰도록 참조로 넘긴다.
+    probe_pool: ProbePool = field(default_factory=ProbePool, repr=False)
+    # 한 번의 스캔(배치 포함)에서 통계를 켠 대상들의 탐지기 통계를 누적한다.
+    detector_stats: DetectorStatsRegistry = field(default_factory=DetectorStatsRegistry, repr=False)
+    # 스캔 동안 이어 쓰는 보조 파일. 스캔마다 처음 쓸 때만 비운다.
+    claimed_files: Set[Path] = field(default_factory=set, repr=False)
+    files_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def claim_output_file(self, path: Path) -> bool:
+        resolved = path.resolve()
+        with self.files_lock:
+            if resolved in self.claimed_files:
+                return False
+            self.claimed_files.add(resolved)
+            return True
+
+    def close(self) -> None:
+        self.probe_pool.shutdown()
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressEvent:
+    """Structured progress update.
+
+    phase is one of "batch", "target", "html", "dynamic", "js", "well_known",
+    "dns", "page_probe" or "api_probe". requests counts HTTP requests finished by the
+    step; events with an empty message only carry metrics.
+    """
+
+    message: str = ""
+    phase: str = ""
+    completed: Optional[int] = None
+    total: Optional[int] = None
+    url: str = ""
+    byte_count: int = 0
+    requests: int = 0
+    errors: int = 0
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@dataclass
+class ProgressBatch:
+    messages: List[str]
+    message_count: int
+    counters: Dict[str, int]
+    phases: Dict[str, ProgressEvent] = field(default_factory=dict)
+
+
+class ProgressChannel:
+    """Buffers progress from scan threads so a UI can drain it on its own timer.
+
+    Instances are ProgressCallback-compatible and receive ProgressEvent objects.
+    Every message is kept until drained; the UI decides how many to render.
+    """
+
+    accepts_progress_events = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._messages: List[str] = []
+        self._message_count = 0
+        self._counters: Dict[str, int] = {}
+        self._phases: Dict[str, ProgressEvent] = {}
+
+    def __call__(self, event: ProgressEvent | str) -> None:
+        if not isinstance(event, ProgressEvent):
+            event = ProgressEvent(message=str(event))
+        with self._lock:
+            if event.message:
+                self._messages.append(event.message)
+                self._message_count += 1
+            if event.requests:
+                self._counters["requests"] = self._counters.get("requests", 0) + event.requests
+            if event.byte_count:
+                self._counters["bytes"] = self._counters.get("bytes", 0) + event.byte_count
+            if event.errors:
+                self._counters["errors"] = self._counters.get("errors", 0) + event.errors
+            if event.phase:
+                # 가장 최근에 갱신된 단계가 마지막에 오도록 순서를 유지한다.
+                self._phases.pop(event.phase, None)
+                self._phases[event.phase] = event
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def drain(self) -> ProgressBatch:
+        with self._lock:
+            batch = ProgressBatch(
+                messages=self._messages,
+                message_count=self._message_count,
+                counters=self._counters,
+                phases=self._phases,
+            )
+            self._messages = []
+            self._message_count = 0
+            self._counters = {}
+            self._phases = {}
+        return batch
+
+
+class _PrefixedProgress:
+    accepts_progress_events = True
+
+    def __init__(self, progress: Callable[..., None], prefix: str) -> None:
+        self.progress = progress
+        self.prefix = prefix
+
+    def __call__(self, event: ProgressEvent | str) -> None:
+        if not isinstance(event, ProgressEvent):
+            event = ProgressEvent(message=str(event))
+        if event.message:
+            event = replace(event, message=f"{self.prefix}{event.message}")
+        deliver_progress_event(self.progress, event)
 
 
 @dataclass
@@ -500,16 +1100,249 @@ class FetchResult:
     error: Optional[str] = None
     content_type: Optional[str] = None
     final_url: Optional[str] = None
+    # 이름 해석이나 TCP 연결 단계에서 실패해 서버 응답을 전혀 받지 못한 경우
+    connect_failed: bool = False
+
+
+class _LabelStore:
+    __slots__ = ("ids", "labels")
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.labels: List[str] = []
+
+
+class LabelTable:
+    """Interns repeated labels as small integer ids shared by every candidate.
+
+    Ids are only meaningful within the store they were issued from. When the
+    last scan_scope() exits the table starts a fresh store; candidates keep a
+    reference to the store their ids came from, so they stay readable after
+    the scan while new scans no longer grow the old store.
+    """
+
+    __slots__ = ("_store", "_lock", "_scopes")
+
+    def __init__(self) -> None:
+        self._store = _LabelStore()
+        self._lock = threading.Lock()
+        self._scopes = 0
+
+    @property
+    def store(self) -> _LabelStore:
+        return self._store
+
+    def id_for(self, label: str, store: Optional[_LabelStore] = None) -> int:
+        store = store if store is not None else self._store
+        label_id = store.ids.get(label)
+        if label_id is None:
+            with self._lock:
+                label_id = store.ids.get(label)
+                if label_id is None:
+                    label_id = len(store.labels)
+                    interned = sys.intern(str(label))
+                    store.labels.append(interned)
+                    store.ids[interned] = label_id
+        return label_id
+
+    def find(self, label: object, store: Optional[_LabelStore] = None) -> Optional[int]:
+        store = store if store is not None else self._store
+        return store.ids.get(label) if isinstance(label, str) else None
+
+    def label(self, label_id: int, store: Optional[_LabelStore] = None) -> str:
+        return (store if store is not None else self._store).labels[label_id]
+
+    def __len__(self) -> int:
+        return len(self._store.labels)
+
+    @contextmanager
+    def scan_scope(self) -> Iterator["LabelTable"]:
+        # 동시에 도는 스캔이 있으면 마지막 스캔이 끝날 때까지 새 저장소로 바꾸지 않는다.
+        with self._lock:
+            self._scopes += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._scopes -= 1
+                if self._scopes == 0:
+                    self._store = _LabelStore()
+
+
+# 후보의 source id는 이 개수까지 튜플로 두고, 넘으면 집합으로 바꿔 추가 비용을 일정하게 유지한다.
+SOURCE_ID_SET_THRESHOLD = 16
+
+# source 라벨("js:https://cdn.../main.8f3a.js")과 탐지기 이름은 후보 수천 개에서 반복되므로 id로 한 번만 보관한다.
+# source 라벨은 스캔마다 달라지므로 discover()가 scan_scope()로 수명을 묶고, 탐지기 이름은 고정 목록이라 계속 둔다.
+# 후보는 자기 source id가 나온 저장소를 참조하므로 스캔이 끝난 뒤에도 라벨을 그대로 읽을 수 있다.
+SOURCE_LABELS = LabelTable()
+DETECTOR_LABELS = LabelTable()
+
+
+class _CandidateLabelView(MutableSet):
+    __slots__ = ("_candidate",)
+
+    def __init__(self, candidate: "Candidate") -> None:
+        self._candidate = candidate
+
+    def update(self, labels: Iterable[str]) -> None:
+        for label in labels:
+            self.add(label)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class _SourceLabelView(_CandidateLabelView):
+    __slots__ = ()
+
+    def __contains__(self, label: object) -> bool:
+        store = self._candidate._source_store
+        label_id = SOURCE_LABELS.find(label, store) if store is not None else None
+        return label_id is not None and label_id in self._candidate._source_ids
+
+    def __iter__(self) -> Iterator[str]:
+        store = self._candidate._source_store
+        return (store.labels[label_id] for label_id in self._candidate._source_ids) if store is not None else iter(())
+
+    def __len__(self) -> int:
+        return len(self._candidate._source_ids)
+
+    def add(self, label: str) -> None:
+        self._candidate.add_source(label)
+
+    def discard(self, label: str) -> None:
+        store = self._candidate._source_store
+        label_id = SOURCE_LABELS.find(label, store) if store is not None else None
+        source_ids = self._candidate._source_ids
+        if label_id is None:
+            return
+        if isinstance(source_ids, set):
+            source_ids.discard(label_id)
+        else:
+            self._candidate._source_ids = tuple(item for item in source_ids if item != label_id)
+
+
+class _DetectorLabelView(_CandidateLabelView):
+    __slots__ = ()
+
+    def __contains__(self, label: object) -> bool:
+        label_id = DETECTOR_LABELS.find(label)
+        return label_id is not None and bool(self._candidate._detector_bits >> label_id & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self._candidate._detector_bits
+        label_id = 0
+        while bits:
+            if bits & 1:
+                yield DETECTOR_LABELS.label(label_id)
+            bits >>= 1
+            label_id += 1
+
+    def __len__(self) -> int:
+        return bin(self._candidate._detector_bits).count("1")
+
+    def add(self, label: str) -> None:
+        self._candidate.add_detector(label)
+
+    def discard(self, label: str) -> None:
+        label_id = DETECTOR_LABELS.find(label)
+        if label_id is not None:
+            self._candidate._detector_bits &= ~(1 << label_id)
 
 
-@dataclass
 class Candidate:
-    url: str
-    path: str
-    kind: str
-    sources: Set[str] = field(default_factory=set)  # source labels where URL was discovered (e.g. "html:https://x")
-    confidence: str = "low"
-    detectors: Set[str] = field(default_factory=set)  # detector names (e.g. "fetch", "axios_method") that matched this URL
+    """A discovered URL. Sources are kept as interned label ids and detectors as a bitset over DETECTOR_LABELS.
+
+    Source ids stay in a tuple while there are few of them and move to a set
+    past SOURCE_ID_SET_THRESHOLD, so a path seen in hundreds of chunks is not
+    copied on every addition.
+    """
+
+    __slots__ = ("url", "path", "kind", "confidence", "_source_ids", "_source_store", "_detector_bits")
+
+    def __init__(
+        self,
+        url: str,
+        path: str,
+        kind: str,
+        sources: Iterable[str] = (),
+        confidence: str = "low",
+        detectors: Iterable[str] = (),
+    ) -> None:
+        self.url = url
+        self.path = path
+        self.kind = kind
+        self.confidence = confidence
+        self._source_ids: Union[Tuple[int, ...], Set[int]] = ()
+        self._source_store: Optional[_LabelStore] = None
+        self._detector_bits = 0
+        for source in sources:
+            self.add_source(source)
+        for detector in detectors:
+            self.add_detector(detector)
+
+    @property
+    def sources(self) -> MutableSet[str]:
+        # source labels where URL was discovered (e.g. "html:https://x")
+        return _SourceLabelView(self)
+
+    @property
+    def detectors(self) -> MutableSet[str]:
+        # detector names (e.g. "fetch", "axios_method") that matched this URL
+        return _DetectorLabelView(self)
+
+    def add_source(self, label: str) -> None:
+        store = SOURCE_LABELS.store
+        if self._source_store is not store:
+            self._rebase_sources(store)
+        self._add_source_id(SOURCE_LABELS.id_for(label, store))
+
+    def _rebase_sources(self, store: _LabelStore) -> None:
+        # 이전 스캔의 저장소에서 나온 id는 현재 저장소의 id로 옮긴 뒤에 섞는다.
+        old_store = self._source_store
+        old_ids = self._source_ids
+        self._source_ids = ()
+        self._source_store = store
+        if old_store is not None:
+            for label_id in old_ids:
+                self._add_source_id(SOURCE_LABELS.id_for(old_store.labels[label_id], store))
+
+    def _add_source_id(self, label_id: int) -> None:
+        source_ids = self._source_ids
+        if label_id in source_ids:
+            return
+        if isinstance(source_ids, tuple):
+            if len(source_ids) < SOURCE_ID_SET_THRESHOLD:
+                self._source_ids = source_ids + (label_id,)
+                return
+            self._source_ids = source_ids = set(source_ids)
+        source_ids.add(label_id)
+
+    def add_detector(self, name: str) -> None:
+        self._detector_bits |= 1 << DETECTOR_LABELS.id_for(name)
+
+    def merge_sources(self, other: "Candidate") -> None:
+        if other._source_store is None:
+            return
+        if self._source_store is not other._source_store:
+            for label in other.sources:
+                self.add_source(label)
+            return
+        for label_id in other._source_ids:
+            self._add_source_id(label_id)
+
+    def source_labels(self) -> List[str]:
+        return sorted(self.sources)
+
+    def detector_labels(self) -> List[str]:
+        return sorted(self.detectors)
+
+    def __repr__(self) -> str:
+        return (
+            f"Candidate(url={self.url!r}, path={self.path!r}, kind={self.kind!r}, sources={self.source_labels()!r}, "
+            f"confidence={self.confidence!r}, detectors={self.detector_labels()!r})"
+        )
 
 
 CONFIDENCE_RANK = {"low": 1, "medium": 2, "high": 3}
@@ -552,12 +1385,50 @@ _PATTERN_DETECTORS = (
 DETECTOR_REGISTRY: Tuple[Detector, ...] = _PATTERN_DETECTORS  # extended after extractor functions below
 
 
+SCOPE_VERDICT_CACHE_SIZE = 4096
+
+
+class ScopeMatcher:
+    """Compiled include/exclude decision for one scope, cached per hostname."""
+
+    __slots__ = ("hostname", "include_subdomains", "excluded", "_subdomain_suffix", "_verdicts")
+
+    def __init__(self, hostname: str, include_subdomains: bool, excluded_hostnames: Iterable[str]) -> None:
+        self.hostname = hostname
+        self.include_subdomains = include_subdomains
+        self.excluded = frozenset(item for item in (normalize_hostname(value) for value in excluded_hostnames) if item)
+        self._subdomain_suffix = f".{hostname}"
+        self._verdicts: Dict[str, bool] = {}
+
+    def matches(self, hostname: str) -> bool:
+        verdict = self._verdicts.get(hostname)
+        if verdict is None:
+            verdict = self._decide(hostname)
+            if len(self._verdicts) >= SCOPE_VERDICT_CACHE_SIZE:
+                self._verdicts.clear()
+            self._verdicts[hostname] = verdict
+        return verdict
+
+    def _decide(self, hostname: str) -> bool:
+        if not hostname:
+            return False
+        if hostname == self.hostname:
+            return True
+        if not self.include_subdomains or not hostname.endswith(self._subdomain_suffix):
+            return False
+        return not hostname_has_suffix_in(hostname, self.excluded)
+
+
 @dataclass(frozen=True)
 class UrlScope:
     hostname: str
     site_hostname: str
     include_subdomains: bool = True
     excluded_hostnames: Tuple[str, ...] = ()
+    matcher: ScopeMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "matcher", ScopeMatcher(self.hostname, self.include_subdomains, self.excluded_hostnames))
 
 
 @dataclass
@@ -567,6 +1438,48 @@ class ProbeResult:
     method: Optional[str]
     error: Optional[str]
     length: int = 0
+    # 연결 실패나 차단기로 건너뛴 결과는 호스트 상태에 따라 금방 달라지므로 캐시하지 않는다.
+    cacheable: bool = True
+
+
+@dataclass(slots=True)
+class DynamicEvent:
+    url: str
+    method: str
+    resource_type: str
+    source: str
+    status_code: Optional[int] = None
+    content_type: str = ""
+    body_analyzed: bool = False
+    body_length: Optional[int] = None
+    body_error: str = ""
+
+    def __post_init__(self) -> None:
+        # 이벤트마다 반복되는 짧은 문자열은 intern해서 한 객체만 공유한다.
+        self.method = sys.intern(str(self.method or "GET"))
+        self.resource_type = sys.intern(str(self.resource_type or ""))
+        self.source = sys.intern(str(self.source or ""))
+        self.content_type = sys.intern(str(self.content_type or ""))
+
+    def record_response(self, status_code: Optional[int], content_type: str) -> None:
+        self.status_code = status_code
+        self.content_type = sys.intern(str(content_type or ""))
+
+    def to_dict(self) -> dict:
+        item = {
+            "url": self.url,
+            "method": self.method,
+            "resource_type": self.resource_type,
+            "status_code": self.status_code,
+            "content_type": self.content_type,
+            "source": self.source,
+        }
+        if self.body_analyzed:
+            item["body_analyzed"] = True
+            item["body_length"] = self.body_length
+        if self.body_error:
+            item["body_error"] = self.body_error
+        return item
 
 
 @dataclass
@@ -616,8 +1529,26 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument("url", nargs="?", help="검사할 대상 URL")
     parser.add_argument("--max-js-files", type=int, default=50, help="가져올 JS 파일의 최대 개수(기본값: 50)")
     parser.add_argument("--max-depth", type=int, default=2, help="재귀 JS 탐색의 최대 깊이(기본값: 2)")
-    parser.add_argument("--timeout", type=float, default=15.0, help="HTTP 타임아웃(초, 기본값: 15)")
-    parser.add_argument("--output", type=Path, default=Path("discovery-result.json"), help="결과 파일 경로(.json/.xlsx/.html 또는 확장자 없음, 기본값: discovery-result.json)")
+    parser.add_argument("--timeout", type=float, default=15.0, help="HTTP 응답 대기 타임아웃(초, 기본값: 15)")
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=DEFAULT_CONNECT_TIMEOUT,
+        help="TCP 연결 타임아웃(초, 기본값: 5). --timeout보다 크면 --timeout을 씁니다. 0이면 --timeout과 같게 둡니다.",
+    )
+    parser.add_argument(
+        "--host-failure-threshold",
+        type=int,
+        default=DEFAULT_HOST_FAILURE_THRESHOLD,
+        help="같은 호스트에 연속으로 이만큼 연결하지 못하면 남은 프로브를 건너뜁니다(기본값: 3). 0이면 끕니다.",
+    )
+    parser.add_argument(
+        "--dns-cache-ttl",
+        type=float,
+        default=DEFAULT_DNS_CACHE_TTL,
+        help="스캔 중 호스트 이름 해석 결과를 재사용할 시간(초, 기본값: 300). 0이면 캐시와 사전 해석을 끕니다.",
+    )
+    parser.add_argument("--output", type=Path, default=Path("discovery-result.json"), help="결과 파일 경로(.json/.xlsx/.html/.ndjson 또는 확장자 없음, 기본값: discovery-result.json)")
     parser.add_argument("--skip-probe", action="store_true", help="추출된 경로의 접근성 확인을 건너뜁니다.")
     parser.add_argument("--recursive-scan", action="store_true", help="접근 가능한 페이지(200)를 대상으로 재귀 탐색을 수행합니다.")
     parser.add_argument("--recursive-depth", type=int, default=1, help="재귀 탐색 단계(기본값: 1)")
@@ -636,7 +1567,19 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     )
 
     parser.add_argument("--max-workers", type=int, default=1, help="동시에 처리할 최대 요청 작업 수(기본값: 1)")
+    parser.add_argument(
+        "--max-host-workers",
+        type=int,
+        default=0,
+        help="한 호스트(origin)에 동시에 보낼 최대 프로브 수입니다. 0이면 호스트가 여럿일 때 동시 요청 수의 절반을 우선 상한으로 씁니다(기본값: 0).",
+    )
     parser.add_argument("--request-delay", type=float, default=0.0, help="요청 시작 간 최소 딜레이(초, 기본값: 0)")
+    parser.add_argument(
+        "--probe-cache-ttl",
+        type=float,
+        default=DEFAULT_PROBE_CACHE_TTL,
+        help="같은 URL의 프로브 결과를 스캔 전체(재귀 대상, 배치 URL)에서 재사용할 시간(초, 기본값: 300). 0이면 캐시를 끕니다.",
+    )
     parser.add_argument("--proxy", type=str, default="", help="프록시 URL(http://host:port 또는 https://host:port)")
     parser.add_argument("--save-js-dir", type=Path, default=None, help="가져온 JS 파일 본문을 저장할 디렉터리")
     parser.add_argument("--dynamic-analysis", action="store_true", help="실제 브라우저로 페이지를 열어 요청/화면/DOM에서 후보를 더 찾습니다.")
@@ -658,6 +1601,24 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument("--dynamic-action-limit", type=int, default=12, help="브라우저에서 눌러볼 링크/버튼/탭 최대 개수(기본값: 12)")
     parser.add_argument("--dynamic-scroll-steps", type=int, default=3, help="브라우저에서 아래로 스크롤할 횟수(기본값: 3)")
     parser.add_argument("--dynamic-recursive-limit", type=int, default=50, help="브라우저 분석으로 찾은 페이지 중 추가 방문할 최대 개수(기본값: 50)")
+    parser.add_argument(
+        "--dynamic-profile-dir",
+        type=Path,
+        default=None,
+        help="브라우저 프로필(HTTP 캐시/쿠키)을 유지할 디렉터리입니다. 지정하면 재귀 대상과 다음 실행에서 번들을 디스크 캐시로 재사용합니다.",
+    )
+    parser.add_argument(
+        "--dynamic-storage-state",
+        type=Path,
+        default=None,
+        help="브라우저 쿠키/localStorage 상태 파일(JSON)입니다. 파일이 있으면 불러오고, 분석 후 최신 상태로 저장합니다.",
+    )
+    parser.add_argument(
+        "--dynamic-events-file",
+        type=Path,
+        default=None,
+        help="브라우저 네트워크 이벤트를 결과 파일에 넣지 않고 이 NDJSON 파일에 기록합니다. 스캔을 시작할 때 파일을 비우고 대상별 이벤트를 이어서 씁니다.",
+    )
     parser.add_argument("--no-verify-ssl", action="store_true", help="SSL 인증서 검증을 건너뜁니다(자체 서명 인증서 허용).")
     parser.add_argument(
         "--scan-well-known",
@@ -678,6 +1639,21 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default="low",
         help="이 신뢰도 미만의 경로/API 후보를 출력에서 제외합니다(기본값: low=전체).",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="대상별 단계 시간, 탐지기 시간, 호스트별 응답 지연 분포를 결과의 performance 항목에 기록합니다.",
+    )
+    parser.add_argument(
+        "--detector-stats",
+        action="store_true",
+        help="탐지기별 호출 수, 검사 바이트, 매치/채택 수, 누적 시간을 결과의 detector_stats 항목에 기록합니다.",
+    )
+    parser.add_argument(
+        "--legacy-result-schema",
+        action="store_true",
+        help="JSON 결과에 예전 리더용 sensitive_findings/sensitive_summary 별칭을 함께 씁니다(민감정보가 두 번 기록됩니다). NDJSON 출력과는 함께 쓸 수 없습니다.",
+    )
     parser.add_argument("--debug", action="store_true", help="오류 발생 시 traceback을 함께 출력합니다.")
 
     args = parser.parse_args(argv)
@@ -699,7 +1675,12 @@ def build_config(args: argparse.Namespace) -> Config:
         include_subdomains=bool(args.include_subdomains),
         excluded_subdomains=parse_hostname_filters(args.exclude_subdomains),
         max_workers=max(1, args.max_workers),
+        max_host_workers=max(0, args.max_host_workers),
         request_delay=max(0.0, args.request_delay),
+        probe_cache_ttl=max(0.0, args.probe_cache_ttl),
+        connect_timeout=max(0.0, args.connect_timeout),
+        host_failure_threshold=max(0, args.host_failure_threshold),
+        dns_cache_ttl=max(0.0, args.dns_cache_ttl),
         verify_ssl=not args.no_verify_ssl,
         proxy_url=str(args.proxy or "").strip(),
         js_output_dir=args.save_js_dir,
@@ -712,8 +1693,14 @@ def build_config(args: argparse.Namespace) -> Config:
         dynamic_action_limit=max(0, args.dynamic_action_limit),
         dynamic_scroll_steps=max(0, args.dynamic_scroll_steps),
         dynamic_recursive_limit=max(0, args.dynamic_recursive_limit),
+        dynamic_profile_dir=args.dynamic_profile_dir,
+        dynamic_storage_state=args.dynamic_storage_state,
+        dynamic_events_file=args.dynamic_events_file,
         scan_well_known=bool(args.scan_well_known),
         min_confidence=str(args.min_confidence),
+        profile=bool(args.profile),
+        detector_stats=bool(args.detector_stats),
+        legacy_result_schema=bool(args.legacy_result_schema),
     )
     validate_config(config)
     return config
@@ -728,8 +1715,18 @@ def validate_config(config: Config) -> None:
         raise ValueError("동시 요청 수는 1 이상이어야 합니다.")
     if config.max_workers > 32:
         raise ValueError("동시 요청 수는 32 이하로 설정해 주세요.")
+    if config.max_host_workers < 0:
+        raise ValueError("호스트별 동시 프로브 수는 0 이상이어야 합니다.")
     if config.request_delay < 0:
         raise ValueError("요청 딜레이는 0 이상이어야 합니다.")
+    if config.probe_cache_ttl < 0:
+        raise ValueError("프로브 캐시 유지 시간은 0 이상이어야 합니다.")
+    if config.connect_timeout < 0:
+        raise ValueError("연결 타임아웃은 0 이상이어야 합니다.")
+    if config.host_failure_threshold < 0:
+        raise ValueError("호스트 연결 실패 한도는 0 이상이어야 합니다.")
+    if config.dns_cache_ttl < 0:
+        raise ValueError("DNS 캐시 유지 시간은 0 이상이어야 합니다.")
     if config.dynamic_wait < 0:
         raise ValueError("동적 분석 대기 시간은 0 이상이어야 합니다.")
     if config.dynamic_max_events < 1:
@@ -746,13 +1743,18 @@ def validate_config(config: Config) -> None:
         raise ValueError("min_confidence는 low, medium, high 중 하나여야 합니다.")
     validate_proxy_url(config.proxy_url)
     validate_output_path(config.output)
+    if config.legacy_result_schema and config.output.suffix.lower() == ".ndjson":
+        raise ValueError("예전 결과 형식(--legacy-result-schema)은 NDJSON 출력에서 지원하지 않습니다. `.json` 출력으로 저장해 주세요.")
     validate_js_output_dir(config.js_output_dir)
+    validate_dynamic_browser_state_paths(config.dynamic_profile_dir, config.dynamic_storage_state)
+    if config.dynamic_events_file is not None and Path(config.dynamic_events_file).expanduser().is_dir():
+        raise ValueError("동적 이벤트 파일 경로는 파일이어야 합니다.")
 
 
 def validate_output_path(output: Path) -> None:
     suffix = output.suffix.lower()
     if suffix not in SUPPORTED_OUTPUT_SUFFIXES:
-        raise ValueError("지원하지 않는 출력 형식입니다. `.json`, `.xlsx`, `.html`, 또는 확장자 없이 입력해 주세요.")
+        raise ValueError("지원하지 않는 출력 형식입니다. `.json`, `.xlsx`, `.html`, `.ndjson`, 또는 확장자 없이 입력해 주세요.")
 
 
 def validate_js_output_dir(output_dir: Optional[Path]) -> None:
@@ -768,6 +1770,17 @@ def validate_js_output_dir(output_dir: Optional[Path]) -> None:
         raise ValueError("JS 저장 경로는 디렉터리여야 합니다.")
 
 
+def validate_dynamic_browser_state_paths(profile_dir: Optional[Path], storage_state: Optional[Path]) -> None:
+    if profile_dir is not None:
+        path = Path(profile_dir).expanduser()
+        if path.exists() and not path.is_dir():
+            raise ValueError("브라우저 프로필 경로는 디렉터리여야 합니다.")
+    if storage_state is not None:
+        path = Path(storage_state).expanduser()
+        if path.exists() and path.is_dir():
+            raise ValueError("브라우저 상태 파일 경로는 파일이어야 합니다.")
+
+
 def validate_proxy_url(proxy_url: str) -> None:
     value = str(proxy_url or "").strip()
     if not value:
@@ -857,10 +1870,16 @@ def save_js_file(script_url: str, text: str, output_dir: Path, sequence: int) ->
     return path.resolve()
 
 
-def build_execution_context(config: Config) -> ExecutionContext:
+def build_execution_context(config: Config, record_sink: Optional[Callable[[dict], None]] = None) -> ExecutionContext:
     return ExecutionContext(
         max_workers=max(1, config.max_workers),
         request_throttle=RequestThrottle(delay_seconds=max(0.0, config.request_delay)),
+        max_host_workers=max(0, config.max_host_workers),
+        connect_timeout=max(0.0, config.connect_timeout),
+        record_sink=record_sink,
+        probe_cache=ProbeCache(config.probe_cache_ttl) if config.probe_cache_ttl > 0 and not config.skip_probe else None,
+        host_breaker=HostCircuitBreaker(config.host_failure_threshold) if config.host_failure_threshold > 0 else None,
+        dns_cache=DnsCache(config.dns_cache_ttl) if config.dns_cache_ttl > 0 else None,
     )
 
 
@@ -993,7 +2012,12 @@ def build_empty_scan_result(config: Config, url: str, error: str, status: str =
         "max_js_files": config.max_js_files,
         "max_depth": config.max_depth,
         "max_workers": config.max_workers,
+        "max_host_workers": config.max_host_workers,
         "request_delay": config.request_delay,
+        "probe_cache_ttl": config.probe_cache_ttl,
+        "connect_timeout": config.connect_timeout,
+        "host_failure_threshold": config.host_failure_threshold,
+        "dns_cache_ttl": config.dns_cache_ttl,
         "proxy_url": redact_url_credentials(config.proxy_url),
         "dynamic_analysis_enabled": config.dynamic_analysis,
         "dynamic_wait": config.dynamic_wait,
@@ -1004,6 +2028,11 @@ def build_empty_scan_result(config: Config, url: str, error: str, status: str =
         "dynamic_action_limit": config.dynamic_action_limit,
         "dynamic_scroll_steps": config.dynamic_scroll_steps,
         "dynamic_recursive_limit": config.dynamic_recursive_limit,
+        "dynamic_profile_dir": str(config.dynamic_profile_dir or ""),
+        "dynamic_storage_state": str(config.dynamic_storage_state or ""),
+        "dynamic_events_file": str(config.dynamic_events_file or ""),
+        "profile": config.profile,
+        "detector_stats_enabled": config.detector_stats or config.profile,
         "dynamic_analysis": {
             "enabled": config.dynamic_analysis,
             "success": False,
@@ -1041,10 +2070,9 @@ def build_empty_scan_result(config: Config, url: str, error: str, status: str =
         "accessible_apis": [],
         "all_pages": [],
         "all_apis": [],
+        "schema_version": RESULT_SCHEMA_VERSION,
         "hardcoded_findings": [],
         "hardcoded_summary": summarize_hardcoded_findings([]),
-        "sensitive_findings": [],
-        "sensitive_summary": summarize_hardcoded_findings([]),
         "summary": {
             "js_discovered": 0,
             "js_fetched": 0,
@@ -1160,7 +2188,12 @@ def build_batch_result(records: List[dict], input_urls: List[str], config: Confi
         "max_js_files": config.max_js_files,
         "max_depth": config.max_depth,
         "max_workers": config.max_workers,
+        "max_host_workers": config.max_host_workers,
         "request_delay": config.request_delay,
+        "probe_cache_ttl": config.probe_cache_ttl,
+        "connect_timeout": config.connect_timeout,
+        "host_failure_threshold": config.host_failure_threshold,
+        "dns_cache_ttl": config.dns_cache_ttl,
         "proxy_url": redact_url_credentials(config.proxy_url),
         "dynamic_analysis_enabled": config.dynamic_analysis,
         "dynamic_wait": config.dynamic_wait,
@@ -1171,7 +2204,13 @@ def build_batch_result(records: List[dict], input_urls: List[str], config: Confi
         "dynamic_action_limit": config.dynamic_action_limit,
         "dynamic_scroll_steps": config.dynamic_scroll_steps,
         "dynamic_recursive_limit": config.dynamic_recursive_limit,
+        "dynamic_profile_dir": str(config.dynamic_profile_dir or ""),
+        "dynamic_storage_state": str(config.dynamic_storage_state or ""),
+        "dynamic_events_file": str(config.dynamic_events_file or ""),
+        "profile": config.profile,
+        "detector_stats_enabled": config.detector_stats or config.profile,
         "js_output_dir": str(normalize_js_output_dir(config.js_output_dir) or ""),
+        "schema_version": RESULT_SCHEMA_VERSION,
         "result_count": len(records),
         "success_count": success_count,
         "failed_count": failed_count,
@@ -1205,10 +2244,10 @@ def _is_disallowed_host(hostname: str) -> bool:
 
 def is_http_url(value: str, *, allow_disallowed_host: bool = False) -> bool:
     try:
-        parsed = urlparse(value)
+        parsed = parse_url(value)
     except ValueError:
         return False
-    hostname = parsed.hostname or ""
+    hostname = parsed.hostname
     if parsed.scheme not in {"http", "https"} or not parsed.netloc or not hostname:
         return False
     return allow_disallowed_host or not _is_disallowed_host(hostname)
@@ -1220,10 +2259,10 @@ def is_scan_target_url(value: str) -> bool:
 
 def should_allow_disallowed_host(url: str) -> bool:
     try:
-        parsed = urlparse(url)
+        parsed = parse_url(url)
     except ValueError:
         return False
-    hostname = parsed.hostname or ""
+    hostname = parsed.hostname
     return bool(hostname) and _is_disallowed_host(hostname)
 
 
@@ -1315,24 +2354,52 @@ def normalize_dynamic_url_candidate(candidate: str) -> str:
     return DYNAMIC_URL_PLACEHOLDER_RE.sub(":param", value)
 
 
-def normalize_path(value: str) -> str:
+PARSED_URL_CACHE_SIZE = 16_384
+
+
+@dataclass(frozen=True)
+class ParsedUrl:
+    scheme: str
+    netloc: str
+    hostname: str
+    host_key: str
+    path: str
+    path_and_query: str
+    identity: str
+
+
+@lru_cache(maxsize=PARSED_URL_CACHE_SIZE)
+def parse_url(value: str) -> ParsedUrl:
+    # 후보 하나가 스코프 검사, 경로 정규화, 식별자 계산을 거치며 같은 URL을 여러 번 파싱하므로 한 번만 계산해 재사용한다.
     parsed = urlparse(value)
+    hostname = parsed.hostname or ""
     path = parsed.path or "/"
-    if parsed.query:
-        return f"{path}?{parsed.query}"
-    return path
+    path_and_query = f"{path}?{parsed.query}" if parsed.query else path
+    if parsed.scheme and parsed.netloc:
+        identity = f"{parsed.scheme}://{parsed.netloc}{path_and_query}"
+    else:
+        identity = path_and_query
+    return ParsedUrl(
+        scheme=parsed.scheme,
+        netloc=parsed.netloc,
+        hostname=hostname,
+        host_key=normalize_hostname(hostname or parsed.netloc),
+        path=parsed.path,
+        path_and_query=path_and_query,
+        identity=identity,
+    )
+
+
+def normalize_path(value: str) -> str:
+    return parse_url(value).path_and_query
 
 
 def candidate_identity(value: str) -> str:
-    parsed = urlparse(value)
-    path = normalize_path(value)
-    if parsed.scheme and parsed.netloc:
-        return f"{parsed.scheme}://{parsed.netloc}{path}"
-    return path
+    return parse_url(value).identity
 
 
 def get_origin_key(url: str) -> str:
-    parsed = urlparse(url)
+    parsed = parse_url(url)
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
@@ -1341,8 +2408,7 @@ def normalize_hostname(hostname: str) -> str:
 
 
 def get_hostname_key(url: str) -> str:
-    parsed = urlparse(url)
-    return normalize_hostname(parsed.hostname or parsed.netloc)
+    return parse_url(url).host_key
 
 
 def get_site_hostname_key(hostname: str) -> str:
@@ -1384,28 +2450,29 @@ def build_url_scope(
     )
 
 
+def hostname_has_suffix_in(hostname: str, suffixes: AbstractSet[str]) -> bool:
+    # 라벨 경계마다 잘라 집합을 조회하므로 제외 목록 길이와 무관하게 라벨 수만큼만 검사한다.
+    if not suffixes:
+        return False
+    position = 0
+    while True:
+        if hostname[position:] in suffixes:
+            return True
+        position = hostname.find(".", position) + 1
+        if position == 0:
+            return False
+
+
 def is_hostname_excluded(hostname: str, excluded_hostnames: Sequence[str]) -> bool:
     normalized = normalize_hostname(hostname)
     if not normalized:
         return False
-    for excluded in excluded_hostnames:
-        blocked = normalize_hostname(excluded)
-        if not blocked:
-            continue
-        if normalized == blocked or normalized.endswith(f".{blocked}"):
-            return True
-    return False
+    blocked = {item for item in (normalize_hostname(excluded) for excluded in excluded_hostnames) if item}
+    return hostname_has_suffix_in(normalized, blocked)
 
 
 def url_matches_scope(url: str, scope: UrlScope) -> bool:
-    hostname = get_hostname_key(url)
-    if not hostname:
-        return False
-    if hostname != scope.hostname and is_hostname_excluded(hostname, scope.excluded_hostnames):
-        return False
-    if scope.include_subdomains:
-        return hostname == scope.hostname or hostname.endswith(f".{scope.hostname}")
-    return hostname == scope.hostname
+    return scope.matcher.matches(get_hostname_key(url))
 
 
 def read_response_text(response) -> str:
@@ -1428,6 +2495,89 @@ def response_length(response, text: str) -> int:
         return 0
 
 
+class HostConnectError(OSError):
+    """Name resolution or the TCP connect itself failed; no server answered."""
+
+
+def open_connection(
+    address: Tuple[str, int],
+    connect_timeout: float,
+    read_timeout: float,
+    source_address: Optional[Tuple[str, int]] = None,
+    dns_cache: Optional[DnsCache] = None,
+) -> socket.socket:
+    host, port = address
+    try:
+        if dns_cache is not None:
+            infos = dns_cache.resolve(host, port)
+        else:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    except (OSError, ValueError) as exc:
+        raise HostConnectError(str(exc) or exc.__class__.__name__) from exc
+
+    last_error: Optional[OSError] = None
+    for family, socktype, proto, _, sockaddr in infos:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(connect_timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+        except OSError as exc:
+            sock.close()
+            last_error = exc
+            continue
+        # 연결된 뒤에는 응답 대기 시간만 적용해 느리지만 살아 있는 서버를 끊지 않는다.
+        sock.settimeout(read_timeout)
+        return sock
+    reason = str(last_error) if last_error is not None else ""
+    raise HostConnectError(reason or f"{host}:{port}에 연결하지 못했습니다.") from last_error
+
+
+class _DeadlineHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, *args, connector: Callable[..., socket.socket], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._create_connection = connector
+
+
+class _DeadlineHTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, *args, connector: Callable[..., socket.socket], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._create_connection = connector
+
+
+class DeadlineHTTPHandler(HTTPHandler):
+    def __init__(self, connector: Callable[..., socket.socket]) -> None:
+        super().__init__()
+        self.connector = connector
+
+    def http_open(self, req):
+        return self.do_open(_DeadlineHTTPConnection, req, connector=self.connector)
+
+
+class DeadlineHTTPSHandler(HTTPSHandler):
+    def __init__(self, connector: Callable[..., socket.socket], context: Optional[ssl.SSLContext] = None) -> None:
+        super().__init__(context=context)
+        self.connector = connector
+
+    def https_open(self, req):
+        return self.do_open(_DeadlineHTTPSConnection, req, context=self._context, connector=self.connector)
+
+
+def build_connector(timeout: float, execution: Optional[ExecutionContext] = None) -> Callable[..., socket.socket]:
+    connect_timeout = timeout
+    dns_cache = None
+    if execution is not None:
+        if execution.connect_timeout > 0:
+            connect_timeout = min(timeout, execution.connect_timeout)
+        dns_cache = execution.dns_cache
+
+    def connect(address: Tuple[str, int], _timeout=None, source_address=None) -> socket.socket:
+        return open_connection(address, connect_timeout, timeout, source_address=source_address, dns_cache=dns_cache)
+
+    return connect
+
+
 def fetch_text(
     url: str,
     timeout: float,
@@ -1454,14 +2604,36 @@ def fetch_text(
         ssl_context.verify_mode = ssl.CERT_NONE
     proxy = str(proxy_url or "").strip()
 
+    profiler = execution.profiler if execution is not None else None
+    if execution is not None:
+        wait_started = time.perf_counter()
+        execution.request_throttle.wait_for_turn(cancel_event=execution.cancel_event)
+        ensure_not_cancelled(execution)
+        if profiler is not None:
+            profiler.record_throttle_wait(time.perf_counter() - wait_started)
+    request_started = time.perf_counter()
+    result = _open_and_read(url, request, timeout, ssl_context, proxy, build_connector(timeout, execution))
+    if profiler is not None:
+        profiler.record_request(url, time.perf_counter() - request_started, result.length)
+    return result
+
+
+def _open_and_read(
+    url: str,
+    request: Request,
+    timeout: float,
+    ssl_context: Optional[ssl.SSLContext],
+    proxy: str,
+    connector: Optional[Callable[..., socket.socket]] = None,
+) -> FetchResult:
     try:
-        if execution is not None:
-            execution.request_throttle.wait_for_turn(cancel_event=execution.cancel_event)
-            ensure_not_cancelled(execution)
         handlers = [SafeRedirectHandler(allow_disallowed_host=should_allow_disallowed_host(url))]
         if proxy:
             handlers.append(ProxyHandler({"http": proxy, "https": proxy}))
-        if ssl_context is not None:
+        if connector is not None:
+            handlers.append(DeadlineHTTPHandler(connector))
+            handlers.append(DeadlineHTTPSHandler(connector, context=ssl_context))
+        elif ssl_context is not None:
             handlers.append(HTTPSHandler(context=ssl_context))
         opener = build_opener(*handlers)
         request_context = opener.open(request, timeout=timeout)
@@ -1497,7 +2669,15 @@ def fetch_text(
             final_url=exc.geturl(),
         )
     except URLError as exc:
-        return FetchResult(url=url, status_code=None, text="", success=False, length=0, error=str(exc.reason))
+        return FetchResult(
+            url=url,
+            status_code=None,
+            text="",
+            success=False,
+            length=0,
+            error=str(exc.reason),
+            connect_failed=isinstance(exc.reason, HostConnectError),
+        )
     except (socket.timeout, TimeoutError, ssl.SSLError, OSError, ValueError) as exc:
         return FetchResult(
             url=url,
@@ -1506,6 +2686,7 @@ def fetch_text(
             success=False,
             length=0,
             error=str(exc) or exc.__class__.__name__,
+            connect_failed=isinstance(exc, HostConnectError),
         )
 
 
@@ -1519,19 +2700,57 @@ def format_fetch_failure(result: FetchResult, verify_ssl: bool = True) -> str:
     return reason
 
 
-def emit_progress(progress: ProgressCallback, message: str) -> None:
-    if progress is not None:
-        progress(message)
+def emit_progress(
+    progress: ProgressCallback,
+    message: str,
+    phase: str = "",
+    completed: Optional[int] = None,
+    total: Optional[int] = None,
+    url: str = "",
+    byte_count: int = 0,
+    requests: int = 0,
+    errors: int = 0,
+) -> None:
+    if progress is None:
+        return
+    deliver_progress_event(
+        progress,
+        ProgressEvent(
+            message=message,
+            phase=phase,
+            completed=completed,
+            total=total,
+            url=url,
+            byte_count=byte_count,
+            requests=requests,
+            errors=errors,
+        ),
+    )
+
+
+def deliver_progress_event(progress: ProgressCallback, event: ProgressEvent) -> None:
+    # 문자열만 받는 기존 콜백에는 메시지만 전달하고, 지표만 담긴 이벤트는 건너뛴다.
+    if progress is None:
+        return
+    if getattr(progress, "accepts_progress_events", False):
+        progress(event)
+    elif event.message:
+        progress(event.message)
+
+
+def prefix_progress(progress: ProgressCallback, prefix: str) -> ProgressCallback:
+    if progress is None:
+        return None
+    return _PrefixedProgress(progress, prefix)
 
 
 def should_follow_js(candidate: str) -> bool:
-    parsed = urlparse(candidate)
-    path = parsed.path.lower()
+    path = parse_url(candidate).path.lower()
     return path.endswith(".js") or path.endswith(".mjs") or path.startswith(JS_HINT_PREFIXES)
 
 
 def is_static_asset(path: str) -> bool:
-    lowered = urlparse(path).path.lower()
+    lowered = parse_url(path).path.lower()
     if lowered.startswith(STATIC_PREFIXES):
         return True
     return any(lowered.endswith(extension) for extension in ASSET_EXTENSIONS)
@@ -1553,13 +2772,13 @@ def classify_candidate(raw_value: str, absolute_url: str) -> str:
 
 
 def add_candidate(bucket: Dict[str, Candidate], absolute_url: str, source: str, kind: str) -> None:
-    path = normalize_path(absolute_url)
-    key = candidate_identity(absolute_url)
+    parsed = parse_url(absolute_url)
+    key = parsed.identity
     candidate = bucket.get(key)
     if candidate is None:
-        candidate = Candidate(url=absolute_url, path=path, kind=kind)
+        candidate = Candidate(url=absolute_url, path=parsed.path_and_query, kind=kind)
         bucket[key] = candidate
-    candidate.sources.add(source)
+    candidate.add_source(source)
 
 
 def add_candidate_with_confidence(
@@ -1570,16 +2789,16 @@ def add_candidate_with_confidence(
     confidence: str,
     detector_name: str,
 ) -> None:
-    path = normalize_path(absolute_url)
-    key = candidate_identity(absolute_url)
+    parsed = parse_url(absolute_url)
+    key = parsed.identity
     candidate = bucket.get(key)
     if candidate is None:
-        candidate = Candidate(url=absolute_url, path=path, kind=kind, confidence=confidence)
+        candidate = Candidate(url=absolute_url, path=parsed.path_and_query, kind=kind, confidence=confidence)
         bucket[key] = candidate
     else:
         candidate.confidence = merge_confidence(candidate.confidence, confidence)
-    candidate.sources.add(source)
-    candidate.detectors.add(detector_name)
+    candidate.add_source(source)
+    candidate.add_detector(detector_name)
 
 
 def discard_candidate(bucket: Dict[str, Candidate], absolute_url: str) -> None:
@@ -1766,6 +2985,7 @@ def discover_well_known(
     verify_ssl: bool,
     proxy_url: str,
     page_bucket: Dict[str, "Candidate"],
+    execution: Optional[ExecutionContext] = None,
 ) -> None:
     allow_disallowed_host = should_allow_disallowed_host(target_url)
     origin = get_origin_key(target_url)
@@ -1776,6 +2996,7 @@ def discover_well_known(
             "timeout": timeout,
             "method": "GET",
             "headers": request_headers_for_target(headers, header_origin_url, url) if header_origin_url else headers,
+            "execution": execution,
             "verify_ssl": verify_ssl,
         }
         if proxy_url:
@@ -1835,27 +3056,29 @@ def collect_path_candidates(
     scope: UrlScope,
     page_bucket: Dict[str, Candidate],
     api_bucket: Dict[str, Candidate],
+    detector_stats: Optional[DetectorStatsRegistry] = None,
 ) -> None:
     allow_disallowed_host = should_allow_disallowed_host(base_url)
+    text_bytes = len(text)
 
-    def _ingest(raw_value: str, detector: Detector) -> None:
+    def _ingest(raw_value: str, detector: Detector) -> bool:
         absolute = _resolve_candidate_for_detection(
             base_url, raw_value, allow_disallowed_host=allow_disallowed_host
         )
         if not absolute:
-            return
+            return False
         if not url_matches_scope(absolute, scope):
-            return
+            return False
         path = normalize_path(absolute)
         if path == "/" or is_static_asset(path):
-            return
+            return False
         if detector.kind == "auto":
             kind = classify_candidate(raw_value, absolute)
         else:
             kind = detector.kind
         if kind == "api":
             if path.rstrip("/") in {"/api", "/apis"}:
-                return
+                return False
             discard_candidate(page_bucket, absolute)
             add_candidate_with_confidence(
                 api_bucket, absolute, source_label, "api", detector.confidence, detector.name
@@ -1864,19 +3087,33 @@ def collect_path_candidates(
             add_candidate_with_confidence(
                 page_bucket, absolute, source_label, "page", detector.confidence, detector.name
             )
+        return True
 
     for detector in DETECTOR_REGISTRY:
+        if detector_stats is None:
+            if detector.pattern is not None:
+                for match in detector.pattern.finditer(text):
+                    _ingest(match.group("value").strip(), detector)
+            elif detector.extractor is not None:
+                for raw_value in detector.extractor(text, base_url, allow_disallowed_host=allow_disallowed_host):
+                    _ingest(raw_value, detector)
+            continue
+        detector_started = time.perf_counter()
         if detector.pattern is not None:
-            for match in detector.pattern.finditer(text):
-                raw_value = match.group("value").strip()
-                _ingest(raw_value, detector)
+            raw_values = [match.group("value").strip() for match in detector.pattern.finditer(text)]
         elif detector.extractor is not None:
-            for raw_value in detector.extractor(
-                text, base_url, allow_disallowed_host=allow_disallowed_host
-            ):
-                _ingest(raw_value, detector)
+            raw_values = detector.extractor(text, base_url, allow_disallowed_host=allow_disallowed_host)
+        else:
+            continue
+        accepted = sum(1 for raw_value in raw_values if _ingest(raw_value, detector))
+        detector_stats.record(
+            detector.name, time.perf_counter() - detector_started, text_bytes, len(raw_values), accepted
+        )
 
-    for absolute in extract_axios_combined_urls(text, base_url, allow_disallowed_host=allow_disallowed_host):
+    detector_started = time.perf_counter()
+    combined_urls = extract_axios_combined_urls(text, base_url, allow_disallowed_host=allow_disallowed_host)
+    accepted = 0
+    for absolute in combined_urls:
         if not url_matches_scope(absolute, scope):
             continue
         path = normalize_path(absolute)
@@ -1886,9 +3123,20 @@ def collect_path_candidates(
         add_candidate_with_confidence(
             api_bucket, absolute, source_label, "api", "high", "axios_combined"
         )
+        accepted += 1
+    if detector_stats is not None:
+        detector_stats.record(
+            "axios_combined", time.perf_counter() - detector_started, text_bytes, len(combined_urls), accepted
+        )
 
-    for absolute in extract_axios_component_urls(text, base_url, allow_disallowed_host=allow_disallowed_host):
+    detector_started = time.perf_counter()
+    component_urls = extract_axios_component_urls(text, base_url, allow_disallowed_host=allow_disallowed_host)
+    for absolute in component_urls:
         discard_candidate(api_bucket, absolute)
+    if detector_stats is not None:
+        detector_stats.record(
+            "axios_component", time.perf_counter() - detector_started, text_bytes, len(component_urls), len(component_urls)
+        )
 
 
 def _dynamic_event_is_api(event: dict, url: str) -> bool:
@@ -2069,6 +3317,87 @@ def _dynamic_action_candidates_script(limit: int) -> str:
     }}"""
 
 
+def _store_dynamic_events(
+    result: dict,
+    events: List[DynamicEvent],
+    config: Config,
+    execution: Optional[ExecutionContext] = None,
+) -> None:
+    result["event_count"] = len(events)
+    if config.dynamic_events_file is not None:
+        events_path = Path(config.dynamic_events_file).expanduser()
+        # 재귀 대상과 배치 URL은 같은 파일에 이어 쓰고, 스캔이 바뀌면 처음 쓸 때 한 번 비운다.
+        truncate = execution is not None and execution.claim_output_file(events_path)
+        try:
+            write_dynamic_events_ndjson(events_path, str(result.get("url") or ""), events, truncate=truncate)
+        except OSError as exc:
+            result["events_file_error"] = str(exc)
+        else:
+            result["events"] = []
+            result["events_file"] = str(events_path)
+            return
+    result["events"] = [event.to_dict() for event in events]
+
+
+def write_dynamic_events_ndjson(path: Path, target_url: str, events: Iterable[DynamicEvent], truncate: bool = False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w" if truncate else "a", encoding="utf-8") as handle:
+        for event in events:
+            item = event.to_dict()
+            item["target_url"] = target_url
+            handle.write(json.dumps(item, ensure_ascii=False))
+            handle.write("\n")
+
+
+def _storage_state_local_storage_script(origins: List[dict]) -> str:
+    entries: Dict[str, Dict[str, str]] = {}
+    for item in origins:
+        if not isinstance(item, dict) or not item.get("origin"):
+            continue
+        values = {
+            str(pair.get("name")): str(pair.get("value", ""))
+            for pair in (item.get("localStorage") or [])
+            if isinstance(pair, dict) and pair.get("name") is not None
+        }
+        if values:
+            entries[str(item["origin"]).rstrip("/")] = values
+    if not entries:
+        return ""
+    # 탭마다 한 번만 복원해 스캔 중 앱이 바꾼 값을 다음 이동에서 덮어쓰지 않는다.
+    return """(() => {
+        const entries = %s;
+        const values = entries[location.origin];
+        if (!values) return;
+        try {
+            if (sessionStorage.getItem('__routeApiDiscoveryStorageRestored')) return;
+            for (const [name, value] of Object.entries(values)) localStorage.setItem(name, value);
+            sessionStorage.setItem('__routeApiDiscoveryStorageRestored', '1');
+        } catch (_) {}
+    })();""" % json.dumps(entries)
+
+
+def _apply_storage_state(context, storage_state_path: Path) -> bool:
+    # launch_persistent_context()는 storage_state 인자를 받지 않으므로 쿠키는 직접 넣고
+    # localStorage는 출처별 초기화 스크립트로 복원한다.
+    try:
+        state = json.loads(storage_state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(state, dict):
+        return False
+    applied = False
+    cookies = state.get("cookies")
+    if isinstance(cookies, list) and cookies:
+        context.add_cookies(cookies)
+        applied = True
+    origins = state.get("origins")
+    script = _storage_state_local_storage_script(origins) if isinstance(origins, list) else ""
+    if script:
+        context.add_init_script(script)
+        applied = True
+    return applied
+
+
 def collect_dynamic_candidates_with_playwright(
     url: str,
     scope: UrlScope,
@@ -2079,6 +3408,8 @@ def collect_dynamic_candidates_with_playwright(
     hardcoded_dedupe_keys: Set[Tuple[str, str, str, str, int, int]],
     execution: Optional[ExecutionContext] = None,
     progress: ProgressCallback = None,
+    script_body_store: Optional[Dict[str, str]] = None,
+    detector_stats: Optional[DetectorStatsRegistry] = None,
 ) -> dict:
     ensure_not_cancelled(execution)
     result = {
@@ -2107,6 +3438,9 @@ def collect_dynamic_candidates_with_playwright(
         "candidate_count": 0,
         "api_candidate_count": 0,
         "page_candidate_count": 0,
+        "profile_dir": str(config.dynamic_profile_dir or ""),
+        "storage_state_loaded": False,
+        "storage_state_saved": False,
         "duration_ms": 0,
     }
 
@@ -2118,12 +3452,12 @@ def collect_dynamic_candidates_with_playwright(
             "Playwright가 설치되어 있지 않습니다. `pip install -e .` 후 "
             "`python -m playwright install chromium`을 실행해 주세요."
         )
-        emit_progress(progress, f"동적 분석 건너뜀: {result['error']}")
+        emit_progress(progress, f"동적 분석 건너뜀: {result['error']}", phase="dynamic", url=url)
         return result
 
     started = time.monotonic()
-    events: List[dict] = []
-    request_event_by_id: Dict[int, dict] = {}
+    events: List[DynamicEvent] = []
+    request_event_by_id: Dict[int, DynamicEvent] = {}
     dom_urls: Set[str] = set()
     script_urls: Set[str] = set()
     script_response_urls: Set[str] = set()
@@ -2135,25 +3469,38 @@ def collect_dynamic_candidates_with_playwright(
     action_records: List[dict] = []
     spa_urls: Set[str] = set()
 
-    def remember_event(event: dict) -> Optional[dict]:
+    def remember_event(event: DynamicEvent) -> Optional[DynamicEvent]:
         if len(events) >= config.dynamic_max_events:
             return None
         events.append(event)
         return event
 
     try:
-        emit_progress(progress, f"Playwright 동적 분석 시작: {url}")
+        emit_progress(progress, f"Playwright 동적 분석 시작: {url}", phase="dynamic", url=url)
         with sync_playwright() as playwright:
             launch_options = {"headless": True}
             if config.proxy_url:
                 launch_options["proxy"] = {"server": config.proxy_url}
-            browser = playwright.chromium.launch(**launch_options)
+            context_options = {
+                "user_agent": config.headers.get("User-Agent", USER_AGENT),
+                "ignore_https_errors": not config.verify_ssl,
+            }
+            storage_state_path = Path(config.dynamic_storage_state).expanduser() if config.dynamic_storage_state else None
+            browser = None
+            if config.dynamic_profile_dir is not None:
+                profile_dir = Path(config.dynamic_profile_dir).expanduser()
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                context = playwright.chromium.launch_persistent_context(str(profile_dir), **launch_options, **context_options)
+                if storage_state_path is not None and storage_state_path.is_file():
+                    result["storage_state_loaded"] = _apply_storage_state(context, storage_state_path)
+            else:
+                browser = playwright.chromium.launch(**launch_options)
+                if storage_state_path is not None and storage_state_path.is_file():
+                    context_options["storage_state"] = str(storage_state_path)
+                    result["storage_state_loaded"] = True
+                context = browser.new_context(**context_options)
             try:
                 same_origin_headers = {key: value for key, value in config.headers.items() if key.lower() != "user-agent"}
-                context = browser.new_context(
-                    user_agent=config.headers.get("User-Agent", USER_AGENT),
-                    ignore_https_errors=not config.verify_ssl,
-                )
                 allow_disallowed_dynamic_host = should_allow_disallowed_host(url)
 
                 def guard_request(route) -> None:
@@ -2187,6 +3534,7 @@ def collect_dynamic_candidates_with_playwright(
                         scope=scope,
                         page_bucket=page_bucket,
                         api_bucket=api_bucket,
+                        detector_stats=detector_stats,
                     )
                     collect_hardcoded_findings(
                         text=text,
@@ -2195,6 +3543,7 @@ def collect_dynamic_candidates_with_playwright(
                         source_type=source_type,
                         findings=hardcoded_findings,
                         dedupe_keys=hardcoded_dedupe_keys,
+                        detector_stats=detector_stats,
                     )
                     for child_url in extract_additional_js_urls(text, base_url, scope):
                         script_urls.add(child_url)
@@ -2235,14 +3584,12 @@ def collect_dynamic_candidates_with_playwright(
                         },
                     )
                     event = remember_event(
-                        {
-                            "url": request.url,
-                            "method": request.method,
-                            "resource_type": request.resource_type,
-                            "status_code": None,
-                            "content_type": "",
-                            "source": "request",
-                        }
+                        DynamicEvent(
+                            url=request.url,
+                            method=request.method,
+                            resource_type=request.resource_type,
+                            source="request",
+                        )
                     )
                     if event is not None:
                         request_event_by_id[id(request)] = event
@@ -2252,12 +3599,12 @@ def collect_dynamic_candidates_with_playwright(
                     event = request_event_by_id.get(id(response.request))
                     if event is None:
                         event = remember_event(
-                            {
-                                "url": response.url,
-                                "method": response.request.method,
-                                "resource_type": response.request.resource_type,
-                                "source": "response",
-                            }
+                            DynamicEvent(
+                                url=response.url,
+                                method=response.request.method,
+                                resource_type=response.request.resource_type,
+                                source="response",
+                            )
                         )
                     analysis_event = {
                         "url": response.url,
@@ -2267,8 +3614,7 @@ def collect_dynamic_candidates_with_playwright(
                         "content_type": response.headers.get("content-type", ""),
                     }
                     if event is not None:
-                        event["status_code"] = response.status
-                        event["content_type"] = response.headers.get("content-type", "")
+                        event.record_response(response.status, analysis_event["content_type"])
                     _add_dynamic_candidate(
                         page_bucket,
                         api_bucket,
@@ -2290,20 +3636,24 @@ def collect_dynamic_candidates_with_playwright(
                         body = response.text()
                     except Exception as exc:
                         if event is not None:
-                            event["body_error"] = str(exc)
+                            event.body_error = str(exc)
                         return
                     encoded_length = len(body.encode("utf-8", errors="ignore"))
                     if encoded_length > config.dynamic_script_body_limit:
                         if event is not None:
-                            event["body_error"] = f"body too large ({encoded_length} bytes)"
+                            event.body_error = f"body too large ({encoded_length} bytes)"
                         return
                     http_response_body_count += 1
                     http_body_bytes += encoded_length
                     if event is not None:
-                        event["body_analyzed"] = True
-                        event["body_length"] = encoded_length
+                        event.body_analyzed = True
+                        event.body_length = encoded_length
                     if _is_script_response_event(analysis_event):
                         script_body_bytes += encoded_length
+                        if script_body_store is not None:
+                            # 정적 JS 큐가 js: 출처로 분석하도록 본문만 넘긴다.
+                            script_body_store[response.url] = body
+                            return
                         source_label = f"playwright:response-js:{response.url}"
                         source_type = "dynamic_js_response"
                     else:
@@ -2342,6 +3692,7 @@ def collect_dynamic_candidates_with_playwright(
                             scope=scope,
                             page_bucket=page_bucket,
                             api_bucket=api_bucket,
+                            detector_stats=detector_stats,
                         )
                         collect_hardcoded_findings(
                             text=rendered_html,
@@ -2350,6 +3701,7 @@ def collect_dynamic_candidates_with_playwright(
                             source_type="dynamic_html",
                             findings=hardcoded_findings,
                             dedupe_keys=hardcoded_dedupe_keys,
+                            detector_stats=detector_stats,
                         )
 
                 def run_dynamic_actions() -> None:
@@ -2437,9 +3789,14 @@ def collect_dynamic_candidates_with_playwright(
                     result["title"] = page.title()
                 except Exception:
                     result["title"] = ""
-                context.close()
+                if storage_state_path is not None:
+                    storage_state_path.parent.mkdir(parents=True, exist_ok=True)
+                    context.storage_state(path=str(storage_state_path))
+                    result["storage_state_saved"] = True
             finally:
-                browser.close()
+                context.close()
+                if browser is not None:
+                    browser.close()
 
         script_urls.update(script_response_urls)
         result["dom_urls"] = sorted(dom_urls)
@@ -2459,10 +3816,10 @@ def collect_dynamic_candidates_with_playwright(
         page_count = 0
         api_count = 0
         for event in events:
-            source = f"playwright:{event.get('resource_type') or 'request'}:{event.get('method') or 'GET'}"
+            source = f"playwright:{event.resource_type or 'request'}:{event.method or 'GET'}"
             before_pages = len(page_bucket)
             before_apis = len(api_bucket)
-            if _add_dynamic_candidate(page_bucket, api_bucket, str(event.get("url") or ""), source, scope, event):
+            if _add_dynamic_candidate(page_bucket, api_bucket, event.url, source, scope, event.to_dict()):
                 page_count += max(0, len(page_bucket) - before_pages)
                 api_count += max(0, len(api_bucket) - before_apis)
 
@@ -2480,16 +3837,22 @@ def collect_dynamic_candidates_with_playwright(
                 page_count += max(0, len(page_bucket) - before_pages)
                 api_count += max(0, len(api_bucket) - before_apis)
 
-        result["events"] = events
+        _store_dynamic_events(result, events, config, execution)
         result["candidate_count"] = page_count + api_count
         result["api_candidate_count"] = api_count
         result["page_candidate_count"] = page_count
         result["success"] = True
-        emit_progress(progress, f"Playwright 동적 분석 완료: 네트워크 이벤트 {len(events)}개, 후보 {result['candidate_count']}개")
+        emit_progress(
+            progress,
+            f"Playwright 동적 분석 완료: 네트워크 이벤트 {len(events)}개, 후보 {result['candidate_count']}개",
+            phase="dynamic",
+            url=url,
+            byte_count=http_body_bytes,
+        )
     except ScanCancelled:
         raise
     except Exception as exc:
-        result["events"] = events
+        _store_dynamic_events(result, events, config, execution)
         result["dom_urls"] = sorted(dom_urls)
         result["script_urls"] = sorted(script_urls | script_response_urls)
         result["script_response_urls"] = sorted(script_response_urls)
@@ -2504,7 +3867,7 @@ def collect_dynamic_candidates_with_playwright(
         result["action_count"] = sum(1 for item in action_records if item.get("kind") == "click" and not item.get("error"))
         result["spa_urls"] = sorted(spa_urls)
         result["error"] = str(exc)
-        emit_progress(progress, f"Playwright 동적 분석 실패: {exc}")
+        emit_progress(progress, f"Playwright 동적 분석 실패: {exc}", phase="dynamic", url=url, errors=1)
     finally:
         result["duration_ms"] = int((time.monotonic() - started) * 1000)
 
@@ -2542,10 +3905,25 @@ def _normalize_hardcoded_field_name(field_name: str) -> str:
     return re.sub(r"[^a-z0-9]", "", str(field_name or "").strip().lower())
 
 
-def _line_column_from_offset(text: str, index: int) -> Tuple[int, int]:
+def _line_break_offsets(text: str) -> List[int]:
+    offsets: List[int] = []
+    position = text.find("\n")
+    while position >= 0:
+        offsets.append(position)
+        position = text.find("\n", position + 1)
+    return offsets
+
+
+def _line_column_from_offset(text: str, index: int, line_breaks: Optional[List[int]] = None) -> Tuple[int, int]:
     safe_index = max(0, min(index, len(text)))
-    line = text.count("\n", 0, safe_index) + 1
-    last_line_break = text.rfind("\n", 0, safe_index)
+    if line_breaks is not None:
+        # 미리 구한 줄바꿈 위치로 찾으면 한 줄짜리 큰 번들에서도 탐지마다 앞부분을 다시 세지 않는다.
+        break_count = bisect_left(line_breaks, safe_index)
+        line = break_count + 1
+        last_line_break = line_breaks[break_count - 1] if break_count else -1
+    else:
+        line = text.count("\n", 0, safe_index) + 1
+        last_line_break = text.rfind("\n", 0, safe_index)
     if last_line_break < 0:
         column = safe_index + 1
     else:
@@ -2888,11 +4266,21 @@ def collect_hardcoded_findings(
     source_type: str,
     findings: List[dict],
     dedupe_keys: Set[Tuple[str, str, str, str, int, int]],
+    detector_stats: Optional[DetectorStatsRegistry] = None,
 ) -> None:
     if not text:
         return
 
+    def _record(detector_name: str, started: float, matches: int, findings_before: int) -> None:
+        if detector_stats is not None:
+            detector_stats.record(
+                detector_name, time.perf_counter() - started, len(text), matches, len(findings) - findings_before
+            )
+
+    line_breaks = _line_break_offsets(text)
+    detector_started, findings_before, matches = time.perf_counter(), len(findings), 0
     for match in HARD_CODED_KEY_VALUE_RE.finditer(text):
+        matches += 1
         field_name = (match.group("quoted_key") or match.group("bare_key") or "").strip()
         value = (match.group("value") or "").strip()
         if not field_name or not value:
@@ -2913,7 +4301,7 @@ def collect_hardcoded_findings(
         if category == "person_name" and not _is_probable_person_name(value):
             continue
 
-        line, column = _line_column_from_offset(text, start)
+        line, column = _line_column_from_offset(text, start, line_breaks)
         _append_hardcoded_finding(
             findings=findings,
             dedupe_keys=dedupe_keys,
@@ -2928,16 +4316,19 @@ def collect_hardcoded_findings(
             context=context,
             matched_by="key_context.literal",
         )
+    _record("key_context.literal", detector_started, matches, findings_before)
 
     for pattern_name, pattern in HARD_CODED_SECRET_VALUE_PATTERNS:
+        detector_started, findings_before, matches = time.perf_counter(), len(findings), 0
         for match in pattern.finditer(text):
+            matches += 1
             value = (match.group("value") or "").strip()
             if not value or _looks_like_dynamic_reference(value):
                 continue
             start = match.start("value")
             end = match.end("value")
             context = _extract_context_snippet(text, start, end)
-            line, column = _line_column_from_offset(text, start)
+            line, column = _line_column_from_offset(text, start, line_breaks)
             _append_hardcoded_finding(
                 findings=findings,
                 dedupe_keys=dedupe_keys,
@@ -2952,8 +4343,11 @@ def collect_hardcoded_findings(
                 context=context,
                 matched_by=f"regex.secret.{pattern_name}",
             )
+        _record(f"regex.secret.{pattern_name}", detector_started, matches, findings_before)
 
+    detector_started, findings_before, matches = time.perf_counter(), len(findings), 0
     for match in HARD_CODED_EMAIL_RE.finditer(text):
+        matches += 1
         value = (match.group("value") or "").strip()
         if not value:
             continue
@@ -2962,7 +4356,7 @@ def collect_hardcoded_findings(
         context = _extract_context_snippet(text, start, end)
         if "://" in context and ":" in context.split("@", 1)[0]:
             continue
-        line, column = _line_column_from_offset(text, start)
+        line, column = _line_column_from_offset(text, start, line_breaks)
         _append_hardcoded_finding(
             findings=findings,
             dedupe_keys=dedupe_keys,
@@ -2977,8 +4371,11 @@ def collect_hardcoded_findings(
             context=context,
             matched_by="regex.email",
         )
+    _record("regex.email", detector_started, matches, findings_before)
 
+    detector_started, findings_before, matches = time.perf_counter(), len(findings), 0
     for match in HARD_CODED_PHONE_RE.finditer(text):
+        matches += 1
         value = (match.group("value") or "").strip()
         if not value:
             continue
@@ -2987,7 +4384,7 @@ def collect_hardcoded_findings(
         context = _extract_context_snippet(text, start, end)
         if _looks_like_dynamic_reference(value) or not _is_valid_phone_candidate_with_context(value, field_name="", context=context):
             continue
-        line, column = _line_column_from_offset(text, start)
+        line, column = _line_column_from_offset(text, start, line_breaks)
         _append_hardcoded_finding(
             findings=findings,
             dedupe_keys=dedupe_keys,
@@ -3002,37 +4399,56 @@ def collect_hardcoded_findings(
             context=context,
             matched_by="regex.phone",
         )
+    _record("regex.phone", detector_started, matches, findings_before)
 
 
-def dedupe_hardcoded_findings(rows: List[dict]) -> Tuple[List[dict], int]:
-    deduped: List[dict] = []
-    dedupe_keys: Set[Tuple[str, str, str, str, int, int]] = set()
-    skipped = 0
-    for item in rows:
-        category = str(item.get("category", "") or "")
-        normalized = str(item.get("normalized_value", "") or "")
-        source_type = str(item.get("source_type", "") or "")
-        source_label = str(item.get("source_label", "") or "")
-        line = int(item.get("line", 0) or 0)
-        column = int(item.get("column", 0) or 0)
-        key = (category, normalized, source_type, source_label, line, column)
-        if not category or not normalized:
-            continue
-        if key in dedupe_keys:
-            skipped += 1
-            continue
-        dedupe_keys.add(key)
-        deduped.append(dict(item))
-    deduped.sort(
-        key=lambda finding: (
-            HARD_CODED_SEVERITY_LEVELS.index(str(finding.get("severity", "low")) if str(finding.get("severity", "low")) in HARD_CODED_SEVERITY_LEVELS else "low"),
-            -float(finding.get("confidence", 0.0) or 0.0),
-            str(finding.get("category", "")),
-            str(finding.get("source_url", "")),
-            int(finding.get("line", 0) or 0),
-        )
+def _hardcoded_finding_sort_key(finding: dict) -> Tuple[int, float, str, str, int]:
+    severity = str(finding.get("severity", "low"))
+    return (
+        HARD_CODED_SEVERITY_LEVELS.index(severity if severity in HARD_CODED_SEVERITY_LEVELS else "low"),
+        -float(finding.get("confidence", 0.0) or 0.0),
+        str(finding.get("category", "")),
+        str(finding.get("source_url", "")),
+        int(finding.get("line", 0) or 0),
     )
-    return deduped, skipped
+
+
+class HardcodedFindingAccumulator:
+    """Keeps one copy of each unique finding as target results are merged."""
+
+    def __init__(self) -> None:
+        self._findings: List[dict] = []
+        self._keys: Set[Tuple[str, str, str, str, int, int]] = set()
+        self.skipped = 0
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        for item in rows:
+            category = str(item.get("category", "") or "")
+            normalized = str(item.get("normalized_value", "") or "")
+            if not category or not normalized:
+                continue
+            key = (
+                category,
+                normalized,
+                str(item.get("source_type", "") or ""),
+                str(item.get("source_label", "") or ""),
+                int(item.get("line", 0) or 0),
+                int(item.get("column", 0) or 0),
+            )
+            if key in self._keys:
+                self.skipped += 1
+                continue
+            self._keys.add(key)
+            self._findings.append(dict(item))
+
+    def findings(self) -> List[dict]:
+        return sorted(self._findings, key=_hardcoded_finding_sort_key)
+
+
+def dedupe_hardcoded_findings(rows: List[dict]) -> Tuple[List[dict], int]:
+    accumulator = HardcodedFindingAccumulator()
+    accumulator.extend(rows)
+    return accumulator.findings(), accumulator.skipped
 
 
 def summarize_hardcoded_findings(findings: List[dict]) -> dict:
@@ -3080,6 +4496,13 @@ def build_hardcoded_summary_fields(findings: List[dict]) -> Dict[str, int]:
 def resolve_sensitive_findings(result: dict) -> List[dict]:
     hardcoded_raw = result.get("hardcoded_findings")
     sensitive_raw = result.get("sensitive_findings")
+    if (
+        isinstance(hardcoded_raw, list)
+        and (sensitive_raw is None or sensitive_raw is hardcoded_raw)
+        and all(isinstance(item, dict) for item in hardcoded_raw)
+    ):
+        # v2 결과(별칭 없음)나 같은 리스트를 가리키는 별칭은 걸러낼 항목이 없을 때만 그대로 돌려준다.
+        return hardcoded_raw
     hardcoded = [item for item in hardcoded_raw if isinstance(item, dict)] if isinstance(hardcoded_raw, list) else []
     sensitive = [item for item in sensitive_raw if isinstance(item, dict)] if isinstance(sensitive_raw, list) else []
     if not hardcoded and not sensitive:
@@ -3106,6 +4529,17 @@ def resolve_sensitive_findings(result: dict) -> List[dict]:
     return merged
 
 
+def legacy_result_view(data: dict) -> dict:
+    # 예전 리더를 위해 sensitive_* 별칭을 붙인 얕은 사본을 만든다. 원본과 목록 객체는 공유한다.
+    view = dict(data)
+    for alias, key in LEGACY_RESULT_ALIASES:
+        if key in view:
+            view[alias] = view[key]
+    if isinstance(view.get("results"), list):
+        view["results"] = [legacy_result_view(item) if isinstance(item, dict) else item for item in view["results"]]
+    return view
+
+
 def summary_count(summary: dict, hardcoded_key: str, sensitive_key: str, default: int = 0) -> int:
     if hardcoded_key in summary:
         return int(summary.get(hardcoded_key, default) or 0)
@@ -3125,6 +4559,16 @@ def probe_candidate(
 ) -> ProbeResult:
     # Discovery must not mutate a target. HEAD keeps the common path cheap,
     # while GET covers servers that do not implement HEAD correctly.
+    breaker = execution.host_breaker if execution is not None else None
+    breaker_key = get_origin_key(url) if breaker is not None else ""
+    if breaker is not None and not breaker.allow(breaker_key):
+        return ProbeResult(
+            accessible=False,
+            status_code=None,
+            method=None,
+            error="연결 실패가 반복된 호스트라 프로브를 건너뛰었습니다.",
+            cacheable=False,
+        )
     methods: Iterable[str] = ("HEAD", "GET")
     for method in methods:
         fetch_kwargs = {
@@ -3137,6 +4581,13 @@ def probe_candidate(
         if proxy_url:
             fetch_kwargs["proxy_url"] = proxy_url
         result = fetch_text(url, **fetch_kwargs)
+        if result.connect_failed:
+            # 연결조차 안 되는 호스트에 GET을 다시 보내 봐야 같은 타임아웃만 한 번 더 쓴다.
+            if breaker is not None:
+                breaker.record_failure(breaker_key)
+            return ProbeResult(accessible=False, status_code=None, method=None, error=result.error, cacheable=False)
+        if breaker is not None:
+            breaker.record_success(breaker_key)
         if result.success:
             return ProbeResult(accessible=True, status_code=result.status_code, method=method, error=None, length=result.length)
         if result.status_code in {401, 403}:
@@ -3175,15 +4626,23 @@ def build_result_row(
         probe = ProbeResult(accessible=None, status_code=None, method=None, error="프로브가 생략되었습니다.")
     else:
         probe_headers = request_headers_for_target(headers, header_origin_url, candidate.url) if header_origin_url else headers
-        probe = probe_candidate(
-            candidate.url,
-            kind=kind,
-            timeout=timeout,
-            headers=probe_headers,
-            execution=execution,
-            verify_ssl=verify_ssl,
-            proxy_url=proxy_url,
-        )
+
+        def run_probe() -> ProbeResult:
+            return probe_candidate(
+                candidate.url,
+                kind=kind,
+                timeout=timeout,
+                headers=probe_headers,
+                execution=execution,
+                verify_ssl=verify_ssl,
+                proxy_url=proxy_url,
+            )
+
+        probe_cache = execution.probe_cache if execution is not None else None
+        if probe_cache is None:
+            probe = run_probe()
+        else:
+            probe = probe_cache.get_or_probe(ProbeCache.key_for(candidate.url, probe_headers, verify_ssl, proxy_url), run_probe)
     return {
         "path": candidate.path,
         "url": candidate.url,
@@ -3192,9 +4651,9 @@ def build_result_row(
         "probe_method": probe.method,
         "probe_error": probe.error,
         "length": probe.length,
-        "sources": sorted(candidate.sources),
+        "sources": candidate.source_labels(),
         "confidence": candidate.confidence,
-        "detectors": sorted(candidate.detectors),
+        "detectors": candidate.detector_labels(),
     }
 
 
@@ -3209,9 +4668,156 @@ def filter_rows_by_min_confidence(rows: List[dict], min_confidence: str) -> List
     ]
 
 
-def build_result_rows(
-    bucket: Dict[str, Candidate],
-    kind: str,
+def _emit_probe_progress(
+    progress: ProgressCallback,
+    message: str,
+    phase: str,
+    completed: int,
+    total: int,
+    row: dict,
+    skip_probe: bool,
+) -> None:
+    emit_progress(
+        progress,
+        message,
+        phase=phase,
+        completed=completed,
+        total=total,
+        url=str(row.get("url") or ""),
+        byte_count=int(row.get("length") or 0),
+        requests=0 if skip_probe else 1,
+        errors=1 if not skip_probe and row.get("status_code") is None else 0,
+    )
+
+
+class FairProbeScheduler:
+    """Hands out queued probes round-robin across hosts and, per host, across lanes.
+
+    host_limit caps in-flight probes per host. With strict=False the cap is a
+    preference only: when every host with queued work is at its cap, the least
+    busy one is used anyway so workers never sit idle.
+    """
+
+    def __init__(self, host_limit: int, strict: bool = False) -> None:
+        self.host_limit = max(1, host_limit)
+        self.strict = strict
+        self._queues: Dict[str, Dict[str, Deque[object]]] = {}
+        self._lane_order: Dict[str, Deque[str]] = {}
+        self._rotation: Deque[str] = deque()
+        self._in_flight: Dict[str, int] = {}
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def add(self, host: str, lane: str, item: object) -> None:
+        lanes = self._queues.get(host)
+        if lanes is None:
+            lanes = self._queues[host] = {}
+            self._lane_order[host] = deque()
+            self._rotation.append(host)
+        queue = lanes.get(lane)
+        if queue is None:
+            queue = lanes[lane] = deque()
+            self._lane_order[host].append(lane)
+        queue.append(item)
+        self._pending += 1
+
+    def in_flight(self, host: str) -> int:
+        return self._in_flight.get(host, 0)
+
+    def next_item(self) -> Optional[Tuple[str, object]]:
+        host = self._pick_host()
+        if host is None:
+            return None
+        lane_order = self._lane_order[host]
+        lane = lane_order[0]
+        lane_order.rotate(-1)
+        lanes = self._queues[host]
+        item = lanes[lane].popleft()
+        if not lanes[lane]:
+            del lanes[lane]
+            lane_order.remove(lane)
+            if not lane_order:
+                del self._queues[host]
+                del self._lane_order[host]
+                self._rotation.remove(host)
+        self._in_flight[host] = self.in_flight(host) + 1
+        self._pending -= 1
+        return host, item
+
+    def release(self, host: str) -> None:
+        remaining = self.in_flight(host) - 1
+        if remaining > 0:
+            self._in_flight[host] = remaining
+        else:
+            self._in_flight.pop(host, None)
+
+    def _pick_host(self) -> Optional[str]:
+        for _ in range(len(self._rotation)):
+            host = self._rotation[0]
+            self._rotation.rotate(-1)
+            if self.in_flight(host) < self.host_limit:
+                return host
+        if self.strict or not self._rotation:
+            return None
+        host = min(self._rotation, key=self.in_flight)
+        self._rotation.remove(host)
+        self._rotation.append(host)
+        return host
+
+
+def resolve_host_probe_limit(max_workers: int, max_host_workers: int, host_count: int) -> Tuple[int, bool]:
+    # 명시한 값은 엄격한 상한이고, 자동(0)일 때는 호스트가 여럿이면 절반을 선호 상한으로 둔다.
+    if max_host_workers > 0:
+        return max_host_workers, True
+    if host_count <= 1:
+        return max(1, max_workers), False
+    return max(1, math.ceil(max_workers / 2)), False
+
+
+def prefetch_dns(
+    buckets: Sequence[Dict[str, Candidate]],
+    execution: Optional[ExecutionContext],
+    proxy_url: str = "",
+) -> int:
+    dns_cache = execution.dns_cache if execution is not None else None
+    # 프록시를 쓰면 대상 이름은 프록시가 해석하므로 미리 해석할 필요가 없다.
+    if dns_cache is None or str(proxy_url or "").strip():
+        return 0
+    origins = {get_origin_key(candidate.url) for bucket in buckets for candidate in bucket.values()}
+    addresses: Set[Tuple[str, int]] = set()
+    for origin in origins:
+        _, hostname, port = get_url_origin(origin)
+        # IP 리터럴은 해석할 것이 없고, 차단 대상 호스트는 미리 조회하지 않는다.
+        if not hostname or port is None or _is_disallowed_host(hostname):
+            continue
+        try:
+            ipaddress.ip_address(hostname)
+        except ValueError:
+            addresses.add((hostname, port))
+    if not addresses:
+        return 0
+
+    def resolve(address: Tuple[str, int]) -> None:
+        try:
+            dns_cache.resolve(*address)
+        except (OSError, ValueError):
+            pass  # 실패도 부정 캐시에 남으므로 프로브 단계에서 다시 기다리지 않는다.
+
+    ordered = sorted(addresses)
+    if execution.max_workers > 1 and len(ordered) > 1:
+        executor = execution.probe_pool.executor(execution.max_workers)
+        concurrent.futures.wait([executor.submit(resolve, address) for address in ordered])
+    else:
+        for address in ordered:
+            resolve(address)
+    dns_cache.record_prefetch(len(ordered))
+    return len(ordered)
+
+
+def build_probe_rows(
+    buckets: Sequence[Tuple[str, Dict[str, Candidate]]],
     timeout: float,
     skip_probe: bool,
     headers: Optional[Dict[str, str]] = None,
@@ -3220,19 +4826,30 @@ def build_result_rows(
     progress: ProgressCallback = None,
     verify_ssl: bool = True,
     proxy_url: str = "",
-) -> List[dict]:
-    ordered_candidates = sorted(bucket.values(), key=lambda item: (item.path, item.url))
-    total = len(ordered_candidates)
-    kind_label = "페이지" if kind == "page" else "API"
+    on_kind_done: Optional[Callable[[str], None]] = None,
+) -> Dict[str, List[dict]]:
+    ordered: Dict[str, List[Candidate]] = {
+        kind: sorted(bucket.values(), key=lambda item: (item.path, item.url))
+        for kind, bucket in buckets
+    }
+    totals = {kind: len(candidates) for kind, candidates in ordered.items()}
+    total = sum(totals.values())
     max_workers = max(1, execution.max_workers) if execution is not None else 1
 
+    def kind_label(kind: str) -> str:
+        return "페이지" if kind == "page" else "API"
+
+    def finish_kind(kind: str) -> None:
+        if on_kind_done is not None:
+            on_kind_done(kind)
+
     if skip_probe or total <= 1 or max_workers <= 1:
-        rows: List[dict] = []
-        for index, candidate in enumerate(ordered_candidates, start=1):
-            ensure_not_cancelled(execution)
-            emit_progress(progress, f"{kind_label} 후보 확인 중 {index}/{total}: {candidate.path}")
-            rows.append(
-                build_result_row(
+        serial_rows: Dict[str, List[dict]] = {}
+        for kind, candidates in ordered.items():
+            rows: List[dict] = []
+            for index, candidate in enumerate(candidates, start=1):
+                ensure_not_cancelled(execution)
+                row = build_result_row(
                     candidate,
                     kind=kind,
                     timeout=timeout,
@@ -3243,41 +4860,59 @@ def build_result_rows(
                     verify_ssl=verify_ssl,
                     proxy_url=proxy_url,
                 )
-            )
-        return rows
-
-    indexed_rows: List[Optional[dict]] = [None] * total
-    completed = 0
+                rows.append(row)
+                _emit_probe_progress(progress, f"{kind_label(kind)} 후보 확인 중 {index}/{totals[kind]}: {candidate.path}", f"{kind}_probe", index, totals[kind], row, skip_probe)
+            serial_rows[kind] = rows
+            finish_kind(kind)
+        return serial_rows
+
+    # 호스트별 대기열을 돌아가며 꺼내 한 호스트에 작업자가 몰리지 않게 한다.
+    queued = [
+        (get_origin_key(candidate.url), kind, index, candidate)
+        for kind, candidates in ordered.items()
+        for index, candidate in enumerate(candidates)
+    ]
+    host_limit, strict = resolve_host_probe_limit(
+        max_workers,
+        execution.max_host_workers if execution is not None else 0,
+        len({host for host, *_ in queued}),
+    )
+    scheduler = FairProbeScheduler(host_limit, strict=strict)
+    for host, kind, index, candidate in queued:
+        scheduler.add(host, kind, (kind, index, candidate))
+
+    indexed_rows: Dict[str, List[Optional[dict]]] = {kind: [None] * count for kind, count in totals.items()}
+    completed = {kind: 0 for kind in ordered}
+    for kind, count in totals.items():
+        if count == 0:
+            finish_kind(kind)
     worker_count = min(max_workers, total)
-    executor_pool = concurrent.futures.ThreadPoolExecutor(max_workers=worker_count)
-    pending_futures: Dict[concurrent.futures.Future[dict], Tuple[int, str]] = {}
-    candidate_iter = iter(enumerate(ordered_candidates))
+    executor_pool = execution.probe_pool.executor(max_workers)
+    pending_futures: Dict[concurrent.futures.Future[dict], Tuple[str, str, int, str]] = {}
 
-    def submit_next() -> bool:
-        try:
-            index, candidate = next(candidate_iter)
-        except StopIteration:
-            return False
-        future = executor_pool.submit(
-            build_result_row,
-            candidate,
-            kind,
-            timeout,
-            skip_probe,
-            headers,
-            header_origin_url,
-            execution,
-            verify_ssl,
-            proxy_url,
-        )
-        pending_futures[future] = (index, candidate.path)
-        return True
+    def fill_workers() -> None:
+        while len(pending_futures) < worker_count:
+            picked = scheduler.next_item()
+            if picked is None:
+                return
+            host, (kind, index, candidate) = picked
+            future = executor_pool.submit(
+                build_result_row,
+                candidate,
+                kind,
+                timeout,
+                skip_probe,
+                headers,
+                header_origin_url,
+                execution,
+                verify_ssl,
+                proxy_url,
+            )
+            pending_futures[future] = (host, kind, index, candidate.path)
 
     try:
-        for _ in range(worker_count):
-            if not submit_next():
-                break
-
+        ensure_not_cancelled(execution)
+        fill_workers()
         while pending_futures:
             ensure_not_cancelled(execution)
             done, _ = concurrent.futures.wait(
@@ -3288,18 +4923,48 @@ def build_result_rows(
             if not done:
                 continue
             for future in done:
-                index, candidate_path = pending_futures.pop(future)
-                indexed_rows[index] = future.result()
-                completed += 1
-                emit_progress(progress, f"{kind_label} 후보 확인 중 {completed}/{total}: {candidate_path}")
-                submit_next()
-    except Exception:
+                host, kind, index, candidate_path = pending_futures.pop(future)
+                scheduler.release(host)
+                row = indexed_rows[kind][index] = future.result()
+                completed[kind] += 1
+                _emit_probe_progress(progress, f"{kind_label(kind)} 후보 확인 중 {completed[kind]}/{totals[kind]}: {candidate_path}", f"{kind}_probe", completed[kind], totals[kind], row, skip_probe)
+                if completed[kind] == totals[kind]:
+                    finish_kind(kind)
+            fill_workers()
+    except BaseException:
+        # 풀은 다음 대상이 이어서 쓰므로 닫지 않고, 이미 실행 중인 프로브만 끝날 때까지 기다린다.
         for future in pending_futures:
             future.cancel()
+        concurrent.futures.wait(tuple(pending_futures))
         raise
-    finally:
-        executor_pool.shutdown(wait=True, cancel_futures=False)
-    return [row for row in indexed_rows if row is not None]
+    return {kind: [row for row in rows if row is not None] for kind, rows in indexed_rows.items()}
+
+
+def build_result_rows(
+    bucket: Dict[str, Candidate],
+    kind: str,
+    timeout: float,
+    skip_probe: bool,
+    headers: Optional[Dict[str, str]] = None,
+    header_origin_url: str = "",
+    execution: Optional[ExecutionContext] = None,
+    progress: ProgressCallback = None,
+    verify_ssl: bool = True,
+    proxy_url: str = "",
+) -> List[dict]:
+    return build_probe_rows(
+        [(kind, bucket)],
+        timeout=timeout,
+        skip_probe=skip_probe,
+        headers=headers,
+        header_origin_url=header_origin_url,
+        execution=execution,
+        progress=progress,
+        verify_ssl=verify_ssl,
+        proxy_url=proxy_url,
+    )[kind]
+
+
 def filter_candidate_bucket_by_path(
     bucket: Dict[str, Candidate],
     known_paths: Set[str],
@@ -3313,51 +4978,63 @@ def filter_candidate_bucket_by_path(
             continue
         existing = filtered.get(key)
         if existing is not None:
-            existing.sources.update(candidate.sources)
+            existing.merge_sources(candidate)
             skipped += 1
             continue
         filtered[key] = candidate
     return filtered, skipped
 
 
+class JsRowAccumulator:
+    """Merges JS file rows by URL as target results arrive."""
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, dict] = {}
+        self.skipped = 0
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        for item in rows:
+            url = str(item.get("url", "") or "")
+            if not url:
+                continue
+            existing = self._rows.get(url)
+            if existing is None:
+                self._rows[url] = dict(item)
+                continue
+            self.skipped += 1
+            existing["success"] = bool(existing.get("success")) or bool(item.get("success"))
+            if existing.get("status_code") is None and item.get("status_code") is not None:
+                existing["status_code"] = item.get("status_code")
+            if not existing.get("error") and item.get("error"):
+                existing["error"] = item.get("error")
+            if not existing.get("saved_path") and item.get("saved_path"):
+                existing["saved_path"] = item.get("saved_path")
+            if not existing.get("save_error") and item.get("save_error"):
+                existing["save_error"] = item.get("save_error")
+            try:
+                existing_depth = int(existing.get("depth", 0) or 0)
+                item_depth = int(item.get("depth", 0) or 0)
+                existing["depth"] = min(existing_depth, item_depth)
+            except (TypeError, ValueError):
+                pass
+            try:
+                existing_length = int(existing.get("length", 0) or 0)
+                item_length = int(item.get("length", 0) or 0)
+                existing["length"] = max(existing_length, item_length)
+            except (TypeError, ValueError):
+                pass
+
+    def rows(self) -> List[dict]:
+        return sorted(
+            self._rows.values(),
+            key=lambda item: (int(item.get("depth", 0) or 0), str(item.get("url", ""))),
+        )
+
+
 def dedupe_js_rows_by_url(rows: List[dict]) -> Tuple[List[dict], int]:
-    deduped_by_url: Dict[str, dict] = {}
-    skipped = 0
-    for item in rows:
-        url = str(item.get("url", "") or "")
-        if not url:
-            continue
-        existing = deduped_by_url.get(url)
-        if existing is None:
-            deduped_by_url[url] = dict(item)
-            continue
-        skipped += 1
-        existing["success"] = bool(existing.get("success")) or bool(item.get("success"))
-        if existing.get("status_code") is None and item.get("status_code") is not None:
-            existing["status_code"] = item.get("status_code")
-        if not existing.get("error") and item.get("error"):
-            existing["error"] = item.get("error")
-        if not existing.get("saved_path") and item.get("saved_path"):
-            existing["saved_path"] = item.get("saved_path")
-        if not existing.get("save_error") and item.get("save_error"):
-            existing["save_error"] = item.get("save_error")
-        try:
-            existing_depth = int(existing.get("depth", 0) or 0)
-            item_depth = int(item.get("depth", 0) or 0)
-            existing["depth"] = min(existing_depth, item_depth)
-        except (TypeError, ValueError):
-            pass
-        try:
-            existing_length = int(existing.get("length", 0) or 0)
-            item_length = int(item.get("length", 0) or 0)
-            existing["length"] = max(existing_length, item_length)
-        except (TypeError, ValueError):
-            pass
-    deduped_rows = sorted(
-        deduped_by_url.values(),
-        key=lambda item: (int(item.get("depth", 0) or 0), str(item.get("url", ""))),
-    )
-    return deduped_rows, skipped
+    accumulator = JsRowAccumulator()
+    accumulator.extend(rows)
+    return accumulator.rows(), accumulator.skipped
 
 
 def probe_row_rank(row: dict) -> int:
@@ -3377,32 +5054,56 @@ def probe_row_rank(row: dict) -> int:
     return rank
 
 
+class ResultRowAccumulator:
+    """Merges page/API rows by candidate identity as target results arrive.
+
+    The row kept for an identity is the best-probed one; ties go to the smallest
+    (path, url), which matches sorting every row first and keeping the earliest.
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, dict] = {}
+        self._order_keys: Dict[str, Tuple[str, str]] = {}
+        self._sources: Dict[str, Set[str]] = {}
+        self.skipped = 0
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        for item in rows:
+            raw_path = str(item.get("path", "") or "")
+            raw_url = str(item.get("url", "") or "")
+            if not raw_path and not raw_url:
+                continue
+            key = candidate_identity(raw_url or raw_path)
+            order_key = (raw_path, raw_url)
+            sources = item.get("sources", []) or []
+            existing = self._rows.get(key)
+            if existing is None:
+                self._store(key, item, raw_path or raw_url, order_key)
+                self._sources[key] = set(sources)
+                continue
+            self.skipped += 1
+            self._sources[key].update(sources)
+            rank = probe_row_rank(item)
+            existing_rank = probe_row_rank(existing)
+            if rank > existing_rank or (rank == existing_rank and order_key < self._order_keys[key]):
+                self._store(key, item, raw_path or raw_url, order_key)
+
+    def _store(self, key: str, item: dict, path_source: str, order_key: Tuple[str, str]) -> None:
+        row = dict(item)
+        row["path"] = normalize_path(path_source)
+        self._rows[key] = row
+        self._order_keys[key] = order_key
+
+    def rows(self) -> List[dict]:
+        for key, row in self._rows.items():
+            row["sources"] = sorted(self._sources[key])
+        return sorted(self._rows.values(), key=lambda row: (str(row.get("path", "")), str(row.get("url", ""))))
+
+
 def dedupe_result_rows_by_path(rows: List[dict]) -> Tuple[List[dict], int]:
-    deduped_by_key: Dict[str, dict] = {}
-    skipped = 0
-    for item in sorted(rows, key=lambda row: (str(row.get("path", "")), str(row.get("url", "")))):
-        raw_path = str(item.get("path", "") or "")
-        raw_url = str(item.get("url", "") or "")
-        if not raw_path and not raw_url:
-            continue
-        path = normalize_path(raw_path or raw_url)
-        key = candidate_identity(raw_url or raw_path)
-        normalized = dict(item)
-        normalized["path"] = path
-        normalized["sources"] = sorted(set(normalized.get("sources", []) or []))
-        existing = deduped_by_key.get(key)
-        if existing is None:
-            deduped_by_key[key] = normalized
-            continue
-        skipped += 1
-        merged_sources = sorted(set(existing.get("sources", []) or []).union(normalized.get("sources", []) or []))
-        if probe_row_rank(normalized) > probe_row_rank(existing):
-            normalized["sources"] = merged_sources
-            deduped_by_key[key] = normalized
-            continue
-        existing["sources"] = merged_sources
-    deduped_rows = sorted(deduped_by_key.values(), key=lambda row: (str(row.get("path", "")), str(row.get("url", ""))))
-    return deduped_rows, skipped
+    accumulator = ResultRowAccumulator()
+    accumulator.extend(rows)
+    return accumulator.rows(), accumulator.skipped
 
 
 def apply_recursive_metadata(
@@ -3433,6 +5134,222 @@ def apply_recursive_metadata(
     return enriched
 
 
+_DYNAMIC_COUNT_FIELDS = (
+    "script_response_count",
+    "script_body_bytes",
+    "http_request_count",
+    "http_response_body_count",
+    "http_body_bytes",
+    "blocked_request_count",
+    "action_count",
+    "candidate_count",
+    "api_candidate_count",
+    "page_candidate_count",
+)
+_DYNAMIC_URL_SET_FIELDS = ("script_response_urls", "blocked_request_urls", "spa_urls")
+
+
+class DynamicAnalysisAccumulator:
+    """Sums per-target dynamic analysis blocks in one pass per block."""
+
+    def __init__(self) -> None:
+        self.blocks: List[dict] = []
+        self.success = False
+        self.event_count = 0
+        self.spa_url_total = 0
+        self.counts: Dict[str, int] = {name: 0 for name in _DYNAMIC_COUNT_FIELDS}
+        self.url_sets: Dict[str, Set[str]] = {name: set() for name in _DYNAMIC_URL_SET_FIELDS}
+
+    def add(self, block: dict) -> None:
+        self.blocks.append(block)
+        self.success = self.success or bool(block.get("success"))
+        events = block.get("events", []) or []
+        self.event_count += int(block.get("event_count", len(events)) or 0)
+        for name in _DYNAMIC_COUNT_FIELDS:
+            self.counts[name] += int(block.get(name, 0) or 0)
+        for name in _DYNAMIC_URL_SET_FIELDS:
+            self.url_sets[name].update(block.get(name, []) or [])
+        self.spa_url_total += len(block.get("spa_urls", []) or [])
+
+    def combined(self, enabled: bool) -> dict:
+        if len(self.blocks) == 1:
+            return self.blocks[0]
+        counts = self.counts
+        return {
+            "enabled": enabled,
+            "success": self.success,
+            "results": self.blocks,
+            "events": [event for block in self.blocks for event in (block.get("events", []) or [])],
+            "event_count": self.event_count,
+            "script_response_urls": sorted(self.url_sets["script_response_urls"]),
+            "script_response_count": counts["script_response_count"],
+            "script_body_bytes": counts["script_body_bytes"],
+            "http_request_count": counts["http_request_count"],
+            "http_response_body_count": counts["http_response_body_count"],
+            "http_body_bytes": counts["http_body_bytes"],
+            "blocked_request_count": counts["blocked_request_count"],
+            "blocked_request_urls": sorted(self.url_sets["blocked_request_urls"]),
+            "actions": [action for block in self.blocks for action in (block.get("actions", []) or [])],
+            "action_count": counts["action_count"],
+            "spa_urls": sorted(self.url_sets["spa_urls"]),
+            "candidate_count": counts["candidate_count"],
+            "api_candidate_count": counts["api_candidate_count"],
+            "page_candidate_count": counts["page_candidate_count"],
+        }
+
+    def summary_fields(self) -> Dict[str, int]:
+        counts = self.counts
+        return {
+            "dynamic_events": self.event_count,
+            "dynamic_candidates": counts["candidate_count"],
+            "dynamic_api_candidates": counts["api_candidate_count"],
+            "dynamic_page_candidates": counts["page_candidate_count"],
+            "dynamic_script_responses": counts["script_response_count"],
+            "dynamic_script_body_bytes": counts["script_body_bytes"],
+            "dynamic_http_requests": counts["http_request_count"],
+            "dynamic_http_response_bodies": counts["http_response_body_count"],
+            "dynamic_http_body_bytes": counts["http_body_bytes"],
+            "dynamic_blocked_requests": counts["blocked_request_count"],
+            "dynamic_actions": counts["action_count"],
+            "dynamic_spa_urls": self.spa_url_total,
+        }
+
+
+class ScanResultMerger:
+    """Folds each target's result into the combined scan result as soon as it completes.
+
+    Only unique rows are retained, so discover() does not have to keep every
+    per-target result alive until the end of a recursive scan.
+    """
+
+    def __init__(self, config: Config, root_url: str) -> None:
+        self.config = config
+        self.root_url = root_url
+        self.final_url: Optional[str] = None
+        self.js = JsRowAccumulator()
+        self.pages = ResultRowAccumulator()
+        self.apis = ResultRowAccumulator()
+        self.findings = HardcodedFindingAccumulator()
+        self.dynamic = DynamicAnalysisAccumulator()
+        self.discovered_js_urls: Set[str] = set()
+        self.scan_records: List[dict] = []
+        self.detector_stats_blocks: List[dict] = []
+        self.performance_blocks: List[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.scan_records)
+
+    def add(self, target_url: str, depth: int, result: dict) -> None:
+        if self.final_url is None:
+            self.final_url = result.get("final_url", self.root_url)
+        self.js.extend(result.get("js_files", []))
+        self.discovered_js_urls.update(result.get("js_discovered_urls", []))
+        self.pages.extend(result.get("all_pages", []))
+        self.apis.extend(result.get("all_apis", []))
+        self.findings.extend(result.get("hardcoded_findings", []) or [])
+        if result.get("dynamic_analysis"):
+            self.dynamic.add(result.get("dynamic_analysis") or {})
+        scan_record = {
+            "target_url": target_url,
+            "depth": depth,
+            "status": "success",
+            "summary": result.get("summary", {}),
+        }
+        if "performance" in result:
+            scan_record["performance"] = result["performance"]
+            self.performance_blocks.append(result["performance"])
+        if "detector_stats" in result:
+            if "performance" in result:
+                # 대상별 performance.detectors_ref가 가리킬 표를 같은 레코드에 둔다.
+                scan_record["detector_stats"] = result["detector_stats"]
+            self.detector_stats_blocks.append(result["detector_stats"])
+        self.scan_records.append(scan_record)
+
+    def build(self, state: RecursiveDiscoveryState, failed_targets: List[dict]) -> dict:
+        config = self.config
+        root_url = self.root_url
+        scan_records = list(self.scan_records)
+        for item in failed_targets:
+            scan_records.append(
+                {
+                    "target_url": item.get("target_url"),
+                    "depth": item.get("depth"),
+                    "status": "error",
+                    "error": item.get("error"),
+                }
+            )
+
+        combined_js = self.js.rows()
+        combined_pages = self.pages.rows()
+        combined_apis = self.apis.rows()
+        combined_hardcoded_findings = self.findings.findings()
+        combined_hardcoded_summary = summarize_hardcoded_findings(combined_hardcoded_findings)
+        combined_hardcoded_summary_fields = build_hardcoded_summary_fields(combined_hardcoded_findings)
+        state.skipped_js_duplicates += self.js.skipped
+        state.skipped_page_duplicates += self.pages.skipped
+        state.skipped_api_duplicates += self.apis.skipped
+
+        merged = {
+            "input_url": root_url,
+            "final_url": self.final_url if self.final_url is not None else root_url,
+            "scanned_at": datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds"),
+            "origin": get_origin_key(root_url),
+            "probe_skipped": config.skip_probe,
+            "include_subdomains": config.include_subdomains,
+            "excluded_subdomains": list(config.excluded_subdomains),
+            "max_js_files": config.max_js_files,
+            "max_depth": config.max_depth,
+            "max_workers": config.max_workers,
+            "max_host_workers": config.max_host_workers,
+            "request_delay": config.request_delay,
+            "probe_cache_ttl": config.probe_cache_ttl,
+            "connect_timeout": config.connect_timeout,
+            "host_failure_threshold": config.host_failure_threshold,
+            "dns_cache_ttl": config.dns_cache_ttl,
+            "proxy_url": redact_url_credentials(config.proxy_url),
+            "dynamic_analysis_enabled": config.dynamic_analysis,
+            "dynamic_wait": config.dynamic_wait,
+            "dynamic_max_events": config.dynamic_max_events,
+            "dynamic_collect_script_bodies": config.dynamic_collect_script_bodies,
+            "dynamic_script_body_limit": config.dynamic_script_body_limit,
+            "dynamic_action_scan": config.dynamic_action_scan,
+            "dynamic_action_limit": config.dynamic_action_limit,
+            "dynamic_scroll_steps": config.dynamic_scroll_steps,
+            "dynamic_recursive_limit": config.dynamic_recursive_limit,
+            "dynamic_profile_dir": str(config.dynamic_profile_dir or ""),
+            "dynamic_storage_state": str(config.dynamic_storage_state or ""),
+            "dynamic_events_file": str(config.dynamic_events_file or ""),
+            "profile": config.profile,
+            "detector_stats_enabled": config.detector_stats or config.profile,
+            "dynamic_analysis": self.dynamic.combined(config.dynamic_analysis),
+            "js_output_dir": str(normalize_js_output_dir(config.js_output_dir) or ""),
+            "js_files": combined_js,
+            "accessible_pages": [item for item in combined_pages if item.get("accessible") is True],
+            "accessible_apis": [item for item in combined_apis if item.get("accessible") is True],
+            "all_pages": combined_pages,
+            "all_apis": combined_apis,
+            "schema_version": RESULT_SCHEMA_VERSION,
+            "hardcoded_findings": combined_hardcoded_findings,
+            "hardcoded_summary": combined_hardcoded_summary,
+            "js_discovered_urls": sorted(self.discovered_js_urls),
+            "summary": {
+                "js_discovered": len(self.discovered_js_urls),
+                "js_fetched": len(combined_js),
+                "js_saved": sum(1 for item in combined_js if item.get("saved_path")),
+                "js_reused_dynamic": sum(1 for item in combined_js if item.get("reused_dynamic_body")),
+                **self.dynamic.summary_fields(),
+                "page_count": len(combined_pages),
+                "api_count": len(combined_apis),
+                **combined_hardcoded_summary_fields,
+            },
+        }
+        if config.detector_stats or config.profile:
+            merged["detector_stats"] = merge_detector_stats(self.detector_stats_blocks)
+        if config.profile:
+            merged["performance"] = merge_performance_blocks(self.performance_blocks)
+        return apply_recursive_metadata(merged, config, state, failed_targets, scan_records)
+
+
 def combine_recursive_scan_results(
     config: Config,
     root_url: str,
@@ -3440,126 +5357,10 @@ def combine_recursive_scan_results(
     state: RecursiveDiscoveryState,
     failed_targets: List[dict],
 ) -> dict:
-    combined_js_raw: List[dict] = []
-    combined_discovered_js_urls: Set[str] = set()
-    combined_pages_raw: List[dict] = []
-    combined_apis_raw: List[dict] = []
-    combined_hardcoded_raw: List[dict] = []
-    combined_dynamic_raw: List[dict] = []
-    scan_records: List[dict] = []
-
+    merger = ScanResultMerger(config, root_url)
     for target_url, depth, result in successful_results:
-        combined_js_raw.extend(result.get("js_files", []))
-        combined_discovered_js_urls.update(result.get("js_discovered_urls", []))
-        combined_pages_raw.extend(result.get("all_pages", []))
-        combined_apis_raw.extend(result.get("all_apis", []))
-        combined_hardcoded_raw.extend(result.get("hardcoded_findings", []) or [])
-        if result.get("dynamic_analysis"):
-            combined_dynamic_raw.append(result.get("dynamic_analysis") or {})
-        scan_records.append(
-            {
-                "target_url": target_url,
-                "depth": depth,
-                "status": "success",
-                "summary": result.get("summary", {}),
-            }
-        )
-
-    for item in failed_targets:
-        scan_records.append(
-            {
-                "target_url": item.get("target_url"),
-                "depth": item.get("depth"),
-                "status": "error",
-                "error": item.get("error"),
-            }
-        )
-
-    combined_js, skipped_combined_js = dedupe_js_rows_by_url(combined_js_raw)
-    combined_pages, skipped_combined_pages = dedupe_result_rows_by_path(combined_pages_raw)
-    combined_apis, skipped_combined_apis = dedupe_result_rows_by_path(combined_apis_raw)
-    combined_hardcoded_findings, _ = dedupe_hardcoded_findings(combined_hardcoded_raw)
-    combined_hardcoded_summary = summarize_hardcoded_findings(combined_hardcoded_findings)
-    combined_hardcoded_summary_fields = build_hardcoded_summary_fields(combined_hardcoded_findings)
-    state.skipped_js_duplicates += skipped_combined_js
-    state.skipped_page_duplicates += skipped_combined_pages
-    state.skipped_api_duplicates += skipped_combined_apis
-
-    merged = {
-        "input_url": root_url,
-        "final_url": successful_results[0][2].get("final_url", root_url),
-        "scanned_at": datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds"),
-        "origin": get_origin_key(root_url),
-        "probe_skipped": config.skip_probe,
-        "include_subdomains": config.include_subdomains,
-        "excluded_subdomains": list(config.excluded_subdomains),
-        "max_js_files": config.max_js_files,
-        "max_depth": config.max_depth,
-        "max_workers": config.max_workers,
-        "request_delay": config.request_delay,
-        "proxy_url": redact_url_credentials(config.proxy_url),
-        "dynamic_analysis_enabled": config.dynamic_analysis,
-        "dynamic_wait": config.dynamic_wait,
-        "dynamic_max_events": config.dynamic_max_events,
-        "dynamic_collect_script_bodies": config.dynamic_collect_script_bodies,
-        "dynamic_script_body_limit": config.dynamic_script_body_limit,
-        "dynamic_action_scan": config.dynamic_action_scan,
-        "dynamic_action_limit": config.dynamic_action_limit,
-        "dynamic_scroll_steps": config.dynamic_scroll_steps,
-        "dynamic_recursive_limit": config.dynamic_recursive_limit,
-        "dynamic_analysis": combined_dynamic_raw[0] if len(combined_dynamic_raw) == 1 else {
-            "enabled": config.dynamic_analysis,
-            "success": any(item.get("success") for item in combined_dynamic_raw),
-            "results": combined_dynamic_raw,
-            "events": [event for item in combined_dynamic_raw for event in (item.get("events", []) or [])],
-            "script_response_urls": sorted({url for item in combined_dynamic_raw for url in (item.get("script_response_urls", []) or [])}),
-            "script_response_count": sum(int(item.get("script_response_count", 0) or 0) for item in combined_dynamic_raw),
-            "script_body_bytes": sum(int(item.get("script_body_bytes", 0) or 0) for item in combined_dynamic_raw),
-            "http_request_count": sum(int(item.get("http_request_count", 0) or 0) for item in combined_dynamic_raw),
-            "http_response_body_count": sum(int(item.get("http_response_body_count", 0) or 0) for item in combined_dynamic_raw),
-            "http_body_bytes": sum(int(item.get("http_body_bytes", 0) or 0) for item in combined_dynamic_raw),
-            "blocked_request_count": sum(int(item.get("blocked_request_count", 0) or 0) for item in combined_dynamic_raw),
-            "blocked_request_urls": sorted({url for item in combined_dynamic_raw for url in (item.get("blocked_request_urls", []) or [])}),
-            "actions": [action for item in combined_dynamic_raw for action in (item.get("actions", []) or [])],
-            "action_count": sum(int(item.get("action_count", 0) or 0) for item in combined_dynamic_raw),
-            "spa_urls": sorted({url for item in combined_dynamic_raw for url in (item.get("spa_urls", []) or [])}),
-            "candidate_count": sum(int(item.get("candidate_count", 0) or 0) for item in combined_dynamic_raw),
-            "api_candidate_count": sum(int(item.get("api_candidate_count", 0) or 0) for item in combined_dynamic_raw),
-            "page_candidate_count": sum(int(item.get("page_candidate_count", 0) or 0) for item in combined_dynamic_raw),
-        },
-        "js_output_dir": str(normalize_js_output_dir(config.js_output_dir) or ""),
-        "js_files": combined_js,
-        "accessible_pages": [item for item in combined_pages if item.get("accessible") is True],
-        "accessible_apis": [item for item in combined_apis if item.get("accessible") is True],
-        "all_pages": combined_pages,
-        "all_apis": combined_apis,
-        "hardcoded_findings": combined_hardcoded_findings,
-        "hardcoded_summary": combined_hardcoded_summary,
-        "sensitive_findings": combined_hardcoded_findings,
-        "sensitive_summary": combined_hardcoded_summary,
-        "js_discovered_urls": sorted(combined_discovered_js_urls),
-        "summary": {
-            "js_discovered": len(combined_discovered_js_urls),
-            "js_fetched": len(combined_js),
-            "js_saved": sum(1 for item in combined_js if item.get("saved_path")),
-            "dynamic_events": sum(len(item.get("events", []) or []) for item in combined_dynamic_raw),
-            "dynamic_candidates": sum(int(item.get("candidate_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_api_candidates": sum(int(item.get("api_candidate_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_page_candidates": sum(int(item.get("page_candidate_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_script_responses": sum(int(item.get("script_response_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_script_body_bytes": sum(int(item.get("script_body_bytes", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_http_requests": sum(int(item.get("http_request_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_http_response_bodies": sum(int(item.get("http_response_body_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_http_body_bytes": sum(int(item.get("http_body_bytes", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_blocked_requests": sum(int(item.get("blocked_request_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_actions": sum(int(item.get("action_count", 0) or 0) for item in combined_dynamic_raw),
-            "dynamic_spa_urls": sum(len(item.get("spa_urls", []) or []) for item in combined_dynamic_raw),
-            "page_count": len(combined_pages),
-            "api_count": len(combined_apis),
-            **combined_hardcoded_summary_fields,
-        },
-    }
-    return apply_recursive_metadata(merged, config, state, failed_targets, scan_records)
+        merger.add(target_url, depth, result)
+    return merger.build(state, failed_targets)
 
 
 def _discover_once(
@@ -3573,10 +5374,24 @@ def _discover_once(
     if not is_scan_target_url(target_url):
         raise ValueError("URL은 http 또는 https 형식이어야 하며 호스트가 포함되어야 합니다.")
 
+    if execution is None and config.profile:
+        # 프로파일러를 붙일 컨텍스트를 여기서 만들었다면 프로브 풀도 여기서 닫는다.
+        execution = build_execution_context(config)
+        try:
+            return _discover_once(config, target_url, state, execution=execution, progress=progress)
+        finally:
+            execution.close()
+
     root_url = target_url
     root_origin = get_origin_key(root_url)
-
-    emit_progress(progress, f"시작 문서를 가져오는 중: {root_url}")
+    detector_stats = DetectorStatsRegistry() if config.detector_stats or config.profile else None
+    profiler = ScanProfiler(detector_stats) if config.profile else None
+    if profiler is not None and execution is not None:
+        # 같은 스로틀과 취소 이벤트를 쓰되 요청 계측은 이 대상의 프로파일러로 모은다.
+        execution = replace(execution, profiler=profiler)
+
+    emit_progress(progress, f"시작 문서를 가져오는 중: {root_url}", phase="html", url=root_url)
+    phase_started = profile_clock()
     html_fetch_kwargs = {
         "timeout": config.timeout,
         "method": "GET",
@@ -3591,6 +5406,16 @@ def _discover_once(
     for _attempt in range(1 + _initial_fetch_retries):
         ensure_not_cancelled(execution)
         html_result = fetch_text(root_url, **html_fetch_kwargs)
+        emit_progress(
+            progress,
+            "",
+            phase="html",
+            completed=_attempt + 1,
+            url=root_url,
+            byte_count=html_result.length,
+            requests=1,
+            errors=0 if html_result.success else 1,
+        )
         if html_result.success:
             break
         if _attempt < _initial_fetch_retries:
@@ -3602,6 +5427,7 @@ def _discover_once(
             f"{format_fetch_failure(html_result, config.verify_ssl)} "
             f"(타임아웃: {config.timeout}초 — 느린 서버의 경우 GUI/CLI에서 값을 높여주세요)"
         )
+    _record_profile_phase(profiler, "html_fetch", phase_started)
 
     document_url = html_result.final_url or root_url
     scope = build_url_scope(
@@ -3634,7 +5460,11 @@ def _discover_once(
     }
     js_output_dir = normalize_js_output_dir(config.js_output_dir)
     queue: Deque[Tuple[str, int]] = deque()
+    # 브라우저가 이미 받은 JS 본문. 정적 JS 큐는 네트워크 요청만 건너뛰고 js: 출처로 분석한다.
+    dynamic_script_bodies: Dict[str, str] = {}
+    reused_dynamic_scripts = 0
 
+    phase_started = profile_clock()
     script_urls, inline_scripts = extract_html_assets(html_result.text, document_url, scope)
     emit_progress(progress, f"연결된 스크립트 {len(script_urls)}개와 인라인 스크립트 {len(inline_scripts)}개를 찾았습니다.")
     for script_url in script_urls:
@@ -3651,6 +5481,7 @@ def _discover_once(
         scope=scope,
         page_bucket=page_bucket,
         api_bucket=api_bucket,
+        detector_stats=detector_stats,
     )
     collect_hardcoded_findings(
         text=html_result.text,
@@ -3659,6 +5490,7 @@ def _discover_once(
         source_type="html",
         findings=hardcoded_findings,
         dedupe_keys=hardcoded_dedupe_keys,
+        detector_stats=detector_stats,
     )
 
     for inline_index, inline_script in enumerate(inline_scripts, start=1):
@@ -3670,6 +5502,7 @@ def _discover_once(
             scope=scope,
             page_bucket=page_bucket,
             api_bucket=api_bucket,
+            detector_stats=detector_stats,
         )
         collect_hardcoded_findings(
             text=inline_script,
@@ -3678,9 +5511,12 @@ def _discover_once(
             source_type="inline_script",
             findings=hardcoded_findings,
             dedupe_keys=hardcoded_dedupe_keys,
+            detector_stats=detector_stats,
         )
+    _record_profile_phase(profiler, "inline_analysis", phase_started)
 
     if config.dynamic_analysis:
+        phase_started = profile_clock()
         dynamic_result = collect_dynamic_candidates_with_playwright(
             url=root_url,
             scope=scope,
@@ -3691,6 +5527,8 @@ def _discover_once(
             hardcoded_dedupe_keys=hardcoded_dedupe_keys,
             execution=execution,
             progress=progress,
+            script_body_store=dynamic_script_bodies,
+            detector_stats=detector_stats,
         )
         for script_url in dynamic_result.get("script_urls", []):
             script_url = str(script_url)
@@ -3701,7 +5539,9 @@ def _discover_once(
                 state.skipped_js_duplicates += 1
                 continue
             queue.append((script_url, 0))
+        _record_profile_phase(profiler, "dynamic", phase_started)
 
+    phase_started = profile_clock()
     while queue and attempted_js_fetches < config.max_js_files:
         ensure_not_cancelled(execution)
         script_url, depth = queue.popleft()
@@ -3713,17 +5553,40 @@ def _discover_once(
 
         visited_scripts.add(script_url)
         attempted_js_fetches += 1
-        emit_progress(progress, f"JS 가져오는 중 {attempted_js_fetches}/{config.max_js_files}: {script_url}")
-        js_fetch_kwargs = {
-            "timeout": config.timeout,
-            "method": "GET",
-            "headers": request_headers_for_target(config.headers, config.url, script_url),
-            "execution": execution,
-            "verify_ssl": config.verify_ssl,
-        }
-        if config.proxy_url:
-            js_fetch_kwargs["proxy_url"] = config.proxy_url
-        js_result = fetch_text(script_url, **js_fetch_kwargs)
+        dynamic_body = dynamic_script_bodies.pop(script_url, None)
+        if dynamic_body is not None:
+            reused_dynamic_scripts += 1
+            js_result = FetchResult(
+                url=script_url,
+                status_code=200,
+                text=dynamic_body,
+                success=True,
+                length=len(dynamic_body.encode("utf-8", errors="ignore")),
+                final_url=script_url,
+            )
+        else:
+            emit_progress(progress, f"JS 가져오는 중 {attempted_js_fetches}/{config.max_js_files}: {script_url}", phase="js", total=config.max_js_files, url=script_url)
+            js_fetch_kwargs = {
+                "timeout": config.timeout,
+                "method": "GET",
+                "headers": request_headers_for_target(config.headers, config.url, script_url),
+                "execution": execution,
+                "verify_ssl": config.verify_ssl,
+            }
+            if config.proxy_url:
+                js_fetch_kwargs["proxy_url"] = config.proxy_url
+            js_result = fetch_text(script_url, **js_fetch_kwargs)
+            emit_progress(
+                progress,
+                "",
+                phase="js",
+                completed=attempted_js_fetches,
+                total=config.max_js_files,
+                url=script_url,
+                byte_count=js_result.length,
+                requests=1,
+                errors=0 if js_result.success else 1,
+            )
         script_record = {
             "url": script_url,
             "final_url": js_result.final_url or script_url,
@@ -3734,6 +5597,7 @@ def _discover_once(
             "error": js_result.error,
             "saved_path": "",
             "save_error": "",
+            "reused_dynamic_body": dynamic_body is not None,
         }
 
         # Only mark a JS URL as globally known after a successful fetch so
@@ -3766,6 +5630,7 @@ def _discover_once(
             scope=scope,
             page_bucket=page_bucket,
             api_bucket=api_bucket,
+            detector_stats=detector_stats,
         )
         collect_hardcoded_findings(
             text=js_result.text,
@@ -3774,6 +5639,7 @@ def _discover_once(
             source_type="js",
             findings=hardcoded_findings,
             dedupe_keys=hardcoded_dedupe_keys,
+            detector_stats=detector_stats,
         )
 
         for child_url in extract_additional_js_urls(js_result.text, script_base_url, scope):
@@ -3784,9 +5650,34 @@ def _discover_once(
             if child_url not in visited_scripts:
                 queue.append((child_url, depth + 1))
 
+    # JS 큐가 소비하지 못한 동적 본문(한도 초과, 범위 밖, 이미 알려진 URL)은 동적 출처로 분석한다.
+    for script_url, dynamic_body in dynamic_script_bodies.items():
+        dynamic_source_label = f"playwright:response-js:{script_url}"
+        collect_path_candidates(
+            text=dynamic_body,
+            base_url=script_url,
+            source_label=dynamic_source_label,
+            scope=scope,
+            page_bucket=page_bucket,
+            api_bucket=api_bucket,
+            detector_stats=detector_stats,
+        )
+        collect_hardcoded_findings(
+            text=dynamic_body,
+            source_url=script_url,
+            source_label=dynamic_source_label,
+            source_type="dynamic_js_response",
+            findings=hardcoded_findings,
+            dedupe_keys=hardcoded_dedupe_keys,
+            detector_stats=detector_stats,
+        )
+    dynamic_script_bodies.clear()
+    _record_profile_phase(profiler, "js_crawl", phase_started)
+
     if config.scan_well_known:
         ensure_not_cancelled(execution)
-        emit_progress(progress, "robots.txt/sitemap.xml에서 추가 경로를 찾는 중입니다.")
+        phase_started = profile_clock()
+        emit_progress(progress, "robots.txt/sitemap.xml에서 추가 경로를 찾는 중입니다.", phase="well_known", url=document_url)
         discover_well_known(
             target_url=document_url,
             scope=scope,
@@ -3796,33 +5687,30 @@ def _discover_once(
             verify_ssl=config.verify_ssl,
             proxy_url=config.proxy_url,
             page_bucket=page_bucket,
+            execution=execution,
         )
+        _record_profile_phase(profiler, "well_known", phase_started)
 
     page_bucket, skipped_pages = filter_candidate_bucket_by_path(page_bucket, state.known_page_paths)
     api_bucket, skipped_apis = filter_candidate_bucket_by_path(api_bucket, state.known_api_paths)
     state.skipped_page_duplicates += skipped_pages
     state.skipped_api_duplicates += skipped_apis
 
-    ensure_not_cancelled(execution)
-    emit_progress(progress, f"페이지 후보 {len(page_bucket)}개를 확인하는 중입니다.")
-    all_pages = build_result_rows(
-        bucket=page_bucket,
-        kind="page",
-        timeout=config.timeout,
-        skip_probe=config.skip_probe,
-        headers=config.headers,
-        header_origin_url=config.url,
-        execution=execution,
-        progress=progress,
-        verify_ssl=config.verify_ssl,
-        proxy_url=config.proxy_url,
-    )
+    if not config.skip_probe and execution is not None and execution.dns_cache is not None:
+        ensure_not_cancelled(execution)
+        phase_started = profile_clock()
+        prefetched = prefetch_dns((page_bucket, api_bucket), execution, proxy_url=config.proxy_url)
+        if prefetched:
+            emit_progress(progress, f"후보 호스트 {prefetched}개의 주소를 미리 확인했습니다.", phase="dns", completed=prefetched, total=prefetched)
+        _record_profile_phase(profiler, "dns_prefetch", phase_started)
 
     ensure_not_cancelled(execution)
-    emit_progress(progress, f"API 후보 {len(api_bucket)}개를 확인하는 중입니다.")
-    all_apis = build_result_rows(
-        bucket=api_bucket,
-        kind="api",
+    emit_progress(progress, f"페이지 후보 {len(page_bucket)}개를 확인하는 중입니다.", phase="page_probe", total=len(page_bucket))
+    emit_progress(progress, f"API 후보 {len(api_bucket)}개를 확인하는 중입니다.", phase="api_probe", total=len(api_bucket))
+    phase_started = profile_clock()
+    # 페이지와 API 후보를 한 풀에서 호스트별로 번갈아 확인하고, 종류별 구간은 마지막 행이 끝난 시점까지로 기록한다.
+    probe_rows = build_probe_rows(
+        [("page", page_bucket), ("api", api_bucket)],
         timeout=config.timeout,
         skip_probe=config.skip_probe,
         headers=config.headers,
@@ -3831,7 +5719,10 @@ def _discover_once(
         progress=progress,
         verify_ssl=config.verify_ssl,
         proxy_url=config.proxy_url,
+        on_kind_done=lambda kind: _record_profile_phase(profiler, f"{kind}_probe", phase_started),
     )
+    all_pages = probe_rows["page"]
+    all_apis = probe_rows["api"]
 
     all_pages = filter_rows_by_min_confidence(all_pages, config.min_confidence)
     all_apis = filter_rows_by_min_confidence(all_apis, config.min_confidence)
@@ -3850,7 +5741,7 @@ def _discover_once(
     hardcoded_summary = summarize_hardcoded_findings(hardcoded_findings)
     hardcoded_summary_fields = build_hardcoded_summary_fields(hardcoded_findings)
 
-    return {
+    result = {
         "input_url": root_url,
         "final_url": document_url,
         "scanned_at": datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds"),
@@ -3859,7 +5750,12 @@ def _discover_once(
         "max_js_files": config.max_js_files,
         "max_depth": config.max_depth,
         "max_workers": config.max_workers,
+        "max_host_workers": config.max_host_workers,
         "request_delay": config.request_delay,
+        "probe_cache_ttl": config.probe_cache_ttl,
+        "connect_timeout": config.connect_timeout,
+        "host_failure_threshold": config.host_failure_threshold,
+        "dns_cache_ttl": config.dns_cache_ttl,
         "proxy_url": redact_url_credentials(config.proxy_url),
         "dynamic_analysis": dynamic_result,
         "dynamic_analysis_enabled": config.dynamic_analysis,
@@ -3871,6 +5767,11 @@ def _discover_once(
         "dynamic_action_limit": config.dynamic_action_limit,
         "dynamic_scroll_steps": config.dynamic_scroll_steps,
         "dynamic_recursive_limit": config.dynamic_recursive_limit,
+        "dynamic_profile_dir": str(config.dynamic_profile_dir or ""),
+        "dynamic_storage_state": str(config.dynamic_storage_state or ""),
+        "dynamic_events_file": str(config.dynamic_events_file or ""),
+        "profile": config.profile,
+        "detector_stats_enabled": config.detector_stats or config.profile,
         "js_output_dir": str(js_output_dir or ""),
         "js_files": sorted(fetched_scripts, key=lambda item: (item["depth"], item["url"])),
         "js_discovered_urls": sorted(discovered_js_urls),
@@ -3878,15 +5779,15 @@ def _discover_once(
         "accessible_apis": [item for item in all_apis if item["accessible"] is True],
         "all_pages": all_pages,
         "all_apis": all_apis,
+        "schema_version": RESULT_SCHEMA_VERSION,
         "hardcoded_findings": hardcoded_findings,
         "hardcoded_summary": hardcoded_summary,
-        "sensitive_findings": hardcoded_findings,
-        "sensitive_summary": hardcoded_summary,
         "summary": {
             "js_discovered": len(discovered_js_urls),
             "js_fetched": len(fetched_scripts),
             "js_saved": saved_js_files,
-            "dynamic_events": len(dynamic_result.get("events", []) or []),
+            "js_reused_dynamic": reused_dynamic_scripts,
+            "dynamic_events": int(dynamic_result.get("event_count", len(dynamic_result.get("events", []) or [])) or 0),
             "dynamic_candidates": int(dynamic_result.get("candidate_count", 0) or 0),
             "dynamic_api_candidates": int(dynamic_result.get("api_candidate_count", 0) or 0),
             "dynamic_page_candidates": int(dynamic_result.get("page_candidate_count", 0) or 0),
@@ -3903,14 +5804,19 @@ def _discover_once(
             **hardcoded_summary_fields,
         },
     }
+    if detector_stats is not None:
+        result["detector_stats"] = detector_stats.snapshot()
+        if execution is not None:
+            execution.detector_stats.merge(result["detector_stats"])
+    if profiler is not None:
+        result["performance"] = profiler.to_dict()
+    if execution is not None and execution.record_sink is not None:
+        for record in iter_result_records(result):
+            execution.record_sink(record)
+    return result
 
 
-def discover(config: Config, progress: ProgressCallback = None, execution: Optional[ExecutionContext] = None) -> dict:
-    validate_config(config)
-    if not is_scan_target_url(config.url):
-        raise ValueError("URL은 http 또는 https 형식이어야 하며 호스트가 포함되어야 합니다.")
-
-    execution_context = execution or build_execution_context(config)
+def _discover_targets(config: Config, execution_context: ExecutionContext, progress: ProgressCallback) -> dict:
     state = RecursiveDiscoveryState()
     max_recursive_depth = config.recursive_depth if config.recursive_scan else 0
     recursive_scope = build_url_scope(
@@ -3919,7 +5825,8 @@ def discover(config: Config, progress: ProgressCallback = None, execution: Optio
         excluded_hostnames=config.excluded_subdomains,
     )
     queue: Deque[Tuple[str, int]] = deque([(config.url, 0)])
-    successful_results: List[Tuple[str, int, dict]] = []
+    # 대상 결과는 끝나는 즉시 병합해서 고유 행만 남기고, 대상별 결과 전체는 붙잡아 두지 않는다.
+    merger = ScanResultMerger(config, config.url)
     failed_targets: List[dict] = []
     dynamic_recursive_enqueued = 0
 
@@ -3936,24 +5843,24 @@ def discover(config: Config, progress: ProgressCallback = None, execution: Optio
 
         state.scanned_target_paths.add(target_path)
         state.scanned_target_urls.append(target_url)
-        emit_progress(progress, f"대상 스캔 시작 ({depth}단계): {target_url}")
+        emit_progress(progress, f"대상 스캔 시작 ({depth}단계): {target_url}", phase="target", url=target_url)
 
         scan_progress: ProgressCallback
         if config.recursive_scan:
-            scan_progress = lambda message, current=target_url, level=depth: emit_progress(progress, f"[{level}단계] {current} | {message}")
+            scan_progress = prefix_progress(progress, f"[{depth}단계] {target_url} | ")
         else:
             scan_progress = progress
 
         try:
             result = _discover_once(config, target_url, state, execution=execution_context, progress=scan_progress)
-            successful_results.append((target_url, depth, result))
+            merger.add(target_url, depth, result)
             if depth == 0 and result.get("final_url"):
                 recursive_scope = build_url_scope(
                     str(result["final_url"]),
                     include_subdomains=config.include_subdomains,
                     excluded_hostnames=config.excluded_subdomains,
                 )
-            emit_progress(progress, f"대상 스캔 완료 ({depth}단계): {target_url}")
+            emit_progress(progress, f"대상 스캔 완료 ({depth}단계): {target_url}", phase="target", url=target_url)
         except ScanCancelled:
             raise
         except Exception as exc:
@@ -3961,7 +5868,7 @@ def discover(config: Config, progress: ProgressCallback = None, execution: Optio
             failed_targets.append(target_error)
             if depth == 0:
                 raise
-            emit_progress(progress, f"대상 스캔 실패 ({depth}단계): {target_url} / {exc}")
+            emit_progress(progress, f"대상 스캔 실패 ({depth}단계): {target_url} / {exc}", phase="target", url=target_url, errors=1)
             continue
 
         if depth >= max_recursive_depth:
@@ -3991,21 +5898,52 @@ def discover(config: Config, progress: ProgressCallback = None, execution: Optio
             queue.append((next_url, depth + 1))
             emit_progress(progress, f"재귀 대상 발견 ({depth + 1}단계): {next_url}")
 
-    if not successful_results:
+    if not len(merger):
         raise RuntimeError("스캔 결과를 생성하지 못했습니다.")
 
-    return combine_recursive_scan_results(config, config.url, successful_results, state, failed_targets)
+    result = merger.build(state, failed_targets)
+    if execution_context.dns_cache is not None:
+        # 캐시는 실행 컨텍스트 단위라 배치 스캔에서는 앞선 URL의 조회도 함께 누적된다.
+        result["dns_resolution"] = execution_context.dns_cache.stats()
+    return result
+
+
+def validate_scan_config(config: Config) -> None:
+    validate_config(config)
+    if not is_scan_target_url(config.url):
+        raise ValueError("URL은 http 또는 https 형식이어야 하며 호스트가 포함되어야 합니다.")
+
+
+def discover(config: Config, progress: ProgressCallback = None, execution: Optional[ExecutionContext] = None) -> dict:
+    validate_scan_config(config)
+
+    if execution is None:
+        execution = build_execution_context(config)
+        try:
+            return discover(config, progress=progress, execution=execution)
+        finally:
+            execution.close()
+
+    with SOURCE_LABELS.scan_scope():
+        return _discover_targets(config, execution, progress)
 
 
 def discover_many(config: Config, urls: List[str], progress: ProgressCallback = None, execution: Optional[ExecutionContext] = None) -> dict:
     validate_config(config)
-    execution_context = execution or build_execution_context(config)
+    if execution is None:
+        execution = build_execution_context(config)
+        try:
+            return discover_many(config, urls, progress=progress, execution=execution)
+        finally:
+            execution.close()
+
+    execution_context = execution
     records: List[dict] = []
     total = len(urls)
 
     for index, url in enumerate(urls, start=1):
         ensure_not_cancelled(execution_context)
-        emit_progress(progress, f"URL {index}/{total} 스캔 시작: {url}")
+        emit_progress(progress, f"URL {index}/{total} 스캔 시작: {url}", phase="batch", total=total, url=url)
         per_url_config = replace(
             config,
             url=url,
@@ -4015,11 +5953,11 @@ def discover_many(config: Config, urls: List[str], progress: ProgressCallback =
         try:
             result = discover(
                 per_url_config,
-                progress=lambda message, current=index, count=total: emit_progress(progress, f"URL {current}/{count} {message}"),
+                progress=prefix_progress(progress, f"URL {index}/{total} "),
                 execution=execution_context,
             )
             records.append(decorate_scan_result(result, index, total, status="success"))
-            emit_progress(progress, f"URL {index}/{total} 스캔 완료: {url}")
+            emit_progress(progress, f"URL {index}/{total} 스캔 완료: {url}", phase="batch", completed=index, total=total, url=url)
         except ScanCancelled:
             raise
         except Exception as exc:
@@ -4027,9 +5965,12 @@ def discover_many(config: Config, urls: List[str], progress: ProgressCallback =
             failed["scan_index"] = index
             failed["scan_total"] = total
             records.append(failed)
-            emit_progress(progress, f"URL {index}/{total} 스캔 실패: {url} / {exc}")
+            emit_progress(progress, f"URL {index}/{total} 스캔 실패: {url} / {exc}", phase="batch", completed=index, total=total, url=url, errors=1)
 
-    return build_batch_result(records, urls, config)
+    batch = build_batch_result(records, urls, config)
+    if execution_context.dns_cache is not None:
+        batch["dns_resolution"] = execution_context.dns_cache.stats()
+    return batch
 
 
 def write_json(output: Path, data: dict) -> Path:
@@ -4038,6 +5979,83 @@ def write_json(output: Path, data: dict) -> Path:
     return output.resolve()
 
 
+NDJSON_STREAMED_RESULT_KEYS = (
+    "all_pages",
+    "all_apis",
+    "accessible_pages",
+    "accessible_apis",
+    "js_files",
+    "hardcoded_findings",
+    "sensitive_findings",
+    "dynamic_analysis",
+    "results",
+)
+
+
+def iter_result_records(result: dict) -> Iterator[dict]:
+    target_url = str(result.get("final_url") or result.get("input_url") or result.get("url") or "")
+    for record_type, items in (
+        ("page", result.get("all_pages", [])),
+        ("api", result.get("all_apis", [])),
+        ("js_file", result.get("js_files", [])),
+        ("finding", resolve_sensitive_findings(result)),
+        ("dynamic_event", (result.get("dynamic_analysis") or {}).get("events", [])),
+    ):
+        for item in items or []:
+            yield {"record_type": record_type, "target_url": target_url, **item}
+
+
+def build_ndjson_summary_record(result: dict) -> dict:
+    record = {key: value for key, value in result.items() if key not in NDJSON_STREAMED_RESULT_KEYS}
+    record["record_type"] = "summary"
+    return record
+
+
+class NdjsonResultWriter:
+    """Writes one JSON record per line, flushed as each target finishes.
+
+    Only the file is incremental: discover() still returns the merged result,
+    which the caller turns into the trailing summary record.
+    """
+
+    def __init__(self, output: Path) -> None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        self.output = output
+        self._handle = output.open("w", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write_record(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._handle.write(line)
+            self._handle.write("\n")
+            self._handle.flush()
+
+    def write_summary(self, result: dict) -> None:
+        self.write_record(build_ndjson_summary_record(result))
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.close()
+
+    def __enter__(self) -> "NdjsonResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_ndjson(output: Path, data: dict) -> Path:
+    with NdjsonResultWriter(output) as writer:
+        records = data.get("results") if isinstance(data.get("results"), list) else [data]
+        for record in records:
+            for item in iter_result_records(record):
+                writer.write_record(item)
+        writer.write_summary(data)
+    return output.resolve()
+
+
 def derive_export_output_paths(output: Path) -> Tuple[Path, Path]:
     suffix = output.suffix.lower()
     if suffix not in {"", ".xlsx", ".html"}:
@@ -4059,7 +6077,9 @@ def save_result(output: Path, data: dict) -> Path:
         return write_xlsx(output, data)
     if suffix == ".html":
         return write_html(output, data)
-    raise ValueError("지원하지 않는 출력 형식입니다. `.json`, `.xlsx`, `.html`, 또는 확장자 없이 입력해 주세요.")
+    if suffix == ".ndjson":
+        return write_ndjson(output, data)
+    raise ValueError("지원하지 않는 출력 형식입니다. `.json`, `.xlsx`, `.html`, `.ndjson`, 또는 확장자 없이 입력해 주세요.")
 
 
 def write_xlsx(output: Path, data: dict) -> Path:
@@ -4305,6 +6325,39 @@ def build_dynamic_sheet_rows(dynamic_result: dict) -> List[List[object]]:
     return rows
 
 
+def build_performance_phase_rows(performance: dict) -> List[List[object]]:
+    rows: List[List[object]] = [["단계", "경과(ms)", "CPU(ms)", "횟수"]]
+    for name, entry in (performance.get("phases") or {}).items():
+        rows.append([name, entry.get("wall_ms", 0), entry.get("cpu_ms", 0), entry.get("calls", 0)])
+    rows.append(["throttle_wait", performance.get("throttle_wait_ms", 0), "-", "-"])
+    return rows
+
+
+def build_performance_detector_rows(detector_stats: Optional[dict]) -> List[List[object]]:
+    rows: List[List[object]] = [["탐지기", "시간(ms)", "매치", "호출"]]
+    detectors = detector_stats or {}
+    for name, entry in sorted(detectors.items(), key=lambda item: -float(item[1].get("time_ms", 0) or 0)):
+        rows.append([name, entry.get("time_ms", 0), entry.get("matches", 0), entry.get("calls", 0)])
+    return rows
+
+
+def build_performance_host_rows(performance: dict) -> List[List[object]]:
+    labels = _latency_bucket_labels()
+    rows: List[List[object]] = [["호스트", "요청", "합계(ms)", "최대(ms)", *labels]]
+    for host, entry in (performance.get("hosts") or {}).items():
+        histogram = entry.get("histogram") or {}
+        rows.append(
+            [
+                host or "-",
+                entry.get("requests", 0),
+                entry.get("total_ms", 0),
+                entry.get("max_ms", 0),
+                *(histogram.get(label, 0) for label in labels),
+            ]
+        )
+    return rows
+
+
 def build_result_sheet_rows(rows_data: List[dict]) -> List[List[object]]:
     rows: List[List[object]] = [["상태", "접근 가능", "방법", "신뢰도", "경로", "출처", "URL"]]
     for item in rows_data:
@@ -4464,25 +6517,21 @@ def _xlsx_row_height(rows: List[List[object]], row_index: int) -> Optional[int]:
     return None
 
 
-def _xlsx_merge_ranges(rows: List[List[object]]) -> List[str]:
-    max_columns = max((len(row) for row in rows), default=1)
-    if max_columns <= 1:
-        return []
-    last_column = excel_column_name(max_columns)
-    return [f"A{row_index}:{last_column}{row_index}" for row_index, row in enumerate(rows, start=1) if len(row) == 1 and row]
-
-
-def _xlsx_column_widths(rows: List[List[object]]) -> List[int]:
-    max_columns = max((len(row) for row in rows), default=1)
-    widths = [14] * max_columns
+def _xlsx_column_widths(rows: Iterable[Sequence[object]]) -> List[int]:
+    widths: List[int] = []
     for row in rows:
+        if len(row) > len(widths):
+            widths.extend([14] * (len(row) - len(widths)))
         for index, value in enumerate(row):
             text = str(value or "")
             estimated = min(max(len(text) + 3, 12), 48)
             if "\n" in text:
                 estimated = min(max(max(len(part) for part in text.splitlines()) + 3, 16), 52)
-            widths[index] = max(widths[index], estimated)
-    if max_columns == 1:
+            if estimated > widths[index]:
+                widths[index] = estimated
+    if not widths:
+        widths = [14]
+    if len(widths) == 1:
         widths[0] = max(widths[0], 72)
     return widths
 
@@ -4511,53 +6560,58 @@ def xlsx_cell_xml(cell_ref: str, value: object, style_id: int = 0) -> str:
     return f'<c r="{cell_ref}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{text}</t></is></c>'
 
 
-def xlsx_sheet_xml(rows: List[List[object]]) -> str:
+def iter_xlsx_sheet_xml(rows: List[List[object]]) -> Iterator[str]:
+    # <cols>가 <sheetData>보다 앞에 와야 하므로 너비만 한 번 미리 계산하고,
+    # 행 XML은 한 줄씩 만들어 바로 내보낸다. 병합 범위는 행을 내보내며 모은다.
     column_widths = _xlsx_column_widths(rows)
     column_xml = "".join(
         f'<col min="{index}" max="{index}" width="{width}" customWidth="1"/>'
         for index, width in enumerate(column_widths, start=1)
     )
-    merge_ranges = _xlsx_merge_ranges(rows)
-    row_xml_parts: List[str] = []
+    last_column = excel_column_name(len(column_widths)) if len(column_widths) > 1 else ""
+    merged_row_indexes: List[int] = []
+    yield (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheetViews><sheetView workbookViewId="0"/></sheetViews>'
+        f"<cols>{column_xml}</cols>"
+        "<sheetData>"
+    )
     for row_index, row in enumerate(rows, start=1):
         style_id = _xlsx_style_id_for_row(rows, row_index)
         height = _xlsx_row_height(rows, row_index)
-        row_attrs = [f'r="{row_index}"']
+        row_attrs = f'r="{row_index}"'
         if height is not None:
-            row_attrs.append(f'ht="{height}"')
-            row_attrs.append('customHeight="1"')
-        if not row:
-            row_xml_parts.append(f'<row {" ".join(row_attrs)}/>')
-            continue
-
-        cell_xml_parts: List[str] = []
-        for column_index, value in enumerate(row, start=1):
-            cell_xml = xlsx_cell_xml(f"{excel_column_name(column_index)}{row_index}", value, style_id=style_id)
-            if cell_xml:
-                cell_xml_parts.append(cell_xml)
+            row_attrs += f' ht="{height}" customHeight="1"'
+        if last_column and len(row) == 1:
+            merged_row_indexes.append(row_index)
 
-        if cell_xml_parts:
-            row_xml_parts.append(f'<row {" ".join(row_attrs)}>{"".join(cell_xml_parts)}</row>')
+        cell_xml = "".join(
+            xlsx_cell_xml(f"{excel_column_name(column_index)}{row_index}", value, style_id=style_id)
+            for column_index, value in enumerate(row, start=1)
+        )
+        if cell_xml:
+            yield f"<row {row_attrs}>{cell_xml}</row>"
         else:
-            row_xml_parts.append(f'<row {" ".join(row_attrs)}/>')
-
-    merge_xml = ""
-    if merge_ranges:
-        merge_cells_body = "".join(f'<mergeCell ref="{ref}"/>' for ref in merge_ranges)
-        merge_xml = f'<mergeCells count="{len(merge_ranges)}">{merge_cells_body}</mergeCells>'
-    return (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        '<sheetViews><sheetView workbookViewId="0"/></sheetViews>'
-        f"<cols>{column_xml}</cols>"
-        f'<sheetData>{"".join(row_xml_parts)}</sheetData>'
-        f"{merge_xml}"
+            yield f"<row {row_attrs}/>"
+
+    yield "</sheetData>"
+    if merged_row_indexes:
+        yield f'<mergeCells count="{len(merged_row_indexes)}">'
+        for row_index in merged_row_indexes:
+            yield f'<mergeCell ref="A{row_index}:{last_column}{row_index}"/>'
+        yield "</mergeCells>"
+    yield (
         '<pageMargins left="0.4" right="0.4" top="0.5" bottom="0.5" header="0.2" footer="0.2"/>'
         "</worksheet>"
     )
 
 
+def xlsx_sheet_xml(rows: List[List[object]]) -> str:
+    return "".join(iter_xlsx_sheet_xml(rows))
+
+
 def xlsx_attr(value: str) -> str:
     return xml_escape(value, {"'": "&apos;", '"': "&quot;"})
 
@@ -4662,6 +6716,9 @@ def xlsx_styles_xml() -> str:
 
 
 def _write_xlsx_package(output: Path, sheets: List[SheetSpec]) -> None:
+    # zipfile은 XLSX 저장에서만 필요하므로 CLI 시작 비용에 포함하지 않는다.
+    import zipfile
+
     sheet_names = [sheet.name for sheet in sheets]
     with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
         archive.writestr("[Content_Types].xml", xlsx_content_types_xml(len(sheets)))
@@ -4670,7 +6727,59 @@ def _write_xlsx_package(output: Path, sheets: List[SheetSpec]) -> None:
         archive.writestr("xl/_rels/workbook.xml.rels", xlsx_workbook_rels_xml(len(sheets)))
         archive.writestr("xl/styles.xml", xlsx_styles_xml())
         for index, sheet in enumerate(sheets, start=1):
-            archive.writestr(f"xl/worksheets/sheet{index}.xml", xlsx_sheet_xml(sheet.rows))
+            with archive.open(f"xl/worksheets/sheet{index}.xml", "w") as entry:
+                with io.TextIOWrapper(entry, encoding="utf-8", newline="") as writer:
+                    for chunk in iter_xlsx_sheet_xml(sheet.rows):
+                        writer.write(chunk)
+
+
+class TableSearchIndex:
+    """Casefolded cell text for one table, reused across filter keystrokes."""
+
+    def __init__(self, rows: Sequence[Tuple[object, ...]], column_count: int) -> None:
+        self.rows = rows
+        self.column_count = column_count
+        # 열은 처음 검색될 때 접어 둔다. 전체 열이 필요하면 prepare()로 미리 만든다.
+        self._cells: List[Optional[List[Optional[str]]]] = [None] * column_count
+        self._last_column: Optional[int] = None
+        self._last_keyword = ""
+        self._last_matches: List[int] = list(range(len(rows)))
+
+    def _column(self, index: int) -> List[Optional[str]]:
+        cells = self._cells[index]
+        if cells is None:
+            cells = self._cells[index] = [str(row[index]).casefold() if index < len(row) else None for row in self.rows]
+        return cells
+
+    def prepare(self) -> "TableSearchIndex":
+        for index in range(self.column_count):
+            self._column(index)
+        return self
+
+    def _row_matches(self, row_index: int, columns: Sequence[List[Optional[str]]], keyword: str) -> bool:
+        for cells in columns:
+            text = cells[row_index]
+            if text is not None and keyword in text:
+                return True
+        return False
+
+    def search(self, column_index: Optional[int], keyword: str) -> List[int]:
+        if not keyword:
+            return list(range(len(self.rows)))
+        if column_index == self._last_column and self._last_keyword and keyword.startswith(self._last_keyword):
+            # 검색어가 길어지기만 했다면 직전 결과 안에서만 다시 찾는다.
+            candidates: Iterable[int] = self._last_matches
+        else:
+            candidates = range(len(self.rows))
+        if column_index is None:
+            columns = [self._column(index) for index in range(self.column_count)]
+        else:
+            columns = [self._column(column_index)]
+        matches = [row_index for row_index in candidates if self._row_matches(row_index, columns, keyword)]
+        self._last_column = column_index
+        self._last_keyword = keyword
+        self._last_matches = matches
+        return list(matches)
 
 
 def filter_table_rows(
@@ -4678,28 +6787,26 @@ def filter_table_rows(
     columns: Sequence[str],
     filter_column: Optional[str],
     filter_text: str,
+    search_index: Optional[TableSearchIndex] = None,
 ) -> List[Tuple[object, ...]]:
     keyword = filter_text.strip().casefold()
     if not keyword:
         return list(rows)
 
     if not filter_column:
-        target_indexes = list(range(len(columns)))
+        column_index: Optional[int] = None
     else:
         try:
-            target_indexes = [columns.index(filter_column)]
+            column_index = list(columns).index(filter_column)
         except ValueError:
             return list(rows)
 
-    filtered_rows: List[Tuple[object, ...]] = []
-    for row in rows:
-        for index in target_indexes:
-            if index >= len(row):
-                continue
-            if keyword in str(row[index]).casefold():
-                filtered_rows.append(row)
-                break
-    return filtered_rows
+    if search_index is not None and search_index.rows is rows and search_index.column_count == len(columns):
+        return [rows[row_index] for row_index in search_index.search(column_index, keyword)]
+    # 재사용할 색인이 없으면 필요한 열만 바로 비교하고 버릴 색인은 만들지 않는다.
+    if column_index is not None:
+        return [row for row in rows if column_index < len(row) and keyword in str(row[column_index]).casefold()]
+    return [row for row in rows if any(keyword in str(cell).casefold() for cell in row[: len(columns)])]
 
 
 def build_summary_lines(result: dict, output_path: Path | str, language: str = "ko") -> List[str]:
@@ -5115,10 +7222,40 @@ def _build_single_html_section(result: dict, output_label: Path | str, *, includ
         f"{_build_html_sensitive_preview(findings)}"
         "</div>"
         f"{_build_html_detail_block('Detailed Tables', detail_body, f'{anchor_base}-details', note='JS / Dynamic / Pages / APIs / Sensitive', open_by_default=not include_title)}"
+        f"{_build_html_performance_block(result.get('performance'), anchor_base, result.get('detector_stats'))}"
         "</section>"
     )
 
 
+def _build_html_performance_block(performance: Optional[dict], anchor_base: str, detector_stats: Optional[dict] = None) -> str:
+    if not performance:
+        return ""
+    # 예전 결과 파일은 탐지기 표를 performance 안에 따로 갖고 있다.
+    detectors = detector_stats if detector_stats is not None else performance.get("detectors")
+    note = (
+        f"{int(performance.get('request_count', 0) or 0)} requests / "
+        f"{int(performance.get('bytes_downloaded', 0) or 0)} bytes / "
+        f"throttle {performance.get('throttle_wait_ms', 0)} ms"
+    )
+    body = (
+        '<div class="detail-grid">'
+        '<div class="panel inset-panel">'
+        "<h3>Phases</h3>"
+        f"{_build_html_table(build_performance_phase_rows(performance))}"
+        "</div>"
+        '<div class="panel inset-panel">'
+        "<h3>Detectors</h3>"
+        f"{_build_html_table(build_performance_detector_rows(detectors))}"
+        "</div>"
+        '<div class="panel inset-panel">'
+        "<h3>Request Latency by Host</h3>"
+        f"{_build_html_table(build_performance_host_rows(performance))}"
+        "</div>"
+        "</div>"
+    )
+    return _build_html_detail_block("Performance", body, f"{anchor_base}-performance", note=note)
+
+
 def build_html_report(data: dict, output_label: Path | str) -> str:
     title = "Route API Discovery Report"
     nav_items: List[Tuple[str, str]] = [("Overview", "overview")]
@@ -5299,8 +7436,22 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         config = build_config(args)
         if not config.verify_ssl:
             print("경고: SSL 인증서 검증이 비활성화되었습니다. 신뢰할 수 있는 대상에만 사용해 주세요.", file=sys.stderr)
-        result = discover(config)
-        output_path = save_result(config.output, result)
+        if config.output.suffix.lower() == ".ndjson":
+            # 기존 출력 파일을 비우기 전에 설정과 URL부터 검사한다.
+            validate_scan_config(config)
+            # 대상별 레코드는 그 대상이 끝나는 즉시 기록한다. 합친 결과는 요약 레코드와
+            # 화면 요약을 위해 메모리에도 그대로 유지한다.
+            with NdjsonResultWriter(config.output) as writer:
+                execution = build_execution_context(config, record_sink=writer.write_record)
+                try:
+                    result = discover(config, execution=execution)
+                finally:
+                    execution.close()
+                writer.write_summary(result)
+            output_path = config.output.resolve()
+        else:
+            result = discover(config)
+            output_path = save_result(config.output, legacy_result_view(result) if config.legacy_result_schema else result)
         print_summary(result, output_path)
         return 0
     except KeyboardInterrupt:
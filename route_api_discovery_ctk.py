@@ -7,7 +7,7 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import customtkinter as ctk
 import tkinter as tk
@@ -15,7 +15,11 @@ from tkinter import ttk, filedialog, messagebox
 
 from route_api_discovery import (
     CANCEL_MESSAGE,
+    PROGRESS_FLUSH_INTERVAL_MS,
+    PROGRESS_MAX_RENDERED_MESSAGES,
     Config,
+    ProgressChannel,
+    ProgressEvent,
     ScanCancelled,
     build_execution_context,
     discover_many,
@@ -136,6 +140,7 @@ KO: Dict[str, str] = {
     "save_log_title": "로그 파일 저장",
     "ssl_warning": "[경고] SSL 인증서 검증 비활성화됨.",
     "stop_requested": "[중지 요청] 현재 요청 완료 후 스캔을 중지합니다.",
+    "log_dropped": "[로그 생략] 화면 갱신이 밀려 진행 메시지 {n}개를 표시하지 않았습니다. 로그 저장에는 모두 포함됩니다.",
     "scan_complete": "{count}개 URL 완료 (성공 {ok}, 실패 {fail})",
     "save_ok": "저장 완료: {path}",
     "save_fail": "저장 실패: {msg}",
@@ -222,6 +227,7 @@ EN: Dict[str, str] = {**KO,
     "save_log_title": "Save log file",
     "ssl_warning": "[Warning] SSL certificate verification disabled.",
     "stop_requested": "[Stop requested] Will stop after current request.",
+    "log_dropped": "[Log trimmed] {n} progress messages were not shown while the UI caught up. Save Log still includes them.",
     "scan_complete": "Scanned {count} URL(s) (success {ok}, failed {fail})",
     "save_ok": "Saved: {path}",
     "save_fail": "Save failed: {msg}",
@@ -359,9 +365,108 @@ class _Badge(tk.Label):
                          padx=8, pady=3, relief="flat", **kw)
 
 
+# ── Result table model ───────────────────────────────────────────────────────
+
+_TAB_TEXT_KEYS: Dict[str, str] = {
+    "api": "tab_apis",
+    "page": "tab_pages",
+    "js": "tab_js",
+    "sensitive": "tab_sensitive",
+}
+
+_TAB_COLUMN_SPECS: Dict[Optional[str], Tuple[Tuple[str, int], ...]] = {
+    "api": (("method", 82), ("status", 90), ("accessible", 80), ("length", 80), ("source", 240), ("url", 460)),
+    "page": (("status", 90), ("accessible", 80), ("length", 80), ("source", 260), ("url", 480), ("error", 240)),
+    "js": (("depth", 70), ("status", 90), ("success", 80), ("length", 90), ("saved_path", 240), ("error", 220), ("url", 440)),
+    "sensitive": (("severity", 90), ("confidence", 90), ("category", 120), ("field", 150), ("value", 180), ("location", 90), ("source", 220), ("matched_by", 180), ("context", 360)),
+    None: (("kind", 90), ("method", 82), ("endpoint", 260), ("status", 90), ("source", 220), ("severity", 90), ("sensitive", 120), ("url", 360)),
+}
+
+
+def _table_sort_key(value: str) -> Tuple[int, object]:
+    try:
+        return (0, int(value))
+    except ValueError:
+        return (1, value.lower())
+
+
+class ResultTableModel:
+    """Indexed view over result rows; the Treeview only materialises a window of it."""
+
+    def __init__(self, rows: List[dict]) -> None:
+        self.rows = rows
+        self._search_text = [" ".join(str(value) for value in row.values()).lower() for row in rows]
+        self._methods = [str(row.get("method") or "").upper() for row in rows]
+        self._by_kind: Dict[str, List[int]] = {}
+        for index, row in enumerate(rows):
+            self._by_kind.setdefault(str(row.get("kind") or ""), []).append(index)
+        self._values: Dict[Tuple[str, ...], List[Optional[tuple]]] = {}
+        self._sort_keys: Dict[Tuple[str, ...], List[tuple]] = {}
+        self._last_filter: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
+        self._last_query = ""
+        self._last_matches: List[int] = []
+
+    def filter(
+        self,
+        query: str = "",
+        kind: Optional[str] = None,
+        method: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[int]:
+        query = query.lower()
+        filter_key = (kind, method, status)
+        if filter_key == self._last_filter and query.startswith(self._last_query):
+            # 검색어가 이어서 입력된 경우 직전 결과 안에서만 다시 찾는다.
+            candidates: Iterable[int] = self._last_matches
+        else:
+            base: Iterable[int] = self._by_kind.get(kind, []) if kind is not None else range(len(self.rows))
+            candidates = [
+                index for index in base
+                if (method is None or self._methods[index] == method)
+                and (status is None or self.rows[index].get("status") == status)
+            ]
+            self._last_query = ""
+        if query and query != self._last_query:
+            candidates = [index for index in candidates if query in self._search_text[index]]
+        self._last_filter = filter_key
+        self._last_query = query
+        self._last_matches = list(candidates)
+        return list(self._last_matches)
+
+    def values(self, index: int, columns: Tuple[str, ...]) -> tuple:
+        cache = self._values.get(columns)
+        if cache is None:
+            cache = self._values[columns] = [None] * len(self.rows)
+        cached = cache[index]
+        if cached is None:
+            row = self.rows[index]
+            cached = cache[index] = tuple(str(row.get(column, "") or "") for column in columns)
+        return cached
+
+    def sort_key(self, index: int, columns: Tuple[str, ...], position: int) -> Tuple[int, object]:
+        keys = self._sort_keys.get(columns)
+        if keys is not None:
+            return keys[index][position]
+        return _table_sort_key(self.values(index, columns)[position])
+
+    def prepare(self, columns: Tuple[str, ...]) -> "ResultTableModel":
+        # 작업 스레드에서 셀 값과 정렬 키를 미리 만들어 UI 스레드는 그리기만 한다.
+        values = [self.values(index, columns) for index in range(len(self.rows))]
+        self._sort_keys[columns] = [tuple(_table_sort_key(value) for value in row) for row in values]
+        return self
+
+
+def build_result_table_model(rows: List[dict]) -> ResultTableModel:
+    model = ResultTableModel(rows)
+    for specs in _TAB_COLUMN_SPECS.values():
+        model.prepare(tuple(key for key, _ in specs))
+    return model
+
+
 # ── Main window ───────────────────────────────────────────────────────────────
 
 class CtkDiscoveryApp(ctk.CTk):
+    _TABLE_LOAD_BATCH = 300
 
     # ── Init ──────────────────────────────────────────────────────────────────
 
@@ -382,10 +487,16 @@ class CtkDiscoveryApp(ctk.CTk):
         self._state: str = "idle"
         self._log_lines: List[str] = []
         self._all_rows: List[dict] = []
+        self._table_model = ResultTableModel([])
+        self._record_models: Tuple[ResultTableModel, ...] = ()
+        self._table_rows: List[int] = []
+        self._table_loaded: int = 0
         self._headers: Dict[str, str] = {}
         self._start_time: Optional[float] = None
         self._request_count: int = 0
         self._error_count: int = 0
+        self._progress_channel = ProgressChannel()
+        self._current_phase: Optional[ProgressEvent] = None
         self._result_records: List[dict] = []
         self._selected_idx: int = -1
         self._timer_id: Optional[str] = None
@@ -1042,7 +1153,7 @@ class CtkDiscoveryApp(ctk.CTk):
 
         vsb = ttk.Scrollbar(outer, orient="vertical",   command=self._ui["tree"].yview)
         hsb = ttk.Scrollbar(outer, orient="horizontal", command=self._ui["tree"].xview)
-        self._ui["tree"].configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self._ui["tree"].configure(yscrollcommand=lambda first, last: self._on_tree_scrolled(vsb, first, last), xscrollcommand=hsb.set)
         self._ui["tree"].grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
         hsb.grid(row=1, column=0, sticky="ew")
@@ -1356,6 +1467,7 @@ class CtkDiscoveryApp(ctk.CTk):
         self._start_time = time.monotonic()
         self._request_count = 0
         self._error_count = 0
+        self._current_phase = None
         self._tick()
 
     def _tick(self) -> None:
@@ -1377,9 +1489,15 @@ class CtkDiscoveryApp(ctk.CTk):
         self._rate_text.set(_t(self._lang, "rate_label", r=f"{display_rate:.1f}"))
         self._workers_text.set(_t(self._lang, "workers_label", n=workers))
         self._sb_rate_text.set(_t(self._lang, "rate_label", r=f"{display_rate:.1f}"))
-        self._queue_text.set(_t(self._lang, "queue_label", n=0))
+        self._queue_text.set(_t(self._lang, "queue_label", n=self._remaining_in_phase()))
         self._errors_text.set(_t(self._lang, "errors_label", n=self._error_count))
 
+    def _remaining_in_phase(self) -> int:
+        phase = getattr(self, "_current_phase", None)
+        if phase is None or phase.total is None:
+            return 0
+        return max(0, phase.total - (phase.completed or 0))
+
     def _stop_timer(self) -> None:
         if self._timer_id:
             self.after_cancel(self._timer_id)
@@ -1437,6 +1555,8 @@ class CtkDiscoveryApp(ctk.CTk):
         self._batch_result = None
         self._result_records = []
         self._all_rows = []
+        self._table_model = ResultTableModel([])
+        self._record_models = ()
         self._clear_table()
         self._reset_metrics()
         self._set_state("running")
@@ -1444,41 +1564,57 @@ class CtkDiscoveryApp(ctk.CTk):
 
         cancel_event = threading.Event()
         self._cancel_event = cancel_event
+        self._progress_channel = ProgressChannel()
         req = CtkScanRequest(urls=urls, config=cfg)
         self._scan_thread = threading.Thread(
-            target=self._worker, args=(req, cancel_event), daemon=True)
+            target=self._worker, args=(req, cancel_event, self._progress_channel), daemon=True)
         self._scan_thread.start()
+        self.after(PROGRESS_FLUSH_INTERVAL_MS, self._poll_progress)
 
-    def _bump_request_count(self) -> None:
-        self._request_count += 1
-
-    def _bump_error_count(self) -> None:
-        self._error_count += 1
-
-    def _worker(self, req: CtkScanRequest, cancel_event: threading.Event) -> None:
+    def _worker(self, req: CtkScanRequest, cancel_event: threading.Event, channel: ProgressChannel) -> None:
+        execution = None
         try:
             execution = build_execution_context(req.config)
             execution.cancel_event = cancel_event
-
-            def on_progress(msg: str) -> None:
-                self.after(0, self._bump_request_count)
-                self.after(0, lambda m=msg: self._log(m))
-
             result = discover_many(req.config, req.urls,
-                                   progress=on_progress, execution=execution)
+                                   progress=channel, execution=execution)
             if cancel_event.is_set():
                 raise ScanCancelled(CANCEL_MESSAGE)
-            self.after(0, lambda r=result: self._on_finished(r))
+            models = tuple(
+                build_result_table_model(self._build_rows(record))
+                for record in result.get("results") or []
+            )
+            if cancel_event.is_set():
+                raise ScanCancelled(CANCEL_MESSAGE)
+            self.after(0, lambda r=result, m=models: self._on_finished(r, m))
         except ScanCancelled:
             self.after(0, self._on_cancelled)
         except Exception as exc:
-            self.after(0, self._bump_error_count)
+            channel.increment("errors")
             self.after(0, lambda m=str(exc): self._on_error(m))
-
-    def _on_finished(self, batch: dict) -> None:
+        finally:
+            if execution is not None:
+                execution.close()
+
+    def _poll_progress(self) -> None:
+        self._flush_progress()
+        if self._state in ("running", "cancelling"):
+            self.after(PROGRESS_FLUSH_INTERVAL_MS, self._poll_progress)
+
+    def _flush_progress(self) -> None:
+        batch = self._progress_channel.drain()
+        self._request_count += batch.counters.get("requests", 0)
+        self._error_count += batch.counters.get("errors", 0)
+        if batch.phases:
+            self._current_phase = list(batch.phases.values())[-1]
+        self._log_batch(batch.messages)
+
+    def _on_finished(self, batch: dict, models: Tuple[ResultTableModel, ...] = ()) -> None:
+        self._flush_progress()
         self._batch_result = batch
         records = batch.get("results") or []
         self._result_records = records
+        self._record_models = models if len(models) == len(records) else ()
         s = batch.get("summary") or {}
         msg = _t(self._lang, "scan_complete",
                  count=len(records), ok=s.get("success_count", 0),
@@ -1491,10 +1627,12 @@ class CtkDiscoveryApp(ctk.CTk):
         self._set_state("done")
 
     def _on_cancelled(self) -> None:
+        self._flush_progress()
         self._log(_t(self._lang, "stop_requested"))
         self._set_state("idle")
 
     def _on_error(self, msg: str) -> None:
+        self._flush_progress()
         self._log(_t(self._lang, "err_prefix", msg=msg))
         self._set_state("error")
 
@@ -1562,7 +1700,11 @@ class CtkDiscoveryApp(ctk.CTk):
             return
         self._selected_idx = idx
         rec = self._result_records[idx]
-        self._all_rows = self._build_rows(rec)
+        if idx < len(self._record_models):
+            self._table_model = self._record_models[idx]
+        else:
+            self._table_model = build_result_table_model(self._build_rows(rec))
+        self._all_rows = self._table_model.rows
         self._apply_filter()
         self._update_metrics_from_record(rec)
 
@@ -1701,15 +1843,10 @@ class CtkDiscoveryApp(ctk.CTk):
 
     def _columns_for_current_tab(self) -> Tuple[Tuple[str, int], ...]:
         selected_tab = self._tab_var.get()
-        if selected_tab == _t(self._lang, "tab_apis"):
-            return (("method", 82), ("status", 90), ("accessible", 80), ("length", 80), ("source", 240), ("url", 460))
-        if selected_tab == _t(self._lang, "tab_pages"):
-            return (("status", 90), ("accessible", 80), ("length", 80), ("source", 260), ("url", 480), ("error", 240))
-        if selected_tab == _t(self._lang, "tab_js"):
-            return (("depth", 70), ("status", 90), ("success", 80), ("length", 90), ("saved_path", 240), ("error", 220), ("url", 440))
-        if selected_tab == _t(self._lang, "tab_sensitive"):
-            return (("severity", 90), ("confidence", 90), ("category", 120), ("field", 150), ("value", 180), ("location", 90), ("source", 220), ("matched_by", 180), ("context", 360))
-        return (("kind", 90), ("method", 82), ("endpoint", 260), ("status", 90), ("source", 220), ("severity", 90), ("sensitive", 120), ("url", 360))
+        for kind in ("api", "page", "js", "sensitive"):
+            if selected_tab == _t(self._lang, _TAB_TEXT_KEYS[kind]):
+                return _TAB_COLUMN_SPECS[kind]
+        return _TAB_COLUMN_SPECS[None]
 
     def _configure_result_columns(self) -> None:
         tree = self._ui["tree"]
@@ -1722,37 +1859,32 @@ class CtkDiscoveryApp(ctk.CTk):
             tree.heading(key, text=_t(self._lang, f"col_{key}"), command=lambda c=key: self._sort_tree(c))
             tree.column(key, width=width, minwidth=50, anchor="w")
 
-    def _row_value(self, row: dict, column: str) -> str:
-        if column == "kind":
-            return str(row.get("kind") or "")
-        return str(row.get(column, "") or "")
-
-    def _refresh_table(self, rows: List[dict]) -> None:
-        tree = self._ui["tree"]
+    def _row_tags(self, row: dict, position: int) -> List[str]:
+        method = str(row.get("method") or "").upper()
+        tags = [f"m_{method}"] if method in ("GET","POST","PUT","PATCH","DELETE","HEAD") else []
+        if method in ("JS", "PAGE"):
+            tags.append(f"m_{method}")
+        if row.get("kind") == "sensitive":
+            tags.append("sensitive_row")
+        status_parts = str(row.get("status") or "").split()
+        try:
+            status_num = int(status_parts[0]) if status_parts else 0
+        except ValueError:
+            status_num = 0
+        if status_num >= 500:
+            tags.append("status_error")
+        elif status_num >= 400:
+            tags.append("status_warn")
+        if position % 2:
+            tags.append("alt")
+        return tags
+
+    def _refresh_table(self, rows: List[int]) -> None:
         self._configure_result_columns()
         self._clear_table()
-        for i, r in enumerate(rows):
-            method = r["method"].upper()
-            tags = [f"m_{method}"] if method in ("GET","POST","PUT","PATCH","DELETE","HEAD") else []
-            if method in ("JS", "PAGE"):
-                tags.append(f"m_{method}")
-            if r.get("kind") == "sensitive":
-                tags.append("sensitive_row")
-            status_parts = str(r.get("status") or "").split()
-            try:
-                status_num = int(status_parts[0]) if status_parts else 0
-            except ValueError:
-                status_num = 0
-            if status_num >= 500:
-                tags.append("status_error")
-            elif status_num >= 400:
-                tags.append("status_warn")
-            if i % 2:
-                tags.append("alt")
-            tree.insert("", "end",
-                values=tuple(self._row_value(r, column) for column in self._active_cols),
-                tags=tags,
-            )
+        self._table_rows = rows
+        self._table_loaded = 0
+        self._load_more_rows()
         if not rows:
             self._show_empty_state()
         # Update dissimilar count
@@ -1760,9 +1892,33 @@ class CtkDiscoveryApp(ctk.CTk):
             self._ui["dissimilar_lbl"].configure(
                 text=_t(self._lang, "dissimilar", n=len(rows)))
 
+    def _load_more_rows(self) -> None:
+        # 점진 로딩: Treeview에는 가상 모드가 없어 처음에는 한 묶음만 넣고, 스크롤이 끝에
+        # 가까워질 때마다 다음 묶음을 덧붙인다. 이미 넣은 행은 지우지 않으므로 끝까지
+        # 스크롤하면 모든 행이 위젯에 남는다.
+        tree = self._ui["tree"]
+        start = self._table_loaded
+        end = min(len(self._table_rows), start + self._TABLE_LOAD_BATCH)
+        model = self._table_model
+        for position in range(start, end):
+            index = self._table_rows[position]
+            tree.insert("", "end",
+                values=model.values(index, self._active_cols),
+                tags=self._row_tags(model.rows[index], position),
+            )
+        self._table_loaded = end
+
+    def _on_tree_scrolled(self, scrollbar: ttk.Scrollbar, first: str, last: str) -> None:
+        scrollbar.set(first, last)
+        if self._table_loaded < len(self._table_rows) and float(last) >= 0.9:
+            self._load_more_rows()
+
     def _clear_table(self) -> None:
-        for ch in self._ui["tree"].get_children():
-            self._ui["tree"].delete(ch)
+        self._table_rows = []
+        self._table_loaded = 0
+        children = self._ui["tree"].get_children()
+        if children:
+            self._ui["tree"].delete(*children)
 
     def _apply_filter(self) -> None:
         q = self._filter_var.get().lower()
@@ -1777,13 +1933,12 @@ class CtkDiscoveryApp(ctk.CTk):
             _t(self._lang, "tab_js"): "js",
             _t(self._lang, "tab_sensitive"): "sensitive",
         }.get(selected_tab)
-        rows = [
-            r for r in self._all_rows
-            if (not q or q in " ".join(str(value) for value in r.values()).lower())
-            and (tab_kind is None or r.get("kind") == tab_kind)
-            and (method_f == all_v or r["method"].upper() == method_f)
-            and (status_f == all_v or r["status"] == status_f)
-        ]
+        rows = self._table_model.filter(
+            q,
+            kind=tab_kind,
+            method=None if method_f == all_v else method_f,
+            status=None if status_f == all_v else status_f,
+        )
         if quantity_f != all_v:
             try:
                 rows = rows[:int(quantity_f)]
@@ -1806,21 +1961,15 @@ class CtkDiscoveryApp(ctk.CTk):
         self._apply_filter()
 
     def _sort_tree(self, col: str) -> None:
-        tree = self._ui["tree"]
-        items = [(tree.item(k, "values"), k) for k in tree.get_children("")]
-        col_idx = list(getattr(self, "_active_cols", self._COLS)).index(col)
         rev = self._sort_rev if self._sort_col == col else False
-        def sort_key(x):
-            v = x[0][col_idx]
-            try: return (0, int(v))
-            except (ValueError, IndexError): return (1, v.lower())
-        items.sort(key=sort_key, reverse=rev)
-        for i, (_, k) in enumerate(items):
-            tree.move(k, "", i)
-            cur_tags = list(tree.item(k, "tags"))
-            cur_tags = [t for t in cur_tags if t != "alt"]
-            if i % 2: cur_tags.append("alt")
-            tree.item(k, tags=cur_tags)
+        columns = tuple(getattr(self, "_active_cols", self._COLS))
+        position = columns.index(col)
+        rows = sorted(
+            self._table_rows,
+            key=lambda index: self._table_model.sort_key(index, columns, position),
+            reverse=rev,
+        )
+        self._refresh_table(rows)
         self._sort_col = col
         self._sort_rev = not rev if self._sort_col == col else False
 
@@ -1898,26 +2047,36 @@ class CtkDiscoveryApp(ctk.CTk):
     # ── Log ───────────────────────────────────────────────────────────────────
 
     def _log(self, message: str) -> None:
+        self._log_batch([message])
+
+    def _log_batch(self, messages: List[str]) -> None:
+        if not messages:
+            return
         ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        self._log_lines.append(f"{ts}\t{message}")
+        self._log_lines.extend(f"{ts}\t{message}" for message in messages)
+        # 저장용 로그에는 모두 남기고, 화면에는 최근 메시지만 그린다.
+        hidden = len(messages) - PROGRESS_MAX_RENDERED_MESSAGES
+        if hidden > 0:
+            messages = [_t(self._lang, "log_dropped", n=hidden)] + messages[hidden:]
         tree = self._ui["log_tree"]
-        lower = message.lower()
-        tags = []
-        if "오류" in message or "error" in lower or "failed" in lower or "실패" in message:
-            tags.append("log_error")
-        elif "경고" in message or "warning" in lower or "중지" in message or "stop" in lower:
-            tags.append("log_warn")
-        elif "완료" in message or "saved" in lower or "저장 완료" in message:
-            tags.append("log_ok")
-        tree.insert("", "end", values=(ts, message), tags=tags)
-        children = tree.get_children()
-        if children:
-            tree.see(children[-1])
+        item_id = ""
+        for message in messages:
+            lower = message.lower()
+            tags = []
+            if "오류" in message or "error" in lower or "failed" in lower or "실패" in message:
+                tags.append("log_error")
+            elif "경고" in message or "warning" in lower or "중지" in message or "stop" in lower:
+                tags.append("log_warn")
+            elif "완료" in message or "saved" in lower or "저장 완료" in message:
+                tags.append("log_ok")
+            item_id = tree.insert("", "end", values=(ts, message), tags=tags)
+        tree.see(item_id)
 
     def _on_clear_log(self) -> None:
         self._log_lines.clear()
-        for ch in self._ui["log_tree"].get_children():
-            self._ui["log_tree"].delete(ch)
+        children = self._ui["log_tree"].get_children()
+        if children:
+            self._ui["log_tree"].delete(*children)
 
     def _on_save_log(self) -> None:
         path = filedialog.asksaveasfilename(
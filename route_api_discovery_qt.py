@@ -6,9 +6,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import threading
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import QObject, QSettings, Qt, QThread, Signal
+from PySide6.QtCore import QObject, QSettings, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QFont, QGuiApplication
 from PySide6.QtWidgets import (
     QApplication,
@@ -41,8 +41,12 @@ from PySide6.QtWidgets import (
 
 from route_api_discovery import (
     CANCEL_MESSAGE,
+    PROGRESS_FLUSH_INTERVAL_MS,
+    PROGRESS_MAX_RENDERED_MESSAGES,
     Config,
+    ProgressChannel,
     ScanCancelled,
+    TableSearchIndex,
     build_batch_summary_text,
     build_execution_context,
     build_summary_text,
@@ -52,10 +56,14 @@ from route_api_discovery import (
     parse_hostname_filters,
     parse_header_lines,
     parse_input_urls,
+    resolve_sensitive_findings,
     save_export_bundle,
     validate_config,
 )
 
+# 결과 표는 이 단위로 나눠 채워서 큰 결과에서도 창이 멈추지 않게 한다.
+TABLE_RENDER_CHUNK_ROWS = 500
+
 UI_TEXTS = {
     "ko": {
         "window_title": "Route API Discovery - Precision Workbench",
@@ -186,6 +194,7 @@ UI_TEXTS = {
         "no_scan_title": "정지",
         "no_scan_body": "현재 실행 중인 스캔이 없습니다.",
         "log_cancel_requested": "[중지 요청] 현재 요청이 끝나면 스캔을 중지합니다.",
+        "log_dropped": "[로그 생략] 화면 갱신이 밀려 진행 메시지 {n}개를 표시하지 않았습니다. 로그 저장에는 모두 포함됩니다.",
         "log_save_completed": "저장 완료: {path} (Excel + HTML)",
         "scan_complete_message": "{count}개 URL 스캔 완료 (성공 {success}, 실패 {failed})",
         "log_error": "[오류] {message}",
@@ -347,6 +356,7 @@ UI_TEXTS = {
         "no_scan_title": "Stop",
         "no_scan_body": "There is no active scan to stop.",
         "log_cancel_requested": "[Stop requested] The scan will stop after the current request finishes.",
+        "log_dropped": "[Log trimmed] {n} progress messages were not shown while the UI caught up. Save Log still includes them.",
         "log_save_completed": "Saved: {path} (Excel + HTML)",
         "scan_complete_message": "Scanned {count} URL(s) (success {success}, failed {failed})",
         "log_error": "[Error] {message}",
@@ -567,6 +577,21 @@ class ScanRequest:
     config: Config
 
 
+@dataclass(frozen=True)
+class ResultTableSnapshot:
+    """Ready-to-render table rows for one scan result, built off the UI thread."""
+
+    result: dict
+    language: str
+    sensitive_records: Tuple[dict, ...]
+    js_rows: Tuple[Tuple[str, ...], ...]
+    page_rows: Tuple[Tuple[str, ...], ...]
+    api_rows: Tuple[Tuple[str, ...], ...]
+    js_search_index: TableSearchIndex
+    page_search_index: TableSearchIndex
+    api_search_index: TableSearchIndex
+
+
 @dataclass
 class TableTabBundle:
     widget: QWidget
@@ -582,21 +607,33 @@ class TableTabBundle:
 
 
 class ScanWorker(QObject):
-    progress = Signal(str)
+    tables_ready = Signal(object)
     finished = Signal(object)
     failed = Signal(str)
     cancelled = Signal(str)
 
-    def __init__(self, request: ScanRequest) -> None:
+    def __init__(
+        self,
+        request: ScanRequest,
+        snapshot_builder: Optional[Callable[[dict], ResultTableSnapshot]] = None,
+    ) -> None:
         super().__init__()
         self.request = request
         self.cancel_event = threading.Event()
+        self.progress_channel = ProgressChannel()
+        self.snapshot_builder = snapshot_builder
 
     def run(self) -> None:
+        execution = None
         try:
             execution = build_execution_context(self.request.config)
             execution.cancel_event = self.cancel_event
-            result = discover_many(self.request.config, self.request.urls, progress=self._emit_progress, execution=execution)
+            result = discover_many(self.request.config, self.request.urls, progress=self.progress_channel, execution=execution)
+            if self.cancel_event.is_set():
+                raise ScanCancelled(CANCEL_MESSAGE)
+            snapshots: Tuple[ResultTableSnapshot, ...] = ()
+            if self.snapshot_builder is not None:
+                snapshots = tuple(self.snapshot_builder(item) for item in result.get("results") or [])
             if self.cancel_event.is_set():
                 raise ScanCancelled(CANCEL_MESSAGE)
         except ScanCancelled as exc:
@@ -605,12 +642,15 @@ class ScanWorker(QObject):
         except Exception as exc:
             self.failed.emit(str(exc))
             return
+        finally:
+            if execution is not None:
+                execution.close()
 
+        # finished보다 먼저 보내야 결과 선택 시 미리 만든 표 데이터를 쓸 수 있다.
+        if snapshots:
+            self.tables_ready.emit(snapshots)
         self.finished.emit(result)
 
-    def _emit_progress(self, message: str) -> None:
-        self.progress.emit(message)
-
     def cancel(self) -> None:
         self.cancel_event.set()
 
@@ -683,6 +723,12 @@ class DiscoveryWindow(QMainWindow):
         self.worker: Optional[ScanWorker] = None
         self.save_thread: Optional[QThread] = None
         self.save_worker: Optional[SaveWorker] = None
+        self.progress_channel: Optional[ProgressChannel] = None
+        # 로그 위젯에 그리지 않은 메시지까지 포함한 저장용 로그.
+        self.log_lines: List[str] = []
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self._flush_progress)
         self.state_mode = "idle"
         self.last_error_message = ""
         self.last_save_error_message = ""
@@ -691,10 +737,16 @@ class DiscoveryWindow(QMainWindow):
         self.current_output_value = "-"
         self.current_output_save_failed = False
 
-        self.js_rows: List[Tuple[str, str, str, str, str, str, str, str]] = []
-        self.page_rows: List[Tuple[str, str, str, str, str, str, str]] = []
-        self.api_rows: List[Tuple[str, str, str, str, str, str]] = []
+        self.js_rows: Sequence[Tuple[str, ...]] = ()
+        self.page_rows: Sequence[Tuple[str, ...]] = ()
+        self.api_rows: Sequence[Tuple[str, ...]] = ()
         self.sensitive_records: List[dict] = []
+        self.js_search_index = TableSearchIndex(self.js_rows, len(JS_HEADER_KEYS))
+        self.page_search_index = TableSearchIndex(self.page_rows, len(PAGE_HEADER_KEYS))
+        self.api_search_index = TableSearchIndex(self.api_rows, len(RESULT_HEADER_KEYS))
+        self._table_snapshots: Tuple[ResultTableSnapshot, ...] = ()
+        self._pending_table_fills: Dict[int, Tuple[int, List[Tuple[str, ...]], int]] = {}
+        self._table_fill_generation = 0
 
         self._build_ui(
             initial_url=initial_url,
@@ -1447,7 +1499,7 @@ class DiscoveryWindow(QMainWindow):
         self.log_text.setMinimumHeight(180)
         self.log_text.setMaximumHeight(240)
         log_layout.addWidget(self.log_text)
-        self.log_clear_button.clicked.connect(lambda: self.log_text.clear())
+        self.log_clear_button.clicked.connect(self._clear_log)
         self.log_save_button.clicked.connect(self._save_log)
         content_layout.addWidget(log_card)
 
@@ -2046,10 +2098,11 @@ class DiscoveryWindow(QMainWindow):
         self._set_summary_card(self.card_recursive_value, 0)
         self._set_summary_card(self.card_sensitive_total_value, 0)
         self._set_summary_card(self.card_sensitive_high_value, 0)
-        self.js_rows = []
-        self.page_rows = []
-        self.api_rows = []
+        self.js_rows = ()
+        self.page_rows = ()
+        self.api_rows = ()
         self.sensitive_records = []
+        self._table_snapshots = ()
         if hasattr(self, "sensitive_type_combo"):
             self.sensitive_type_combo.setCurrentIndex(0)
         self._populate_table(self.js_table, [])
@@ -2129,6 +2182,20 @@ class DiscoveryWindow(QMainWindow):
         self.left_scroll.ensureWidgetVisible(self.option_card, 0, 24)
         self.max_js_spin.setFocus(Qt.FocusReason.OtherFocusReason)
 
+    def _append_log(self, messages: List[str]) -> None:
+        if not messages:
+            return
+        self.log_lines.extend(messages)
+        # 저장용 로그에는 모두 남기고, 화면에는 최근 메시지만 그린다.
+        hidden = len(messages) - PROGRESS_MAX_RENDERED_MESSAGES
+        if hidden > 0:
+            messages = [self.tr("log_dropped", n=hidden)] + messages[hidden:]
+        self.log_text.appendPlainText("\n".join(messages))
+
+    def _clear_log(self) -> None:
+        self.log_lines.clear()
+        self.log_text.clear()
+
     def _save_log(self) -> None:
         default = str(Path(self.default_output_path or "discovery-result").with_suffix(".log"))
         chosen, _ = QFileDialog.getSaveFileName(
@@ -2140,7 +2207,7 @@ class DiscoveryWindow(QMainWindow):
         if not chosen:
             return
         try:
-            Path(chosen).write_text(self.log_text.toPlainText(), encoding="utf-8")
+            Path(chosen).write_text("\n".join(self.log_lines), encoding="utf-8")
         except OSError as exc:
             QMessageBox.critical(self, self.tr("save_error_title"), self.tr("save_error_body", message=str(exc)))
 
@@ -2190,16 +2257,17 @@ class DiscoveryWindow(QMainWindow):
                 self.tr("security_warning_body"),
             )
 
-        self.log_text.clear()
+        self._clear_log()
         self.batch_result = None
         self.current_output_path = ""
         self._reset_result_views()
 
         self.worker_thread = QThread(self)
-        self.worker = ScanWorker(request)
+        self.worker = ScanWorker(request, snapshot_builder=self._build_table_snapshot)
+        self.progress_channel = self.worker.progress_channel
         self.worker.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self._on_progress)
+        self.worker.tables_ready.connect(self._on_tables_ready)
         self.worker.finished.connect(self._on_finished)
         self.worker.cancelled.connect(self._on_cancelled)
         self.worker.failed.connect(self._on_failed)
@@ -2213,9 +2281,10 @@ class DiscoveryWindow(QMainWindow):
         self.worker_thread.finished.connect(self._cleanup_worker)
 
         if not request.config.verify_ssl:
-            self.log_text.appendPlainText(self.tr("log_ssl_warning"))
+            self._append_log([self.tr("log_ssl_warning")])
         self._set_running_state()
         self.worker_thread.start()
+        self.progress_timer.start()
 
     def cancel_scan(self) -> None:
         if self.worker is None or self.worker_thread is None:
@@ -2224,13 +2293,19 @@ class DiscoveryWindow(QMainWindow):
         if self.worker.is_cancel_requested():
             return
         self.worker.cancel()
-        self.log_text.appendPlainText(self.tr("log_cancel_requested"))
+        self._append_log([self.tr("log_cancel_requested")])
         self._set_cancelling_state()
 
-    def _on_progress(self, message: str) -> None:
-        self.log_text.appendPlainText(message)
+    def _flush_progress(self) -> None:
+        if self.progress_channel is None:
+            return
+        self._append_log(self.progress_channel.drain().messages)
+
+    def _on_tables_ready(self, snapshots: object) -> None:
+        self._table_snapshots = tuple(snapshots) if isinstance(snapshots, (list, tuple)) else ()
 
     def _on_finished(self, batch_result: dict) -> None:
+        self._flush_progress()
         self.batch_result = batch_result
         self.current_output_path = ""
         self.current_output_save_failed = False
@@ -2241,8 +2316,9 @@ class DiscoveryWindow(QMainWindow):
         self._set_result_ready_state(self._build_ready_message(batch_result))
 
     def _on_failed(self, message: str) -> None:
+        self._flush_progress()
         self.last_save_failed = False
-        self.log_text.appendPlainText(self.tr("log_error", message=message))
+        self._append_log([self.tr("log_error", message=message)])
         self._set_error_state(message)
         QMessageBox.critical(self, self.tr("execution_error_title"), message)
 
@@ -2258,7 +2334,7 @@ class DiscoveryWindow(QMainWindow):
         self.current_output_save_failed = False
         self.last_save_failed = False
         self.last_save_error_message = ""
-        self.log_text.appendPlainText(self.tr("log_save_completed", path=output_label))
+        self._append_log([self.tr("log_save_completed", path=output_label)])
         self._set_current_output(output_label)
         self._refresh_result_selector(selected_index=selected_index)
         if self.batch_result:
@@ -2269,7 +2345,7 @@ class DiscoveryWindow(QMainWindow):
         self.current_output_path = ""
         self.last_save_failed = True
         self.last_save_error_message = message
-        self.log_text.appendPlainText(self.tr("log_save_error", message=message))
+        self._append_log([self.tr("log_save_error", message=message)])
         self._set_current_output("", save_failed=True)
         self._refresh_result_selector(selected_index=selected_index)
         batch_result = self.batch_result or {}
@@ -2287,7 +2363,8 @@ class DiscoveryWindow(QMainWindow):
         QMessageBox.critical(self, self.tr("save_error_title"), self.tr("save_error_body", message=message))
 
     def _on_cancelled(self, message: str) -> None:
-        self.log_text.appendPlainText(self.tr("log_cancelled", message=message))
+        self._flush_progress()
+        self._append_log([self.tr("log_cancelled", message=message)])
         self.batch_result = None
         self.current_output_path = ""
         self.last_save_failed = False
@@ -2297,6 +2374,9 @@ class DiscoveryWindow(QMainWindow):
         self.left_state_hint.setText(message)
 
     def _cleanup_worker(self) -> None:
+        self.progress_timer.stop()
+        self._flush_progress()
+        self.progress_channel = None
         self.worker = None
         self.worker_thread = None
 
@@ -2418,17 +2498,7 @@ class DiscoveryWindow(QMainWindow):
         label.setText(self.tr("count_label", visible=visible, total=total))
 
     def _extract_sensitive_findings(self, result: dict) -> List[dict]:
-        sensitive_raw = result.get("sensitive_findings")
-        hardcoded_raw = result.get("hardcoded_findings")
-        sensitive = [item for item in sensitive_raw if isinstance(item, dict)] if isinstance(sensitive_raw, list) else []
-        hardcoded = [item for item in hardcoded_raw if isinstance(item, dict)] if isinstance(hardcoded_raw, list) else []
-        if sensitive and hardcoded:
-            return sensitive + [item for item in hardcoded if item not in sensitive]
-        if sensitive:
-            return sensitive
-        if hardcoded:
-            return hardcoded
-        return []
+        return resolve_sensitive_findings(result)
 
     def _resolve_sensitive_metrics(self, result: dict, summary: dict) -> Tuple[int, int]:
         findings = self._extract_sensitive_findings(result)
@@ -2661,50 +2731,75 @@ class DiscoveryWindow(QMainWindow):
                 return True
         return False
 
-    def _rebuild_tables(self, result: dict) -> None:
-        self.sensitive_records = self._extract_sensitive_records(result)
-
-        self.js_rows = []
-        for item in result.get("js_files", []):
-            self.js_rows.append(
-                (
-                    str(item.get("depth", "")),
-                    _status_text(item.get("status_code")),
-                    self.tr("yes") if item.get("success") else self.tr("no"),
-                    str(item.get("length", "")),
-                    str(item.get("saved_path", "") or ""),
-                    str(item.get("save_error", "") or ""),
-                    str(item.get("error", "") or ""),
-                    str(item.get("url", "") or ""),
-                )
+    def _build_table_snapshot(self, result: dict) -> ResultTableSnapshot:
+        # 스캔 작업 스레드에서도 호출되므로 위젯에는 접근하지 않는다.
+        language = self.ui_language
+        yes_text = _ui_text(language, "yes")
+        no_text = _ui_text(language, "no")
+        js_rows: Tuple[Tuple[str, ...], ...] = tuple(
+            (
+                str(item.get("depth", "")),
+                _status_text(item.get("status_code")),
+                yes_text if item.get("success") else no_text,
+                str(item.get("length", "")),
+                str(item.get("saved_path", "") or ""),
+                str(item.get("save_error", "") or ""),
+                str(item.get("error", "") or ""),
+                str(item.get("url", "") or ""),
             )
-
-        self.page_rows = []
-        for item in self._page_items(result):
-            self.page_rows.append(
-                (
-                    _status_text(item.get("status_code")),
-                    str(item.get("length", "")),
-                    _accessible_text(item.get("accessible"), self.ui_language),
-                    str(item.get("probe_method", "") or ""),
-                    str(item.get("path", "") or ""),
-                    self._api_source_text(item),
-                    str(item.get("url", "") or ""),
-                )
+            for item in result.get("js_files", [])
+        )
+        page_rows = tuple(
+            (
+                _status_text(item.get("status_code")),
+                str(item.get("length", "")),
+                _accessible_text(item.get("accessible"), language),
+                str(item.get("probe_method", "") or ""),
+                str(item.get("path", "") or ""),
+                self._api_source_text(item),
+                str(item.get("url", "") or ""),
             )
-
-        self.api_rows = []
-        for item in self._api_items(result):
-            self.api_rows.append(
-                (
-                    _status_text(item.get("status_code")),
-                    _accessible_text(item.get("accessible"), self.ui_language),
-                    str(item.get("probe_method") or item.get("method") or ""),
-                    str(item.get("path") or item.get("endpoint") or ""),
-                    self._api_source_text(item),
-                    str(item.get("url", "") or ""),
-                )
+            for item in self._page_items(result)
+        )
+        api_rows = tuple(
+            (
+                _status_text(item.get("status_code")),
+                _accessible_text(item.get("accessible"), language),
+                str(item.get("probe_method") or item.get("method") or ""),
+                str(item.get("path") or item.get("endpoint") or ""),
+                self._api_source_text(item),
+                str(item.get("url", "") or ""),
             )
+            for item in self._api_items(result)
+        )
+        return ResultTableSnapshot(
+            result=result,
+            language=language,
+            sensitive_records=tuple(self._extract_sensitive_records(result)),
+            js_rows=js_rows,
+            page_rows=page_rows,
+            api_rows=api_rows,
+            js_search_index=TableSearchIndex(js_rows, len(JS_HEADER_KEYS)).prepare(),
+            page_search_index=TableSearchIndex(page_rows, len(PAGE_HEADER_KEYS)).prepare(),
+            api_search_index=TableSearchIndex(api_rows, len(RESULT_HEADER_KEYS)).prepare(),
+        )
+
+    def _table_snapshot_for(self, result: dict) -> ResultTableSnapshot:
+        for snapshot in self._table_snapshots:
+            if snapshot.result is result and snapshot.language == self.ui_language:
+                return snapshot
+        return self._build_table_snapshot(result)
+
+    def _rebuild_tables(self, result: dict) -> None:
+        snapshot = self._table_snapshot_for(result)
+        self.sensitive_records = list(snapshot.sensitive_records)
+        # 색인은 스냅샷과 함께 작업 스레드에서 만들어졌으므로 같은 행 객체를 그대로 쓴다.
+        self.js_rows = snapshot.js_rows
+        self.page_rows = snapshot.page_rows
+        self.api_rows = snapshot.api_rows
+        self.js_search_index = snapshot.js_search_index
+        self.page_search_index = snapshot.page_search_index
+        self.api_search_index = snapshot.api_search_index
 
         self._apply_sensitive_filters()
         self._apply_js_filters()
@@ -2737,6 +2832,7 @@ class DiscoveryWindow(QMainWindow):
             columns=self._localized_headers(JS_HEADER_KEYS),
             filter_column=filter_column,
             filter_text=self.js_filter_text.text(),
+            search_index=self.js_search_index,
         )
         if self.js_success_only_check.isChecked():
             rows = [row for row in rows if row[2] == self.tr("yes")]
@@ -2750,6 +2846,7 @@ class DiscoveryWindow(QMainWindow):
             columns=self._localized_headers(PAGE_HEADER_KEYS),
             filter_column=filter_column,
             filter_text=self.page_filter_text.text(),
+            search_index=self.page_search_index,
         )
         if self.page_accessible_only_check.isChecked():
             rows = [row for row in rows if row[2] == self.tr("yes")]
@@ -2765,6 +2862,7 @@ class DiscoveryWindow(QMainWindow):
             columns=self._localized_headers(RESULT_HEADER_KEYS),
             filter_column=filter_column,
             filter_text=self.api_filter_text.text(),
+            search_index=self.api_search_index,
         )
         if self.api_accessible_only_check.isChecked():
             rows = [row for row in rows if row[1] == self.tr("yes")]
@@ -2775,21 +2873,35 @@ class DiscoveryWindow(QMainWindow):
 
     def _populate_table(self, table: QTableWidget, rows: List[Tuple[str, ...]]) -> None:
         table.setSortingEnabled(False)
-        try:
-            table.setRowCount(len(rows))
-            for row_index, row in enumerate(rows):
-                for col_index, value in enumerate(row):
-                    text = str(value)
-                    item = SortableTableWidgetItem(text)
-                    sort_value = _table_sort_value(text)
-                    if sort_value is not None:
-                        item.setData(Qt.ItemDataRole.UserRole, sort_value)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-                    item.setToolTip(text)
-                    table.setItem(row_index, col_index, item)
-                table.setRowHeight(row_index, 28)
-        finally:
-            table.setSortingEnabled(True)
+        table.setRowCount(len(rows))
+        self._table_fill_generation += 1
+        self._pending_table_fills[id(table)] = (self._table_fill_generation, list(rows), 0)
+        self._fill_table_chunk(table, self._table_fill_generation)
+
+    def _fill_table_chunk(self, table: QTableWidget, generation: int) -> None:
+        pending = self._pending_table_fills.get(id(table))
+        if pending is None or pending[0] != generation:
+            return
+        _, rows, start = pending
+        end = min(len(rows), start + TABLE_RENDER_CHUNK_ROWS)
+        for row_index in range(start, end):
+            for col_index, value in enumerate(rows[row_index]):
+                text = str(value)
+                item = SortableTableWidgetItem(text)
+                sort_value = _table_sort_value(text)
+                if sort_value is not None:
+                    item.setData(Qt.ItemDataRole.UserRole, sort_value)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+                item.setToolTip(text)
+                table.setItem(row_index, col_index, item)
+            table.setRowHeight(row_index, 28)
+        if end < len(rows):
+            # 나머지 행은 이벤트 루프에 양보한 뒤 이어서 채운다.
+            self._pending_table_fills[id(table)] = (generation, rows, end)
+            QTimer.singleShot(0, table, lambda current=table, token=generation: self._fill_table_chunk(current, token))
+            return
+        del self._pending_table_fills[id(table)]
+        table.setSortingEnabled(True)
 
     def _on_table_double_click(self, table: QTableWidget, row: int, col: int) -> None:
         item = table.item(row, col)
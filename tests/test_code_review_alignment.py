@@ -29,6 +29,7 @@ from route_api_discovery import (
     probe_candidate,
     read_response_text,
     resolve_sensitive_findings,
+    result_row_has_dynamic_source,
     validate_js_output_dir,
     xlsx_cell_xml,
 )
@@ -287,6 +288,86 @@ class CodeReviewAlignmentTests(unittest.TestCase):
         self.assertEqual([item["url"] for item in result["js_files"]], ["https://example.com/a.js"])
         self.assertEqual(sum(1 for item in result["js_files"] if item["success"]), 0)
 
+    def test_discover_once_reuses_script_bodies_captured_by_dynamic_analysis(self) -> None:
+        config = Config(
+            url="https://example.com",
+            max_js_files=5,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("discovery-result.json"),
+            skip_probe=True,
+            scan_well_known=False,
+            dynamic_analysis=True,
+        )
+        root_html = '<html><script src="/a.js"></script><script src="/b.js"></script></html>'
+        fetched_urls = []
+
+        def fake_fetch(url: str, timeout: float, method: str = "GET", headers=None, execution=None, verify_ssl: bool = True):
+            fetched_urls.append(url)
+            if url == "https://example.com":
+                return FetchResult(url=url, status_code=200, text=root_html, success=True, length=len(root_html))
+            if url == "https://example.com/b.js":
+                return FetchResult(url=url, status_code=200, text="fetch('/api/b')", success=True, length=15)
+            self.fail(f"unexpected fetch: {url}")
+
+        def fake_dynamic(**kwargs):
+            kwargs["script_body_store"]["https://example.com/a.js"] = "fetch('/api/a')"
+            return {"enabled": True, "success": True, "events": [], "script_urls": ["https://example.com/a.js"]}
+
+        with patch("route_api_discovery.fetch_text", side_effect=fake_fetch), patch(
+            "route_api_discovery.collect_dynamic_candidates_with_playwright",
+            side_effect=fake_dynamic,
+        ):
+            result = _discover_once(config, "https://example.com", state=RecursiveDiscoveryState())
+
+        self.assertEqual(fetched_urls, ["https://example.com", "https://example.com/b.js"])
+        self.assertEqual(result["summary"]["js_fetched"], 2)
+        self.assertEqual(result["summary"]["js_reused_dynamic"], 1)
+        reused = next(item for item in result["js_files"] if item["url"] == "https://example.com/a.js")
+        self.assertTrue(reused["reused_dynamic_body"])
+
+    def test_discover_once_analyzes_reused_script_bodies_as_static_js(self) -> None:
+        config = Config(
+            url="https://example.com",
+            max_js_files=1,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("discovery-result.json"),
+            skip_probe=True,
+            scan_well_known=False,
+            dynamic_analysis=True,
+        )
+        root_html = '<html><script src="/a.js"></script><script src="/b.js"></script></html>'
+        script_bodies = {}
+
+        def fake_fetch(url: str, timeout: float, method: str = "GET", headers=None, execution=None, verify_ssl: bool = True):
+            if url == "https://example.com":
+                return FetchResult(url=url, status_code=200, text=root_html, success=True, length=len(root_html))
+            self.fail(f"unexpected fetch: {url}")
+
+        def fake_dynamic(**kwargs):
+            nonlocal script_bodies
+            script_bodies = kwargs["script_body_store"]
+            script_bodies["https://example.com/a.js"] = "const routes=[{path:'/settings/profile'}];"
+            script_bodies["https://example.com/b.js"] = "fetch('/api/b')"
+            return {"enabled": True, "success": True, "events": [], "script_urls": []}
+
+        with patch("route_api_discovery.fetch_text", side_effect=fake_fetch), patch(
+            "route_api_discovery.collect_dynamic_candidates_with_playwright",
+            side_effect=fake_dynamic,
+        ):
+            result = _discover_once(config, "https://example.com", state=RecursiveDiscoveryState())
+
+        # Reused bodies still count toward max_js_files and are dropped once consumed.
+        self.assertEqual(result["summary"]["js_fetched"], 1)
+        self.assertEqual(script_bodies, {})
+        page = next(item for item in result["all_pages"] if item["url"] == "https://example.com/settings/profile")
+        self.assertEqual(page["sources"], ["js:https://example.com/a.js"])
+        self.assertFalse(result_row_has_dynamic_source(page))
+        # A captured body the JS queue never reached keeps its dynamic label.
+        api = next(item for item in result["all_apis"] if item["url"] == "https://example.com/api/b")
+        self.assertEqual(api["sources"], ["playwright:response-js:https://example.com/b.js"])
+
     def test_discover_once_saves_successful_js_files_when_output_dir_is_set(self) -> None:
         with TemporaryDirectory() as tmp_dir:
             config = Config(
@@ -0,0 +1,57 @@
+import unittest
+
+from route_api_discovery_ctk import ResultTableModel, build_result_table_model
+
+
+def _rows() -> list:
+    return [
+        {"kind": "api", "method": "GET", "endpoint": "/api/users", "status": "200", "url": "https://example.com/api/users"},
+        {"kind": "page", "method": "PAGE", "endpoint": "/about", "status": "200", "url": "https://example.com/about"},
+        {"kind": "api", "method": "POST", "endpoint": "/api/user-groups", "status": "403", "url": "https://example.com/api/user-groups"},
+        {"kind": "api", "method": "GET", "endpoint": "/api/orders", "status": "200", "url": "https://example.com/api/orders"},
+    ]
+
+
+class ResultTableModelTests(unittest.TestCase):
+    def test_filter_by_kind_method_and_status_keeps_original_order(self) -> None:
+        model = ResultTableModel(_rows())
+
+        self.assertEqual(model.filter(kind="api"), [0, 2, 3])
+        self.assertEqual(model.filter(kind="api", method="GET"), [0, 3])
+        self.assertEqual(model.filter(status="200"), [0, 1, 3])
+
+    def test_extending_query_narrows_previous_matches(self) -> None:
+        model = ResultTableModel(_rows())
+
+        self.assertEqual(model.filter("USER", kind="api"), [0, 2])
+        model._search_text[3] = "/api/user-orders"
+        # Extending the query only rescans the previous matches.
+        self.assertEqual(model.filter("user-", kind="api"), [2])
+        self.assertEqual(model.filter("", kind="api"), [0, 2, 3])
+
+    def test_row_values_are_built_once_per_column_set(self) -> None:
+        rows = _rows()
+        model = ResultTableModel(rows)
+        columns = ("method", "endpoint")
+
+        first = model.values(0, columns)
+        rows[0]["endpoint"] = "/changed"
+
+        self.assertIs(model.values(0, columns), first)
+        self.assertEqual(first, ("GET", "/api/users"))
+        self.assertEqual(model.values(0, ("endpoint",)), ("/changed",))
+
+    def test_prebuilt_model_has_values_and_sort_keys_for_every_tab(self) -> None:
+        model = build_result_table_model(_rows())
+        columns = ("method", "status", "accessible", "length", "source", "url")
+
+        self.assertIn(columns, model._sort_keys)
+        self.assertEqual(model.sort_key(2, columns, 1), (0, 403))
+        self.assertEqual(
+            sorted(range(4), key=lambda index: model.sort_key(index, columns, 0)),
+            [0, 3, 1, 2],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
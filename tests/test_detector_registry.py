@@ -1,6 +1,8 @@
 import os
 import sys
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -13,6 +15,16 @@ from route_api_discovery import (
     DETECTOR_REGISTRY,
     collect_path_candidates,
     build_url_scope,
+    DetectorStatsRegistry,
+    merge_detector_stats,
+    filter_candidate_bucket_by_path,
+    SOURCE_ID_SET_THRESHOLD,
+    SOURCE_LABELS,
+    Config,
+    FetchResult,
+    RecursiveDiscoveryState,
+    _discover_once,
+    build_execution_context,
 )
 from route_api_discovery import (
     extract_openapi_paths,
@@ -62,6 +74,81 @@ class AddCandidateWithConfidenceTests(unittest.TestCase):
         self.assertEqual(candidate.sources, {"src1", "src2"})
 
 
+class CompactCandidateTests(unittest.TestCase):
+    def test_candidate_uses_slots_and_shared_label_ids(self):
+        first = Candidate(url="https://x/a", path="/a", kind="api", sources={"js:https://x/main.js"})
+        second = Candidate(url="https://x/b", path="/b", kind="api", sources=["js:https://x/main.js"])
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertEqual(first._source_ids, second._source_ids)
+        label = SOURCE_LABELS.label(first._source_ids[0])
+        self.assertIs(next(iter(second.sources)), label)
+
+    def test_label_views_behave_like_sets(self):
+        candidate = Candidate(url="https://x/a", path="/a", kind="page", detectors=["fetch"])
+        candidate.sources.update(["src2", "src1", "src2"])
+        candidate.detectors.add("axios_method")
+        candidate.detectors.add("fetch")
+
+        self.assertEqual(candidate.sources, {"src1", "src2"})
+        self.assertEqual(len(candidate.detectors), 2)
+        self.assertNotIn("missing", candidate.sources)
+        candidate.sources.discard("src2")
+        candidate.detectors.discard("fetch")
+        self.assertEqual(candidate.source_labels(), ["src1"])
+        self.assertEqual(candidate.detector_labels(), ["axios_method"])
+
+    def test_bucket_dedupe_merges_sources_only(self):
+        first = Candidate(url="https://x/a", path="/a", kind="page", sources=["s1"], detectors=["fetch"])
+        second = Candidate(url="https://x/a", path="/a", kind="page", sources=["s2", "s1"], detectors=["quoted_path"])
+
+        filtered, skipped = filter_candidate_bucket_by_path({"one": first, "two": second}, set())
+
+        self.assertEqual(skipped, 1)
+        merged = next(iter(filtered.values()))
+        self.assertEqual(merged.source_labels(), ["s1", "s2"])
+        self.assertEqual(merged.detector_labels(), ["fetch"])
+
+
+    def test_many_sources_switch_to_a_set(self):
+        labels = [f"js:https://x/chunk-{index}.js" for index in range(SOURCE_ID_SET_THRESHOLD * 3)]
+        candidate = Candidate(url="https://x/a", path="/a", kind="api", sources=labels[:5])
+        other = Candidate(url="https://x/a", path="/a", kind="api", sources=labels)
+
+        candidate.merge_sources(other)
+        candidate.add_source(labels[0])
+
+        self.assertIsInstance(candidate._source_ids, set)
+        self.assertEqual(candidate.source_labels(), sorted(labels))
+        candidate.sources.discard(labels[1])
+        self.assertEqual(len(candidate.sources), len(labels) - 1)
+
+    def test_source_labels_are_released_when_the_last_scan_scope_exits(self):
+        with SOURCE_LABELS.scan_scope():
+            with SOURCE_LABELS.scan_scope():
+                Candidate(url="https://x/a", path="/a", kind="api", sources=["js:https://x/main.1.js"])
+            # An overlapping scan keeps the table alive.
+            self.assertIsNotNone(SOURCE_LABELS.find("js:https://x/main.1.js"))
+        self.assertIsNone(SOURCE_LABELS.find("js:https://x/main.1.js"))
+        self.assertEqual(len(SOURCE_LABELS), 0)
+
+    def test_candidates_outlive_a_finished_scan_scope(self):
+        outside = Candidate(url="https://x/a", path="/a", kind="api", sources=["html:https://x/"])
+        with SOURCE_LABELS.scan_scope():
+            inside = Candidate(url="https://x/a", path="/a", kind="api", sources=["js:https://x/main.2.js"])
+        # Ids issued before the scope closed must not resolve against the new store.
+        Candidate(url="https://x/b", path="/b", kind="api", sources=["js:https://x/other.js", "html:https://x/other"])
+
+        self.assertEqual(outside.source_labels(), ["html:https://x/"])
+        self.assertIn("js:https://x/main.2.js", inside.sources)
+        outside.add_source("js:https://x/late.js")
+        outside.merge_sources(inside)
+        self.assertEqual(
+            outside.source_labels(),
+            ["html:https://x/", "js:https://x/late.js", "js:https://x/main.2.js"],
+        )
+
+
 class DetectorRegistryTests(unittest.TestCase):
     def test_registry_is_nonempty_and_well_formed(self):
         self.assertTrue(len(DETECTOR_REGISTRY) > 0)
@@ -205,5 +292,82 @@ class ExtractorRegistryWiringTests(unittest.TestCase):
         self.assertIn("https://example.com/api/widgets", urls)
 
 
+class DetectorStatsTests(unittest.TestCase):
+    def _collect(self, text, detector_stats=None):
+        page_bucket = {}
+        api_bucket = {}
+        collect_path_candidates(
+            text=text,
+            base_url="https://example.com",
+            source_label="js:https://example.com/app.js",
+            scope=build_url_scope("https://example.com", include_subdomains=True, excluded_hostnames=()),
+            page_bucket=page_bucket,
+            api_bucket=api_bucket,
+            detector_stats=detector_stats,
+        )
+        return page_bucket, api_bucket
+
+    def test_stats_count_calls_bytes_matches_and_accepted(self):
+        text = 'fetch("/api/users"); fetch("https://other.example/api/x");'
+        stats = DetectorStatsRegistry()
+
+        self._collect(text, stats)
+        snapshot = stats.snapshot()
+
+        self.assertEqual(set(snapshot), {d.name for d in DETECTOR_REGISTRY} | {"axios_combined", "axios_component"})
+        fetch = snapshot["fetch"]
+        self.assertEqual(fetch["calls"], 1)
+        self.assertEqual(fetch["bytes_scanned"], len(text))
+        self.assertEqual(fetch["matches"], 2)
+        # The off-scope URL matches but is not accepted as a candidate.
+        self.assertEqual(fetch["accepted"], 1)
+        self.assertEqual(snapshot["state_blob"]["matches"], 0)
+        self.assertGreaterEqual(fetch["time_ms"], 0)
+
+    def test_instrumentation_does_not_change_candidates(self):
+        text = 'axios.get("/api/a"); const r = [{path: "/about"}]; $.post("/api/b")'
+
+        plain = self._collect(text)
+        measured = self._collect(text, DetectorStatsRegistry())
+
+        for plain_bucket, measured_bucket in zip(plain, measured):
+            self.assertEqual(set(plain_bucket), set(measured_bucket))
+
+    def test_merge_detector_stats(self):
+        stats = DetectorStatsRegistry()
+        stats.record("fetch", 0.002, 10, 3, 1)
+        snapshot = stats.snapshot()
+
+        merged = merge_detector_stats([snapshot, snapshot])
+        self.assertEqual(merged["fetch"]["calls"], 2)
+        self.assertEqual(merged["fetch"]["accepted"], 2)
+        self.assertAlmostEqual(merged["fetch"]["time_ms"], 4.0)
+
+    def test_scan_totals_are_scoped_to_the_execution_context(self):
+        config = Config(
+            url="https://example.com",
+            max_js_files=0,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("discovery-result.json"),
+            skip_probe=True,
+            scan_well_known=False,
+            detector_stats=True,
+        )
+        html = "<script>fetch('/api/users')</script>"
+        fetched = FetchResult(url=config.url, status_code=200, text=html, success=True, length=len(html))
+
+        first = build_execution_context(config)
+        second = build_execution_context(config)
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+        with patch("route_api_discovery.fetch_text", return_value=fetched):
+            result = _discover_once(config, config.url, RecursiveDiscoveryState(), execution=first)
+
+        self.assertEqual(first.detector_stats.snapshot(), result["detector_stats"])
+        # A later scan (e.g. the next GUI run) starts from an empty registry.
+        self.assertEqual(second.detector_stats.snapshot(), {})
+
+
 if __name__ == "__main__":
     unittest.main()
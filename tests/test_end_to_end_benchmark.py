@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks import end_to_end
+from benchmarks.fixture_server import FixtureServer, SiteSpec, api_path, chunk_path, page_path
+
+
+def _request(url: str, method: str = "GET") -> tuple:
+    request = urllib.request.Request(url, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.read().decode("utf-8")
+    except urllib.error.HTTPError as exc:
+        return exc.code, ""
+
+
+class FixtureServerTests(unittest.TestCase):
+    def _start(self, spec: SiteSpec) -> FixtureServer:
+        server = FixtureServer(spec).start()
+        self.addCleanup(server.close)
+        return server
+
+    def test_serves_pages_chunks_robots_and_sitemap(self):
+        server = self._start(SiteSpec(pages=3, js_chunks=2))
+        base = server.url.rstrip("/")
+
+        status, index = _request(server.url)
+        self.assertEqual(status, 200)
+        self.assertIn(page_path(2), index)
+        self.assertIn(chunk_path(1), _request(base + "/static/js/main.js")[1])
+        self.assertIn(api_path(1, 0), _request(base + chunk_path(1))[1])
+        self.assertIn("Sitemap:", _request(base + "/robots.txt")[1])
+        self.assertIn(f"<loc>{page_path(0)}</loc>", _request(base + "/sitemap.xml")[1])
+        self.assertEqual(_request(base + "/missing")[0], 404)
+
+    def test_head_405_and_periodic_429(self):
+        server = self._start(SiteSpec(pages=1, js_chunks=1, head_not_allowed=True, rate_limit_every=3))
+        base = server.url.rstrip("/")
+
+        statuses = [
+            _request(base + page_path(0), method="HEAD")[0],
+            _request(base + page_path(0))[0],
+            _request(base + page_path(0))[0],
+        ]
+
+        self.assertEqual(statuses, [405, 200, 429])
+        self.assertEqual(server.stats()["methods"], {"HEAD": 1, "GET": 2})
+        server.reset_stats()
+        self.assertEqual(server.stats()["requests"], 0)
+
+
+class EndToEndBenchmarkTests(unittest.TestCase):
+    def test_reports_throughput_per_worker_and_delay(self):
+        specs = end_to_end.build_target_specs(2, pages=3, js_chunks=2, latency_ms=0, head_not_allowed_targets=1)
+
+        report = end_to_end.run_benchmark(specs, workers=[1, 2], delays=[0.0], timeout=5)
+
+        self.assertEqual([(item["max_workers"], item["request_delay"]) for item in report["scenarios"]], [(1, 0.0), (2, 0.0)])
+        for scenario in report["scenarios"]:
+            self.assertEqual(scenario["targets"], 2)
+            self.assertEqual(scenario["failed_targets"], 0)
+            self.assertGreater(scenario["probes"], 0)
+            self.assertGreater(scenario["targets_per_s"], 0)
+            self.assertGreater(scenario["probes_per_s"], 0)
+            # The HEAD-405 target forces GET retries on every probe.
+            self.assertGreater(scenario["statuses"].get("405", 0), 0)
+        self.assertEqual(report["site"]["head_not_allowed_targets"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
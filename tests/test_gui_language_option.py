@@ -8,7 +8,7 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 from PySide6.QtCore import QSettings, Qt, QThread
 from PySide6.QtWidgets import QApplication
 
-from route_api_discovery import CANCEL_MESSAGE, Config, build_summary_text
+from route_api_discovery import CANCEL_MESSAGE, PROGRESS_MAX_RENDERED_MESSAGES, Config, build_summary_text
 from route_api_discovery_qt import DiscoveryWindow, ScanRequest, ScanWorker
 
 
@@ -222,6 +222,90 @@ class GuiLanguageOptionTests(unittest.TestCase):
         for mojibake_marker in (chr(0xFFFD), chr(0x00C3), chr(0x00EC), chr(0x00ED), chr(0x00EB)):
             self.assertNotIn(mojibake_marker, cancelled_messages[0])
 
+    def test_scan_worker_progress_is_batched_into_log(self) -> None:
+        def fake_discover_many(config, urls, progress=None, execution=None):
+            for index in range(3):
+                progress(f"progress {index}")
+            return _sample_batch_result()
+
+        window = DiscoveryWindow()
+        try:
+            worker = ScanWorker(ScanRequest(urls=["https://example.com"], config=_sample_config()))
+            window.progress_channel = worker.progress_channel
+            with patch("route_api_discovery_qt.discover_many", side_effect=fake_discover_many):
+                worker.run()
+
+            self.assertEqual(window.log_text.toPlainText(), "")
+            window._flush_progress()
+
+            self.assertEqual(window.log_text.toPlainText().splitlines(), ["progress 0", "progress 1", "progress 2"])
+        finally:
+            window.progress_channel = None
+            window.close()
+
+    def test_log_widget_renders_recent_messages_but_keeps_all_for_saving(self) -> None:
+        window = DiscoveryWindow()
+        try:
+            messages = [f"progress {index}" for index in range(PROGRESS_MAX_RENDERED_MESSAGES + 3)]
+            window._append_log(messages)
+
+            rendered = window.log_text.toPlainText().splitlines()
+            self.assertEqual(len(rendered), PROGRESS_MAX_RENDERED_MESSAGES + 1)
+            self.assertEqual(rendered[1], "progress 3")
+            self.assertEqual(window.log_lines, messages)
+        finally:
+            window.close()
+
+    def test_scan_worker_builds_table_snapshots_before_finishing(self) -> None:
+        window = DiscoveryWindow()
+        try:
+            batch_result = _sample_batch_result()
+            worker = ScanWorker(
+                ScanRequest(urls=["https://example.com"], config=_sample_config()),
+                snapshot_builder=window._build_table_snapshot,
+            )
+            events: list[str] = []
+            worker.tables_ready.connect(lambda snapshots: events.append("tables"))
+            worker.finished.connect(lambda result: events.append("finished"))
+            worker.tables_ready.connect(window._on_tables_ready)
+            with patch("route_api_discovery_qt.discover_many", return_value=batch_result):
+                worker.run()
+
+            self.assertEqual(events, ["tables", "finished"])
+            snapshot = window._table_snapshots[0]
+            self.assertIs(snapshot.result, batch_result["results"][0])
+            self.assertEqual(snapshot.api_rows[0][3], "/api/users")
+            with patch.object(window, "_build_table_snapshot", side_effect=AssertionError("rebuilt")), patch(
+                "route_api_discovery_qt.TableSearchIndex",
+                side_effect=AssertionError("index built on the UI thread"),
+            ):
+                window._rebuild_tables(batch_result["results"][0])
+            self.assertIs(window.api_rows, snapshot.api_rows)
+            self.assertIs(window.api_search_index, snapshot.api_search_index)
+        finally:
+            window.close()
+
+    def test_large_tables_render_in_chunks(self) -> None:
+        from route_api_discovery_qt import TABLE_RENDER_CHUNK_ROWS
+
+        window = DiscoveryWindow()
+        try:
+            total = TABLE_RENDER_CHUNK_ROWS + 5
+            rows = [(str(index), "Yes", "GET", f"/api/{index}", "source", f"https://example.com/api/{index}") for index in range(total)]
+            window._populate_table(window.api_table, rows)
+
+            self.assertEqual(window.api_table.rowCount(), total)
+            self.assertIsNotNone(window.api_table.item(TABLE_RENDER_CHUNK_ROWS - 1, 3))
+            self.assertIsNone(window.api_table.item(TABLE_RENDER_CHUNK_ROWS, 3))
+            self.assertFalse(window.api_table.isSortingEnabled())
+
+            QApplication.processEvents()
+
+            self.assertEqual(window.api_table.item(total - 1, 3).text(), f"/api/{total - 1}")
+            self.assertTrue(window.api_table.isSortingEnabled())
+        finally:
+            window.close()
+
     def test_cancel_scan_state_resets_with_readable_cancel_message(self) -> None:
         class FakeWorker:
             def __init__(self) -> None:
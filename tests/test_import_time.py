@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative microseconds reported by `python -X importtime` for the CLI module.
+CLI_IMPORT_BUDGET_US = 400_000
+HEAVY_MODULE_ROOTS = ("PySide6", "customtkinter", "tkinter", "playwright", "zipfile")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+def _cli_import_time_us() -> int:
+    completed = _run_python("-X", "importtime", "-c", "import route_api_discovery")
+    for line in completed.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "route_api_discovery":
+            return int(parts[1])
+    raise AssertionError(f"importtime output has no route_api_discovery entry:\n{completed.stderr}")
+
+
+class CliImportCostTests(unittest.TestCase):
+    def test_cli_path_does_not_load_gui_or_browser_modules(self) -> None:
+        script = (
+            "import json, sys\n"
+            "import route_api_discovery as discovery\n"
+            "args = discovery.parse_args(['https://example.com'])\n"
+            "discovery.build_config(args)\n"
+            f"roots = {HEAVY_MODULE_ROOTS!r}\n"
+            "print(json.dumps(sorted(name for name in sys.modules if name.split('.')[0] in roots)))\n"
+        )
+        completed = _run_python("-c", script)
+
+        self.assertEqual(json.loads(completed.stdout), [])
+
+    def test_cli_import_time_stays_within_budget(self) -> None:
+        # Best of three keeps a busy machine from failing the budget on one slow run.
+        best = min(_cli_import_time_us() for _ in range(3))
+
+        self.assertLess(best, CLI_IMPORT_BUDGET_US)
+
+
+if __name__ == "__main__":
+    unittest.main()
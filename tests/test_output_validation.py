@@ -1,8 +1,25 @@
+import json
 import unittest
 import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
-from route_api_discovery import Config, derive_export_output_paths, save_export_bundle, save_result, validate_config, validate_output_path
+from route_api_discovery import (
+    Config,
+    FetchResult,
+    RecursiveDiscoveryState,
+    SheetSpec,
+    _discover_once,
+    _write_xlsx_package,
+    build_execution_context,
+    derive_export_output_paths,
+    iter_xlsx_sheet_xml,
+    save_export_bundle,
+    save_result,
+    validate_config,
+    validate_output_path,
+    xlsx_sheet_xml,
+)
 
 
 class OutputValidationTests(unittest.TestCase):
@@ -304,6 +321,76 @@ class OutputValidationTests(unittest.TestCase):
         self.assertEqual(derive_export_output_paths(Path("report.xlsx")), (Path("report.xlsx"), Path("report.html")))
         self.assertEqual(derive_export_output_paths(Path("report.html")), (Path("report.xlsx"), Path("report.html")))
 
+    def test_save_result_supports_ndjson_output(self) -> None:
+        output = Path("tests_tmp_output.ndjson")
+        try:
+            saved_path = save_result(
+                output,
+                {
+                    "input_url": "https://example.com",
+                    "final_url": "https://example.com/",
+                    "summary": {"page_count": 1, "api_count": 1},
+                    "all_pages": [{"path": "/about", "url": "https://example.com/about"}],
+                    "all_apis": [{"path": "/api/users", "url": "https://example.com/api/users"}],
+                    "js_files": [],
+                    "hardcoded_findings": [],
+                },
+            )
+            records = [json.loads(line) for line in saved_path.read_text(encoding="utf-8").splitlines()]
+        finally:
+            if output.exists():
+                output.unlink()
+
+        self.assertEqual([record["record_type"] for record in records], ["page", "api", "summary"])
+        self.assertEqual(records[1]["path"], "/api/users")
+        self.assertEqual(records[1]["target_url"], "https://example.com/")
+        self.assertEqual(records[-1]["summary"], {"page_count": 1, "api_count": 1})
+        self.assertNotIn("all_pages", records[-1])
+
+    def test_discover_once_streams_records_to_execution_sink(self) -> None:
+        config = Config(
+            url="https://example.com",
+            max_js_files=1,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("result.ndjson"),
+            skip_probe=True,
+            scan_well_known=False,
+        )
+        root_html = '<html><script>fetch("/api/users")</script></html>'
+        streamed = []
+
+        def fake_fetch(url: str, timeout: float, method: str = "GET", headers=None, execution=None, verify_ssl: bool = True):
+            return FetchResult(url=url, status_code=200, text=root_html, success=True, length=len(root_html))
+
+        execution = build_execution_context(config, record_sink=streamed.append)
+        with patch("route_api_discovery.fetch_text", side_effect=fake_fetch):
+            _discover_once(config, "https://example.com", RecursiveDiscoveryState(), execution=execution)
+
+        self.assertIn(("api", "/api/users"), [(record["record_type"], record.get("path")) for record in streamed])
+
+    def test_xlsx_sheet_is_streamed_row_by_row(self) -> None:
+        rows = [["=== 요약 ==="], ["경로", "URL"]] + [[f"/p/{index}", f"https://example.com/p/{index}"] for index in range(2000)]
+
+        chunks = list(iter_xlsx_sheet_xml(rows))
+
+        self.assertEqual("".join(chunks), xlsx_sheet_xml(rows))
+        self.assertLess(max(len(chunk) for chunk in chunks), 1000)
+        self.assertIn('<mergeCell ref="A1:B1"/>', "".join(chunks))
+
+    def test_write_xlsx_streams_sheet_entries_into_archive(self) -> None:
+        output = Path("tests_tmp_stream.xlsx")
+        rows = [["경로", "URL"], ["/a", "https://example.com/a"]]
+        try:
+            _write_xlsx_package(output, [SheetSpec("시트", rows)])
+            with zipfile.ZipFile(output) as workbook:
+                sheet_xml = workbook.read("xl/worksheets/sheet1.xml").decode("utf-8")
+        finally:
+            if output.exists():
+                output.unlink()
+
+        self.assertEqual(sheet_xml, xlsx_sheet_xml(rows))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import json
+import random
+import socket
 import threading
 import unittest
+from dataclasses import replace
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import patch
 from urllib.error import URLError
 from urllib.request import Request
@@ -109,6 +114,461 @@ class ProbeSafetyTests(unittest.TestCase):
         self.assertEqual(calls, ["HEAD"])
 
 
+class ProbeCacheTests(unittest.TestCase):
+    def _row(self, execution: discovery.ExecutionContext, url: str = "https://example.com/api/items", headers=None) -> dict:
+        candidate = discovery.Candidate(url=url, path=discovery.normalize_path(url), kind="api")
+        return discovery.build_result_row(candidate, kind="api", timeout=1.0, skip_probe=False, headers=headers, execution=execution)
+
+    def _execution(self, ttl: float = 300.0) -> discovery.ExecutionContext:
+        return discovery.ExecutionContext(
+            max_workers=4,
+            request_throttle=discovery.RequestThrottle(),
+            probe_cache=discovery.ProbeCache(ttl),
+        )
+
+    def test_each_unique_url_is_probed_once_across_targets(self) -> None:
+        calls: list[str] = []
+        release = threading.Event()
+
+        def fake_fetch(url: str, **kwargs) -> discovery.FetchResult:
+            calls.append(url)
+            release.wait(1)
+            return discovery.FetchResult(url, 200, "", True, 3)
+
+        execution = self._execution()
+        rows: list[dict] = []
+        with patch.object(discovery, "fetch_text", side_effect=fake_fetch):
+            threads = [threading.Thread(target=lambda: rows.append(self._row(execution))) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            release.set()
+            for thread in threads:
+                thread.join()
+            rows.append(self._row(execution, url="https://example.com/api/items#fragment"))
+
+        self.assertEqual(calls, ["https://example.com/api/items"])
+        self.assertEqual(len(rows), 5)
+        self.assertTrue(all(row["status_code"] == 200 and row["length"] == 3 for row in rows))
+        self.assertEqual(execution.probe_cache.stats(), {"entries": 1, "hits": 4, "misses": 1})
+
+    def test_header_profile_and_ttl_split_entries(self) -> None:
+        calls: list[str] = []
+
+        def fake_fetch(url: str, **kwargs) -> discovery.FetchResult:
+            calls.append(str(sorted((kwargs.get("headers") or {}).items())))
+            return discovery.FetchResult(url, 200, "", True, 0)
+
+        execution = self._execution(ttl=0.01)
+        with patch.object(discovery, "fetch_text", side_effect=fake_fetch):
+            self._row(execution)
+            self._row(execution, headers={"Authorization": "Bearer a"})
+            self._row(execution, headers={"authorization": "Bearer a"})
+            threading.Event().wait(0.02)
+            self._row(execution)
+
+        self.assertEqual(len(calls), 3)
+
+    def test_failed_probe_is_not_cached(self) -> None:
+        execution = self._execution()
+
+        with patch.object(discovery, "fetch_text", side_effect=discovery.ScanCancelled("stop")):
+            with self.assertRaises(discovery.ScanCancelled):
+                self._row(execution)
+
+        self.assertEqual(execution.probe_cache.stats()["entries"], 0)
+
+    def test_connect_failures_and_breaker_skips_are_not_cached(self) -> None:
+        calls: list[str] = []
+
+        def fake_fetch(url: str, **kwargs) -> discovery.FetchResult:
+            calls.append(url)
+            if len(calls) == 1:
+                return discovery.FetchResult(url, None, "", False, 0, error="connect timed out", connect_failed=True)
+            return discovery.FetchResult(url, 200, "", True, 3)
+
+        execution = replace(self._execution(), host_breaker=discovery.HostCircuitBreaker(threshold=1, cooldown_seconds=0.01))
+        with patch.object(discovery, "fetch_text", side_effect=fake_fetch):
+            failed = self._row(execution)
+            skipped = self._row(execution)
+            threading.Event().wait(0.02)
+            recovered = self._row(execution)
+
+        self.assertFalse(failed["accessible"])
+        self.assertIn("건너뛰었습니다", skipped["probe_error"])
+        self.assertEqual(recovered["status_code"], 200)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(execution.probe_cache.stats()["entries"], 1)
+
+    def test_cache_is_built_from_config(self) -> None:
+        args = discovery.parse_args(["https://example.com", "--probe-cache-ttl", "0"])
+
+        self.assertIsNone(discovery.build_execution_context(discovery.build_config(args)).probe_cache)
+        default = discovery.build_config(discovery.parse_args(["https://example.com"]))
+        self.assertEqual(discovery.build_execution_context(default).probe_cache.ttl_seconds, discovery.DEFAULT_PROBE_CACHE_TTL)
+
+
+class FairProbeSchedulerTests(unittest.TestCase):
+    def _drain(self, scheduler: discovery.FairProbeScheduler) -> list:
+        order = []
+        while True:
+            picked = scheduler.next_item()
+            if picked is None:
+                return order
+            scheduler.release(picked[0])
+            order.append(picked)
+
+    def test_round_robins_hosts_and_lanes(self) -> None:
+        scheduler = discovery.FairProbeScheduler(1)
+        for index in range(3):
+            scheduler.add("a", "page", f"a-page-{index}")
+            scheduler.add("a", "api", f"a-api-{index}")
+        scheduler.add("b", "api", "b-api-0")
+
+        items = [item for _, item in self._drain(scheduler)]
+
+        self.assertEqual(items, ["a-page-0", "b-api-0", "a-api-0", "a-page-1", "a-api-1", "a-page-2", "a-api-2"])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_strict_cap_blocks_busy_host_and_soft_cap_falls_back(self) -> None:
+        strict = discovery.FairProbeScheduler(1, strict=True)
+        soft = discovery.FairProbeScheduler(1)
+        for scheduler in (strict, soft):
+            scheduler.add("a", "api", 1)
+            scheduler.add("a", "api", 2)
+            self.assertEqual(scheduler.next_item(), ("a", 1))
+
+        self.assertIsNone(strict.next_item())
+        self.assertEqual(soft.next_item(), ("a", 2))
+        strict.release("a")
+        self.assertEqual(strict.next_item(), ("a", 2))
+
+    def test_host_limit_defaults(self) -> None:
+        self.assertEqual(discovery.resolve_host_probe_limit(8, 0, 1), (8, False))
+        self.assertEqual(discovery.resolve_host_probe_limit(8, 0, 3), (4, False))
+        self.assertEqual(discovery.resolve_host_probe_limit(8, 2, 1), (2, True))
+
+    def test_probe_rows_interleave_hosts_under_strict_cap(self) -> None:
+        lock = threading.Lock()
+        active: dict = {}
+        peaks: dict = {}
+        order: list[str] = []
+
+        def fake_fetch(url: str, **kwargs) -> discovery.FetchResult:
+            host = discovery.get_origin_key(url)
+            with lock:
+                order.append(host)
+                active[host] = active.get(host, 0) + 1
+                peaks[host] = max(peaks.get(host, 0), active[host])
+            threading.Event().wait(0.01)
+            with lock:
+                active[host] -= 1
+            return discovery.FetchResult(url, 200, "", True, 1)
+
+        def bucket(host: str, prefix: str, count: int) -> dict:
+            urls = [f"https://{host}/{prefix}/{index:02d}" for index in range(count)]
+            return {url: discovery.Candidate(url=url, path=discovery.normalize_path(url), kind=prefix) for url in urls}
+
+        pages = bucket("slow.example", "page", 12)
+        apis = {**bucket("slow.example", "api", 12), **bucket("fast.example", "api", 4)}
+        execution = discovery.ExecutionContext(max_workers=4, request_throttle=discovery.RequestThrottle(), max_host_workers=2)
+        done: list[str] = []
+
+        with patch.object(discovery, "fetch_text", side_effect=fake_fetch):
+            rows = discovery.build_probe_rows(
+                [("page", pages), ("api", apis)],
+                timeout=1.0,
+                skip_probe=False,
+                execution=execution,
+                on_kind_done=done.append,
+            )
+
+        self.assertEqual(peaks, {"https://slow.example": 2, "https://fast.example": 2})
+        # The small host is not starved behind the large one.
+        self.assertLess(max(index for index, host in enumerate(order) if host == "https://fast.example"), 12)
+        self.assertEqual([row["path"] for row in rows["page"]], sorted(item.path for item in pages.values()))
+        self.assertEqual([row["url"] for row in rows["api"]], [item.url for item in sorted(apis.values(), key=lambda item: (item.path, item.url))])
+        self.assertEqual(sorted(done), ["api", "page"])
+
+
+class ProbePoolTests(unittest.TestCase):
+    def _bucket(self, prefix: str, count: int = 3) -> dict:
+        urls = [f"https://example.com/{prefix}/{index}" for index in range(count)]
+        return {url: discovery.Candidate(url=url, path=discovery.normalize_path(url), kind="api") for url in urls}
+
+    def test_one_executor_serves_every_target_until_closed(self) -> None:
+        threads: set[str] = set()
+
+        def fake_fetch(url: str, **kwargs) -> discovery.FetchResult:
+            threads.add(threading.current_thread().name)
+            return discovery.FetchResult(url, 200, "", True, 0)
+
+        execution = discovery.ExecutionContext(max_workers=2, request_throttle=discovery.RequestThrottle())
+        # Per-target copies made for profiling must keep using the same pool.
+        target_execution = replace(execution, profiler=discovery.ScanProfiler())
+        with patch.object(discovery, "fetch_text", side_effect=fake_fetch):
+            discovery.build_result_rows(self._bucket("a"), kind="api", timeout=1.0, skip_probe=False, execution=execution)
+            executor = execution.probe_pool.executor(2)
+            discovery.build_result_rows(self._bucket("b"), kind="api", timeout=1.0, skip_probe=False, execution=target_execution)
+
+        self.assertIs(target_execution.probe_pool.executor(2), executor)
+        self.assertLessEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("route-probe") for name in threads))
+
+        execution.close()
+        self.assertIsNot(execution.probe_pool.executor(2), executor)
+        execution.close()
+
+    def test_discover_closes_the_pool_it_created(self) -> None:
+        pools: list = []
+        original = discovery.build_execution_context
+
+        def tracking_context(config, record_sink=None):
+            execution = original(config, record_sink=record_sink)
+            pools.append(execution.probe_pool)
+            return execution
+
+        config = discovery.Config(
+            url="https://example.com",
+            max_js_files=1,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("unused.json"),
+            skip_probe=False,
+        )
+        with patch.object(discovery, "build_execution_context", side_effect=tracking_context), \
+                patch.object(discovery.ProbePool, "shutdown", autospec=True) as shutdown, \
+                patch.object(discovery, "_discover_once", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                discovery.discover(config)
+
+        self.assertEqual(len(pools), 1)
+        shutdown.assert_called_once_with(pools[0])
+
+
+class ConnectionDeadlineTests(unittest.TestCase):
+    def _serve(self, delay: float = 0.0) -> str:
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self) -> None:
+                threading.Event().wait(delay)
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            do_GET = do_HEAD
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    def _closed_port_url(self) -> str:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        return f"http://127.0.0.1:{port}/"
+
+    def _execution(self, threshold: int = 2) -> discovery.ExecutionContext:
+        return discovery.ExecutionContext(
+            max_workers=1,
+            request_throttle=discovery.RequestThrottle(),
+            connect_timeout=0.2,
+            host_breaker=discovery.HostCircuitBreaker(threshold),
+            dns_cache=discovery.DnsCache(),
+        )
+
+    def test_slow_response_is_bound_by_read_timeout_only(self) -> None:
+        url = self._serve(delay=0.4)
+
+        result = discovery.fetch_text(url, timeout=2.0, execution=self._execution())
+
+        self.assertTrue(result.success)
+        self.assertFalse(result.connect_failed)
+
+    def test_dead_host_is_probed_once_per_candidate_then_short_circuited(self) -> None:
+        url = self._closed_port_url()
+        execution = self._execution(threshold=2)
+
+        with patch.object(discovery, "fetch_text", wraps=discovery.fetch_text) as fetch:
+            first = discovery.probe_candidate(url + "a", kind="api", timeout=1.0, execution=execution)
+            discovery.probe_candidate(url + "b", kind="api", timeout=1.0, execution=execution)
+            skipped = discovery.probe_candidate(url + "c", kind="api", timeout=1.0, execution=execution)
+
+        # No GET retry after a failed connect, and nothing at all once the host is down.
+        self.assertEqual(fetch.call_count, 2)
+        self.assertIsNone(first.status_code)
+        self.assertIn("건너뛰었습니다", skipped.error)
+        self.assertEqual(execution.host_breaker.down_hosts(), [url.rstrip("/")])
+        self.assertEqual(execution.host_breaker.short_circuited, 1)
+
+    def test_breaker_closes_on_success_and_retries_after_cooldown(self) -> None:
+        breaker = discovery.HostCircuitBreaker(1, cooldown_seconds=0.0)
+        breaker.record_failure("https://a.example")
+        self.assertEqual(breaker.down_hosts(), ["https://a.example"])
+        self.assertTrue(breaker.allow("https://a.example"))
+
+        breaker.record_success("https://a.example")
+        self.assertEqual(breaker.down_hosts(), [])
+
+        slow = discovery.HostCircuitBreaker(1)
+        slow.record_failure("https://b.example")
+        self.assertFalse(slow.allow("https://b.example"))
+        self.assertTrue(slow.allow("https://c.example"))
+
+    def test_name_resolution_is_cached_per_scan(self) -> None:
+        url = self._serve()
+        execution = self._execution()
+
+        with patch.object(discovery.socket, "getaddrinfo", wraps=socket.getaddrinfo) as resolve:
+            for path in ("a", "b", "c"):
+                self.assertTrue(discovery.fetch_text(url + path, timeout=2.0, execution=execution).success)
+
+        self.assertEqual(resolve.call_count, 1)
+
+    def test_config_flags_reach_execution_context(self) -> None:
+        args = discovery.parse_args(["https://example.com", "--connect-timeout", "1.5", "--host-failure-threshold", "0"])
+        execution = discovery.build_execution_context(discovery.build_config(args))
+
+        self.assertEqual(execution.connect_timeout, 1.5)
+        self.assertIsNone(execution.host_breaker)
+        self.assertIsNotNone(execution.dns_cache)
+
+
+class DnsCacheTests(unittest.TestCase):
+    ADDRESS = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 443))]
+
+    def _fake_resolver(self, calls: list, failing: tuple = ()):
+        def fake_getaddrinfo(host, port, *args):
+            calls.append(host)
+            if host in failing:
+                raise socket.gaierror(-2, "Name or service not known")
+            return list(self.ADDRESS)
+
+        return fake_getaddrinfo
+
+    def test_ttl_negative_entries_and_stats(self) -> None:
+        calls: list[str] = []
+        cache = discovery.DnsCache(ttl_seconds=0.05, negative_ttl_seconds=10)
+
+        with patch.object(discovery.socket, "getaddrinfo", side_effect=self._fake_resolver(calls, failing=("dead.example",))):
+            cache.resolve("App.Example", 443)
+            cache.resolve("app.example", 443)
+            for _ in range(3):
+                with self.assertRaises(socket.gaierror):
+                    cache.resolve("dead.example", 443)
+            threading.Event().wait(0.06)
+            cache.resolve("app.example", 443)
+
+        self.assertEqual(calls, ["App.Example", "dead.example", "app.example"])
+        stats = cache.stats()
+        self.assertEqual(stats["hosts"]["app.example"]["lookups"], 3)
+        self.assertEqual(stats["hosts"]["app.example"]["cache_hits"], 1)
+        self.assertEqual(stats["hosts"]["app.example"]["addresses"], ["93.184.216.34"])
+        self.assertEqual(stats["hosts"]["dead.example"]["failures"], 1)
+        self.assertEqual((stats["lookups"], stats["cache_hits"], stats["failures"]), (6, 3, 1))
+
+    def test_concurrent_lookups_share_one_resolution(self) -> None:
+        calls: list[str] = []
+        release = threading.Event()
+        resolver = self._fake_resolver(calls)
+
+        def slow_resolver(*args):
+            release.wait(1)
+            return resolver(*args)
+
+        cache = discovery.DnsCache()
+        results: list = []
+        with patch.object(discovery.socket, "getaddrinfo", side_effect=slow_resolver):
+            threads = [threading.Thread(target=lambda: results.append(cache.resolve("app.example", 443))) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(calls, ["app.example"])
+        self.assertEqual(results, [self.ADDRESS] * 4)
+
+    def test_prefetch_resolves_each_public_host_once(self) -> None:
+        calls: list[str] = []
+        urls = [
+            "https://app.example/a",
+            "https://app.example/b",
+            "https://api.example:8443/v1",
+            "http://127.0.0.1/local",
+            "http://localhost/local",
+            "https://93.184.216.34/ip",
+        ]
+        bucket = {url: discovery.Candidate(url=url, path=discovery.normalize_path(url), kind="api") for url in urls}
+        execution = discovery.ExecutionContext(max_workers=4, request_throttle=discovery.RequestThrottle(), dns_cache=discovery.DnsCache())
+        self.addCleanup(execution.close)
+
+        with patch.object(discovery.socket, "getaddrinfo", side_effect=self._fake_resolver(calls)):
+            self.assertEqual(discovery.prefetch_dns([bucket, {}], execution), 2)
+            self.assertEqual(discovery.prefetch_dns([bucket], execution, proxy_url="http://proxy:8080"), 0)
+
+        self.assertEqual(sorted(calls), ["api.example", "app.example"])
+        self.assertEqual(execution.dns_cache.stats()["prefetched_hosts"], 2)
+
+    def test_malformed_hostname_fails_fast_and_is_negative_cached(self) -> None:
+        url = "https://foo..example.com/api/items"
+        bucket = {url: discovery.Candidate(url=url, path=discovery.normalize_path(url), kind="api")}
+        execution = discovery.ExecutionContext(max_workers=1, request_throttle=discovery.RequestThrottle(), dns_cache=discovery.DnsCache())
+        results: list = []
+
+        def scan() -> None:
+            discovery.prefetch_dns([bucket], execution)
+            results.append(discovery.fetch_text(url, timeout=1.0, execution=execution))
+            results.append(discovery.fetch_text(url, timeout=1.0, execution=execution))
+
+        worker = threading.Thread(target=scan, daemon=True)
+        worker.start()
+        worker.join(5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result.connect_failed for result in results))
+        host = execution.dns_cache.stats()["hosts"]["foo..example.com"]
+        self.assertEqual((host["lookups"], host["cache_hits"], host["failures"]), (3, 2, 1))
+
+    def test_discover_reports_resolution_stats(self) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self.send_response(200)
+                self.end_headers()
+                if self.path == "/":
+                    self.wfile.write(b'<a href="/one">1</a><a href="/two">2</a>')
+
+            do_HEAD = do_GET
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        config = discovery.Config(
+            url=f"http://127.0.0.1:{server.server_port}/",
+            max_js_files=1,
+            max_depth=0,
+            timeout=2,
+            output=Path("unused.json"),
+            skip_probe=False,
+            scan_well_known=False,
+        )
+
+        result = discovery.discover(config)
+
+        host = result["dns_resolution"]["hosts"]["127.0.0.1"]
+        self.assertGreaterEqual(host["lookups"], 3)
+        self.assertEqual(host["lookups"] - host["cache_hits"], 1)
+        self.assertNotIn("dns_resolution", discovery.discover(replace(config, dns_cache_ttl=0)))
+
+
 class CancellationTests(unittest.TestCase):
     def test_wait_with_cancellation_aborts_immediately(self) -> None:
         execution = discovery.ExecutionContext(
@@ -129,6 +589,31 @@ class CandidateIdentityTests(unittest.TestCase):
             "/api/items?page=2",
         )
 
+    def test_parsed_url_fields_match_helpers(self) -> None:
+        parsed = discovery.parse_url("https://Example.COM./api/items?page=2")
+
+        self.assertEqual(parsed.scheme, "https")
+        self.assertEqual(parsed.host_key, "example.com")
+        self.assertEqual(parsed.path_and_query, "/api/items?page=2")
+        self.assertEqual(parsed.identity, "https://Example.COM./api/items?page=2")
+        self.assertEqual(discovery.candidate_identity("/relative"), "/relative")
+        self.assertEqual(discovery.normalize_path("https://example.com"), "/")
+
+    def test_parse_url_is_memoized_and_bounded(self) -> None:
+        discovery.parse_url.cache_clear()
+        url = "https://example.com/api/cached"
+
+        discovery.candidate_identity(url)
+        discovery.normalize_path(url)
+        discovery.get_hostname_key(url)
+
+        info = discovery.parse_url.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+        self.assertEqual(info.maxsize, discovery.PARSED_URL_CACHE_SIZE)
+
+    def test_invalid_url_still_rejected(self) -> None:
+        self.assertFalse(discovery.is_http_url("http://[::1"))
+
 
 class HeaderValidationTests(unittest.TestCase):
     def test_single_header_entry_uses_common_validation(self) -> None:
@@ -149,6 +634,39 @@ class ScopeSafetyTests(unittest.TestCase):
         self.assertTrue(discovery.url_matches_scope("https://assets.tenant-a.github.io/app.js", scope))
         self.assertFalse(discovery.url_matches_scope("https://tenant-b.github.io/app.js", scope))
 
+    def test_excluded_subdomains_match_on_label_boundaries(self) -> None:
+        scope = discovery.build_url_scope(
+            "https://example.com",
+            include_subdomains=True,
+            excluded_hostnames=("CDN.example.com.", "admin.example.com"),
+        )
+
+        self.assertTrue(discovery.url_matches_scope("https://example.com/", scope))
+        self.assertTrue(discovery.url_matches_scope("https://api.example.com/v1", scope))
+        self.assertTrue(discovery.url_matches_scope("https://mycdn.example.com/x.js", scope))
+        self.assertFalse(discovery.url_matches_scope("https://cdn.example.com/x.js", scope))
+        self.assertFalse(discovery.url_matches_scope("https://eu.cdn.example.com/x.js", scope))
+        self.assertFalse(discovery.url_matches_scope("https://notexample.com/", scope))
+        self.assertTrue(discovery.is_hostname_excluded("a.admin.example.com", scope.excluded_hostnames))
+
+    def test_target_host_stays_in_scope_even_when_listed_as_excluded(self) -> None:
+        scope = discovery.build_url_scope("https://app.example.com", include_subdomains=False, excluded_hostnames=("app.example.com",))
+
+        self.assertTrue(discovery.url_matches_scope("https://app.example.com/a", scope))
+        self.assertFalse(discovery.url_matches_scope("https://x.app.example.com/a", scope))
+
+    def test_matcher_caches_verdicts_and_is_rebuilt_by_replace(self) -> None:
+        scope = discovery.build_url_scope("https://example.com", excluded_hostnames=("cdn.example.com",))
+
+        discovery.url_matches_scope("https://cdn.example.com/a.js", scope)
+        discovery.url_matches_scope("https://cdn.example.com/b.js", scope)
+        narrowed = replace(scope, include_subdomains=False)
+
+        self.assertEqual(scope.matcher._verdicts, {"cdn.example.com": False})
+        self.assertIsNot(narrowed.matcher, scope.matcher)
+        self.assertFalse(discovery.url_matches_scope("https://api.example.com/", narrowed))
+        self.assertEqual(narrowed, discovery.build_url_scope("https://example.com", False, ("cdn.example.com",)))
+
 
 class DiscoveryRedirectTests(unittest.TestCase):
     def test_redirected_document_uses_final_url_for_relative_assets(self) -> None:
@@ -239,6 +757,115 @@ class DiscoveryRedirectTests(unittest.TestCase):
             server.server_close()
 
 
+class ProfileModeTests(unittest.TestCase):
+    def _serve(self) -> HTTPServer:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path == "/":
+                    self.send_response(200)
+                    self.end_headers()
+                    self.wfile.write(b'<script src="/app.js"></script><script>fetch("/api/inline")</script>')
+                    return
+                if self.path == "/app.js":
+                    self.send_response(200)
+                    self.end_headers()
+                    self.wfile.write(b"fetch('/api/from-js')")
+                    return
+                self.send_response(404)
+                self.end_headers()
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _config(self, server: HTTPServer, profile: bool) -> discovery.Config:
+        return discovery.Config(
+            url=f"http://127.0.0.1:{server.server_port}/",
+            max_js_files=5,
+            max_depth=1,
+            timeout=2,
+            output=Path("unused.json"),
+            skip_probe=True,
+            profile=profile,
+        )
+
+    def test_profile_records_phases_detectors_and_host_latency(self) -> None:
+        server = self._serve()
+
+        result = discovery.discover(self._config(server, profile=True))
+
+        performance = result["performance"]
+        for phase in ("html_fetch", "inline_analysis", "js_crawl", "well_known", "page_probe", "api_probe"):
+            self.assertIn(phase, performance["phases"])
+        self.assertNotIn("dynamic", performance["phases"])
+        # The detector table is stored once, under detector_stats.
+        self.assertNotIn("detectors", performance)
+        self.assertEqual(performance["detectors_ref"], "#/detector_stats")
+        self.assertGreaterEqual(result["detector_stats"]["fetch"]["matches"], 2)
+        self.assertIn("detector_stats", result["recursive_scan_records"][0])
+        host = performance["hosts"]["127.0.0.1"]
+        # Start page, app.js, robots.txt and sitemap.xml.
+        self.assertEqual(performance["request_count"], 4)
+        self.assertEqual(host["requests"], 4)
+        self.assertEqual(sum(host["histogram"].values()), 4)
+        self.assertGreater(performance["bytes_downloaded"], 0)
+        self.assertEqual(result["recursive_scan_records"][0]["performance"]["request_count"], 4)
+        self.assertIn("Request Latency by Host", discovery.build_html_report(result, "report.html"))
+
+    def test_profile_block_is_absent_by_default(self) -> None:
+        server = self._serve()
+
+        result = discovery.discover(self._config(server, profile=False))
+
+        self.assertNotIn("performance", result)
+        self.assertNotIn("Request Latency by Host", discovery.build_html_report(result, "report.html"))
+
+    def test_profile_without_execution_closes_its_probe_pool(self) -> None:
+        server = self._serve()
+        config = self._config(server, profile=True)
+
+        with patch.object(discovery.ProbePool, "shutdown", autospec=True) as shutdown:
+            result = discovery._discover_once(config, config.url, discovery.RecursiveDiscoveryState())
+
+        self.assertIn("performance", result)
+        shutdown.assert_called_once()
+
+    def test_detector_stats_without_profile(self) -> None:
+        server = self._serve()
+        config = self._config(server, profile=False)
+        config.detector_stats = True
+
+        result = discovery.discover(config)
+
+        self.assertNotIn("performance", result)
+        self.assertTrue(result["detector_stats_enabled"])
+        # The inline fetch is seen in the HTML and in the inline script, plus one in app.js.
+        self.assertEqual(result["detector_stats"]["fetch"]["accepted"], 3)
+
+    def test_merge_performance_blocks_sums_targets(self) -> None:
+        profiler = discovery.ScanProfiler()
+        profiler.record_request("https://example.com/a", 0.02, 10)
+        profiler.record_request("https://example.com/b", 3.0, 5)
+        profiler.detector_stats.record("fetch", 0.001, 100, 2, 1)
+        block = profiler.to_dict()
+
+        merged = discovery.merge_performance_blocks([block, block])
+
+        self.assertEqual(merged["request_count"], 4)
+        self.assertEqual(merged["bytes_downloaded"], 30)
+        self.assertNotIn("detectors", merged)
+        self.assertEqual(merged["detectors_ref"], "#/detector_stats")
+        histogram = merged["hosts"]["example.com"]["histogram"]
+        self.assertEqual(histogram["<=50ms"], 2)
+        self.assertEqual(histogram["<=5000ms"], 2)
+        self.assertEqual(merged["hosts"]["example.com"]["max_ms"], 3000.0)
+
+
 class SensitiveOutputTests(unittest.TestCase):
     def test_hardcoded_secret_output_retains_plaintext_and_masked_value(self) -> None:
         findings: list[dict] = []
@@ -287,12 +914,428 @@ class SensitiveGuiDisplayTests(unittest.TestCase):
         self.assertEqual(sensitive_row["value"], "SuperSecret123!")
 
 
+class ResultSchemaTests(unittest.TestCase):
+    def _result(self) -> dict:
+        config = discovery.Config(
+            url="https://example.com",
+            max_js_files=1,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("discovery-result.json"),
+            skip_probe=True,
+        )
+        result = discovery.build_empty_scan_result(config, config.url, error="", status="success")
+        result["hardcoded_findings"] = [{"category": "credential", "value": "SuperSecret123!", "context": "pw=SuperSecret123!"}]
+        return discovery.build_batch_result([result], [config.url], config)
+
+    def test_v2_result_stores_findings_once(self) -> None:
+        batch = self._result()
+        record = batch["results"][0]
+
+        self.assertEqual(batch["schema_version"], discovery.RESULT_SCHEMA_VERSION)
+        self.assertNotIn("sensitive_findings", record)
+        self.assertNotIn("sensitive_summary", record)
+        # No re-merge: the stored list is handed back as-is.
+        self.assertIs(discovery.resolve_sensitive_findings(record), record["hardcoded_findings"])
+        with TemporaryDirectory() as tmp:
+            compact = discovery.write_json(Path(tmp) / "v2.json", batch).read_text(encoding="utf-8")
+            legacy = discovery.write_json(Path(tmp) / "legacy.json", discovery.legacy_result_view(batch)).read_text(encoding="utf-8")
+        self.assertEqual(compact.count("SuperSecret123!"), 2)
+        self.assertEqual(legacy.count("SuperSecret123!"), 4)
+
+    def test_legacy_view_aliases_without_mutating_result(self) -> None:
+        batch = self._result()
+
+        view = discovery.legacy_result_view(batch)
+
+        record = view["results"][0]
+        self.assertIs(record["sensitive_findings"], record["hardcoded_findings"])
+        self.assertIs(record["sensitive_summary"], record["hardcoded_summary"])
+        self.assertNotIn("sensitive_findings", batch["results"][0])
+        self.assertIs(discovery.resolve_sensitive_findings(record), record["hardcoded_findings"])
+
+    def test_legacy_schema_flag_is_threaded_into_config(self) -> None:
+        args = discovery.parse_args(["https://example.com", "--legacy-result-schema"])
+
+        self.assertTrue(discovery.build_config(args).legacy_result_schema)
+        self.assertFalse(discovery.build_config(discovery.parse_args(["https://example.com"])).legacy_result_schema)
+
+    def test_stray_non_dict_findings_are_filtered(self) -> None:
+        record = {"hardcoded_findings": [{"category": "credential"}, "stray", None]}
+
+        self.assertEqual(discovery.resolve_sensitive_findings(record), [{"category": "credential"}])
+        aliased = discovery.legacy_result_view(record)
+        self.assertEqual(discovery.resolve_sensitive_findings(aliased), [{"category": "credential"}])
+
+    def test_legacy_schema_is_rejected_for_ndjson_output(self) -> None:
+        args = discovery.parse_args(["https://example.com", "--legacy-result-schema", "--output", "scan.ndjson"])
+
+        with self.assertRaisesRegex(ValueError, "NDJSON"):
+            discovery.validate_config(discovery.build_config(args))
+
+    def test_invalid_ndjson_scan_leaves_existing_output_untouched(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "scan.ndjson"
+            output.write_text('{"kind": "previous"}\n', encoding="utf-8")
+
+            with patch("sys.stderr"):
+                exit_code = discovery.main(["ftp://example.com", "--output", str(output)])
+
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(output.read_text(encoding="utf-8"), '{"kind": "previous"}\n')
+
+
+def _sorted_dedupe_reference(rows: list) -> list:
+    # Previous sort-then-dedupe implementation, kept to check the incremental accumulator.
+    deduped: dict = {}
+    for item in sorted(rows, key=lambda row: (str(row.get("path", "")), str(row.get("url", "")))):
+        key = discovery.candidate_identity(item.get("url") or item.get("path"))
+        normalized = dict(item, path=discovery.normalize_path(item.get("path") or item.get("url")))
+        normalized["sources"] = sorted(set(normalized.get("sources", [])))
+        existing = deduped.get(key)
+        if existing is None:
+            deduped[key] = normalized
+            continue
+        merged_sources = sorted(set(existing["sources"]).union(normalized["sources"]))
+        if discovery.probe_row_rank(normalized) > discovery.probe_row_rank(existing):
+            normalized["sources"] = merged_sources
+            deduped[key] = normalized
+        else:
+            existing["sources"] = merged_sources
+    return sorted(deduped.values(), key=lambda row: (row["path"], row["url"]))
+
+
+class ScanResultMergeTests(unittest.TestCase):
+    def _config(self) -> discovery.Config:
+        return discovery.Config(
+            url="https://example.com",
+            max_js_files=1,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("discovery-result.json"),
+            skip_probe=True,
+        )
+
+    def test_row_accumulator_matches_sorted_dedupe(self) -> None:
+        rng = random.Random(7)
+        rows = [
+            {
+                "path": rng.choice(["/a", "/b", "/a?x=1", ""]),
+                "url": rng.choice(["https://example.com/a", "https://example.com/b", "https://example.com/a?x=1"]),
+                "accessible": rng.choice([True, False, None]),
+                "status_code": rng.choice([200, 404, None]),
+                "probe_method": rng.choice(["HEAD", None]),
+                "sources": [rng.choice(["s1", "s2", "s3"])],
+                "marker": index,
+            }
+            for index in range(300)
+        ]
+        accumulator = discovery.ResultRowAccumulator()
+        for start in range(0, len(rows), 37):
+            accumulator.extend(rows[start:start + 37])
+
+        self.assertEqual(accumulator.rows(), _sorted_dedupe_reference(rows))
+        self.assertEqual(accumulator.skipped, len(rows) - len(accumulator.rows()))
+
+    def test_dynamic_blocks_are_summed_in_one_pass(self) -> None:
+        accumulator = discovery.DynamicAnalysisAccumulator()
+        accumulator.add({"success": False, "events": [{"url": "a"}], "http_request_count": 2, "spa_urls": ["/x", "/y"]})
+        accumulator.add({"success": True, "event_count": 5, "http_request_count": 3, "spa_urls": ["/y"], "actions": [{"a": 1}]})
+
+        combined = accumulator.combined(enabled=True)
+        summary = accumulator.summary_fields()
+
+        self.assertTrue(combined["success"])
+        self.assertEqual(combined["event_count"], 6)
+        self.assertEqual(combined["http_request_count"], 5)
+        self.assertEqual(combined["spa_urls"], ["/x", "/y"])
+        self.assertEqual(combined["actions"], [{"a": 1}])
+        self.assertEqual(len(combined["results"]), 2)
+        self.assertEqual(summary["dynamic_events"], 6)
+        self.assertEqual(summary["dynamic_spa_urls"], 3)
+
+    def test_merger_keeps_only_unique_rows_between_targets(self) -> None:
+        config = self._config()
+        merger = discovery.ScanResultMerger(config, config.url)
+        page = {"path": "/a", "url": "https://example.com/a", "sources": ["html:1"], "accessible": True}
+        finding = {"category": "email", "normalized_value": "sha256:1", "source_label": "js:1", "severity": "high"}
+        for index in range(3):
+            merger.add(
+                f"https://example.com/t{index}",
+                index,
+                {"final_url": f"https://example.com/t{index}", "all_pages": [dict(page, sources=[f"html:{index}"])], "hardcoded_findings": [finding]},
+            )
+
+        self.assertEqual(len(merger.pages._rows), 1)
+        self.assertEqual(len(merger.findings._findings), 1)
+        result = merger.build(discovery.RecursiveDiscoveryState(), [{"target_url": "https://example.com/bad", "depth": 1, "error": "x"}])
+        self.assertEqual(result["final_url"], "https://example.com/t0")
+        self.assertEqual(result["all_pages"][0]["sources"], ["html:0", "html:1", "html:2"])
+        self.assertEqual(result["recursive_dedupe"]["pages"], 2)
+        self.assertEqual([record["status"] for record in result["recursive_scan_records"]], ["success"] * 3 + ["error"])
+
+
+class DynamicEventStorageTests(unittest.TestCase):
+    def _config(self, **overrides) -> discovery.Config:
+        return discovery.Config(
+            url="https://example.com",
+            max_js_files=1,
+            max_depth=0,
+            timeout=1.0,
+            output=Path("discovery-result.json"),
+            skip_probe=True,
+            **overrides,
+        )
+
+    def test_dynamic_event_interns_repeated_strings_and_keeps_dict_shape(self) -> None:
+        first = discovery.DynamicEvent(url="https://example.com/a", method="".join(["G", "ET"]), resource_type="fetch", source="request")
+        second = discovery.DynamicEvent(url="https://example.com/b", method="GET", resource_type="fetch", source="request")
+        first.record_response(200, "application/json")
+        first.body_analyzed = True
+        first.body_length = 12
+
+        self.assertIs(first.method, second.method)
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertEqual(
+            first.to_dict(),
+            {
+                "url": "https://example.com/a",
+                "method": "GET",
+                "resource_type": "fetch",
+                "status_code": 200,
+                "content_type": "application/json",
+                "source": "request",
+                "body_analyzed": True,
+                "body_length": 12,
+            },
+        )
+
+    def test_store_dynamic_events_spills_to_ndjson_file(self) -> None:
+        events = [
+            discovery.DynamicEvent(url="https://example.com/api/a", method="GET", resource_type="fetch", source="request"),
+            discovery.DynamicEvent(url="https://example.com/api/b", method="POST", resource_type="xhr", source="request"),
+        ]
+        with TemporaryDirectory() as temp_dir:
+            events_path = Path(temp_dir) / "events.ndjson"
+            result = {"url": "https://example.com"}
+
+            discovery._store_dynamic_events(result, events, self._config(dynamic_events_file=events_path))
+
+            lines = [json.loads(line) for line in events_path.read_text(encoding="utf-8").splitlines()]
+
+        self.assertEqual(result["events"], [])
+        self.assertEqual(result["event_count"], 2)
+        self.assertEqual(result["events_file"], str(events_path))
+        self.assertEqual([line["url"] for line in lines], ["https://example.com/api/a", "https://example.com/api/b"])
+        self.assertEqual(lines[1]["target_url"], "https://example.com")
+
+    def test_dynamic_events_file_is_truncated_once_per_scan(self) -> None:
+        events = [discovery.DynamicEvent(url="https://example.com/api/a", method="GET", resource_type="fetch", source="request")]
+        with TemporaryDirectory() as temp_dir:
+            events_path = Path(temp_dir) / "events.ndjson"
+            events_path.write_text('{"url": "stale"}\n', encoding="utf-8")
+            config = self._config(dynamic_events_file=events_path)
+
+            first_scan = discovery.build_execution_context(config)
+            target = replace(first_scan, profiler=None)
+            discovery._store_dynamic_events({"url": "https://example.com"}, events, config, first_scan)
+            discovery._store_dynamic_events({"url": "https://example.com/child"}, events, config, target)
+            first_lines = events_path.read_text(encoding="utf-8").splitlines()
+            discovery._store_dynamic_events({"url": "https://example.com"}, events, config, discovery.build_execution_context(config))
+            second_lines = events_path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(
+            [json.loads(line)["target_url"] for line in first_lines],
+            ["https://example.com", "https://example.com/child"],
+        )
+        self.assertEqual(len(second_lines), 1)
+
+    def test_store_dynamic_events_inlines_dicts_without_side_file(self) -> None:
+        result = {"url": "https://example.com"}
+        events = [discovery.DynamicEvent(url="https://example.com/api/a", method="GET", resource_type="fetch", source="request")]
+
+        discovery._store_dynamic_events(result, events, self._config())
+
+        self.assertEqual(result["events"][0]["url"], "https://example.com/api/a")
+        self.assertEqual(result["event_count"], 1)
+
+
+class ProgressChannelTests(unittest.TestCase):
+    def test_drain_returns_buffered_messages_and_counters_once(self) -> None:
+        channel = discovery.ProgressChannel()
+        discovery.emit_progress(channel, "first")
+        discovery.emit_progress(channel, "second")
+        channel.increment("errors")
+
+        batch = channel.drain()
+
+        self.assertEqual(batch.messages, ["first", "second"])
+        self.assertEqual(batch.message_count, 2)
+        self.assertEqual(batch.counters, {"errors": 1})
+        self.assertEqual(channel.drain().messages, [])
+
+    def test_keeps_every_message_until_drained(self) -> None:
+        channel = discovery.ProgressChannel()
+        total = discovery.PROGRESS_MAX_RENDERED_MESSAGES + 5
+        for index in range(total):
+            channel(f"message {index}")
+
+        batch = channel.drain()
+
+        self.assertEqual(len(batch.messages), total)
+        self.assertEqual(batch.messages[0], "message 0")
+        self.assertEqual(batch.message_count, total)
+
+
+class StructuredProgressTests(unittest.TestCase):
+    def test_string_callbacks_receive_messages_and_skip_metric_only_events(self) -> None:
+        messages = []
+
+        discovery.emit_progress(messages.append, "JS 가져오는 중 1/5: https://example.com/a.js", phase="js", total=5)
+        discovery.emit_progress(messages.append, "", phase="js", completed=1, total=5, byte_count=120, requests=1)
+
+        self.assertEqual(messages, ["JS 가져오는 중 1/5: https://example.com/a.js"])
+        self.assertIsInstance(messages[0], str)
+
+    def test_prefixed_progress_keeps_structured_fields(self) -> None:
+        channel = discovery.ProgressChannel()
+        progress = discovery.prefix_progress(channel, "URL 1/2 ")
+
+        discovery.emit_progress(progress, "API 후보 확인 중 1/3: /api/users", phase="api_probe", completed=1, total=3, byte_count=42, requests=1)
+        discovery.emit_progress(progress, "", phase="api_probe", completed=2, total=3, requests=1, errors=1)
+        batch = channel.drain()
+
+        self.assertEqual(batch.messages, ["URL 1/2 API 후보 확인 중 1/3: /api/users"])
+        self.assertEqual(batch.counters, {"bytes": 42, "requests": 2, "errors": 1})
+        self.assertEqual(batch.phases["api_probe"].completed, 2)
+        self.assertEqual(batch.phases["api_probe"].total, 3)
+
+    def test_build_result_rows_reports_probe_completion_per_candidate(self) -> None:
+        bucket = {}
+        for path in ("/api/a", "/api/b"):
+            discovery.add_candidate(bucket, f"https://example.com{path}", "test", "api")
+        channel = discovery.ProgressChannel()
+
+        rows = discovery.build_result_rows(bucket, kind="api", timeout=1.0, skip_probe=True, progress=channel)
+        batch = channel.drain()
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(batch.phases["api_probe"].completed, 2)
+        self.assertEqual(batch.phases["api_probe"].total, 2)
+        self.assertNotIn("requests", batch.counters)
+
+
+class TableSearchIndexTests(unittest.TestCase):
+    ROWS = [
+        ("200", "GET", "/api/Users"),
+        ("404", "POST", "/api/orders"),
+        ("200", "GET", "/api/user-groups"),
+        ("500", "GET"),
+    ]
+    COLUMNS = ("status", "method", "path")
+
+    def test_indexed_filter_matches_unindexed_results_in_order(self) -> None:
+        rows = list(self.ROWS)
+        index = discovery.TableSearchIndex(rows, len(self.COLUMNS))
+
+        for column, text in ((None, "user"), ("path", "USER"), ("status", "200"), ("path", "500"), (None, "")):
+            self.assertEqual(
+                discovery.filter_table_rows(rows, self.COLUMNS, column, text, search_index=index),
+                discovery.filter_table_rows(rows, self.COLUMNS, column, text),
+            )
+        self.assertEqual(
+            discovery.filter_table_rows(rows, self.COLUMNS, None, "user", search_index=index),
+            [rows[0], rows[2]],
+        )
+
+    def test_longer_query_only_rescans_previous_matches(self) -> None:
+        rows = list(self.ROWS)
+        index = discovery.TableSearchIndex(rows, len(self.COLUMNS))
+
+        self.assertEqual(index.search(2, "/api/u"), [0, 2])
+        index._cells[2][1] = "/api/user-orders"
+        # Row 1 was not a match for the shorter query, so it stays excluded.
+        self.assertEqual(index.search(2, "/api/user"), [0, 2])
+        self.assertEqual(index.search(2, "/api/user-"), [2])
+        self.assertEqual(index.search(None, "/api/user-"), [1, 2])
+
+    def test_single_column_query_only_folds_that_column(self) -> None:
+        rows = list(self.ROWS)
+        index = discovery.TableSearchIndex(rows, len(self.COLUMNS))
+
+        self.assertEqual(index.search(1, "post"), [1])
+        self.assertEqual([cells is not None for cells in index._cells], [False, True, False])
+        index.prepare()
+        self.assertTrue(all(cells is not None for cells in index._cells))
+
+    def test_stale_index_is_ignored(self) -> None:
+        rows = list(self.ROWS)
+        stale = discovery.TableSearchIndex(rows[:1], len(self.COLUMNS))
+
+        self.assertEqual(
+            discovery.filter_table_rows(rows, self.COLUMNS, "method", "post", search_index=stale),
+            [rows[1]],
+        )
+
+
 class CliSafetyDefaultsTests(unittest.TestCase):
     def test_dynamic_actions_require_explicit_opt_in(self) -> None:
         args = discovery.parse_args(["https://example.com", "--dynamic-analysis"])
 
         self.assertFalse(args.dynamic_actions)
 
+    def test_dynamic_browser_state_paths_are_threaded_into_config(self) -> None:
+        config = discovery.build_config(
+            discovery.parse_args(
+                [
+                    "https://example.com",
+                    "--dynamic-analysis",
+                    "--dynamic-profile-dir",
+                    "browser-profile",
+                    "--dynamic-storage-state",
+                    "state.json",
+                ]
+            )
+        )
+
+        self.assertEqual(config.dynamic_profile_dir, Path("browser-profile"))
+        self.assertEqual(config.dynamic_storage_state, Path("state.json"))
+
+    def test_dynamic_storage_state_rejects_directory(self) -> None:
+        with self.assertRaises(ValueError):
+            discovery.validate_dynamic_browser_state_paths(None, Path(__file__).parent)
+
+    def test_persistent_profile_restores_cookies_and_local_storage(self) -> None:
+        class FakeContext:
+            def __init__(self) -> None:
+                self.cookies = []
+                self.scripts = []
+
+            def add_cookies(self, cookies) -> None:
+                self.cookies.extend(cookies)
+
+            def add_init_script(self, script) -> None:
+                self.scripts.append(script)
+
+        state = {
+            "cookies": [{"name": "sid", "value": "abc", "domain": "example.com", "path": "/"}],
+            "origins": [
+                {"origin": "https://example.com", "localStorage": [{"name": "token", "value": "t-1"}]},
+                {"origin": "https://empty.example.com", "localStorage": []},
+            ],
+        }
+        with TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "state.json"
+            state_path.write_text(json.dumps(state), encoding="utf-8")
+            context = FakeContext()
+
+            self.assertTrue(discovery._apply_storage_state(context, state_path))
+
+        self.assertEqual(context.cookies, state["cookies"])
+        self.assertEqual(len(context.scripts), 1)
+        self.assertIn('{"https://example.com": {"token": "t-1"}}', context.scripts[0])
+        self.assertNotIn("empty.example.com", context.scripts[0])
+
 
 if __name__ == "__main__":
     unittest.main()
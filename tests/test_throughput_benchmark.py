@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks import throughput
+
+
+class SyntheticBundleTests(unittest.TestCase):
+    def test_bundle_is_single_line_and_reaches_requested_size(self):
+        bundle = throughput.build_synthetic_bundle(50_000)
+
+        self.assertGreaterEqual(len(bundle.encode("utf-8")), 50_000)
+        self.assertNotIn("\n", bundle)
+        # Each copy gets its own API prefix so dedupe does not shrink the work.
+        self.assertIn("/api/b0/users", bundle)
+        self.assertIn("/api/b1/users", bundle)
+
+
+class ThroughputReportTests(unittest.TestCase):
+    def test_report_has_mb_per_second_for_each_target(self):
+        report = throughput.run_benchmark([0.02])
+
+        results = report["results"]["0.02MB"]
+        self.assertEqual(
+            set(results),
+            {"collect_path_candidates", "collect_hardcoded_findings", "extract_additional_js_urls"},
+        )
+        for entry in results.values():
+            self.assertGreaterEqual(entry["bytes"], 20_000)
+            self.assertGreater(entry["mb_per_s"], 0)
+        json.dumps(report)
+
+    def test_compare_flags_only_drops_beyond_tolerance(self):
+        baseline = {"results": {"1MB": {"a": {"mb_per_s": 10.0}, "b": {"mb_per_s": 10.0}}}}
+        report = {"results": {"1MB": {"a": {"mb_per_s": 8.0}, "b": {"mb_per_s": 7.0}, "c": {"mb_per_s": 1.0}}}}
+
+        regressions = throughput.compare_with_baseline(report, baseline, tolerance=0.25)
+
+        self.assertEqual([(item["target"], item["ratio"]) for item in regressions], [("b", 0.7)])
+
+    def test_main_writes_json_and_fails_on_regression(self):
+        with TemporaryDirectory() as tmp:
+            baseline = Path(tmp) / "baseline.json"
+            baseline.write_text(
+                json.dumps({"results": {"0.01MB": {"extract_additional_js_urls": {"mb_per_s": 1e9}}}}),
+                encoding="utf-8",
+            )
+            output = Path(tmp) / "report.json"
+
+            exit_code = throughput.main(["--sizes", "0.01", "--output", str(output), "--baseline", str(baseline)])
+
+            report = json.loads(output.read_text(encoding="utf-8"))
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(report["regressions"][0]["target"], "extract_additional_js_urls")
+
+    def test_stored_baseline_covers_default_sizes(self):
+        baseline = json.loads((Path(throughput.__file__).parent / "throughput_baseline.json").read_text(encoding="utf-8"))
+
+        for size in throughput.DEFAULT_SIZES_MB:
+            self.assertIn(f"{size}MB", baseline["results"])
+
+
+if __name__ == "__main__":
+    unittest.main()